@@ -0,0 +1,121 @@
+"""
+Measures the per-hit overhead of cache_decorator on a method, compared with the original
+tuple-building decorator and with functools.lru_cache.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/cache_decorator_overhead.py --hits 200000
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from src.config.logging import logger
+from functools import lru_cache
+from functools import wraps
+from typing import Callable
+from typing import Any
+import argparse
+import time
+
+
+proxy = load_example("09_proxy/example_02.py", "proxy_example_02")
+
+
+def legacy_cache_decorator(func: Callable) -> Callable:
+    """
+    The original decorator: builds and sorts a key tuple (including self) and formats two log
+    messages on every call, even when the log level discards them.
+    """
+    cache = {}
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = args + tuple(sorted(kwargs.items()))
+        logger.info("Cache decorator called with key: %s", key)
+        if key in cache:
+            logger.info("Cache hit for key: %s", key)
+            return cache[key]
+        result = func(*args, **kwargs)
+        cache[key] = result
+        return result
+
+    return wrapper
+
+
+def legacy_key_only(func: Callable) -> Callable:
+    """
+    The original key construction without the log calls, to separate key cost from logging cost.
+    """
+    cache = {}
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = args + tuple(sorted(kwargs.items()))
+        if key in cache:
+            return cache[key]
+        result = func(*args, **kwargs)
+        cache[key] = result
+        return result
+
+    return wrapper
+
+
+class Models:
+    @legacy_cache_decorator
+    def legacy(self, text: str) -> str:
+        return text
+
+    @legacy_key_only
+    def legacy_no_logging(self, text: str) -> str:
+        return text
+
+    @proxy.cache_decorator
+    def positional(self, text: str) -> str:
+        return text
+
+    @proxy.cache_decorator
+    def keyword(self, text: str, temperature: float = 0.0) -> str:
+        return text
+
+    @proxy.cache_decorator(key_func=proxy.digest_long_text(max_length=256, normalize=True))
+    def digest(self, text: str) -> str:
+        return text
+
+    @lru_cache(maxsize=None)
+    def lru(self, text: str) -> str:
+        return text
+
+    def uncached(self, text: str) -> str:
+        return text
+
+
+def per_call_ns(call: Callable[[], Any], hits: int) -> float:
+    call()  # warm the cache
+    start = time.perf_counter_ns()
+    for _ in range(hits):
+        call()
+    return (time.perf_counter_ns() - start) / hits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hits", type=int, default=200_000)
+    args = parser.parse_args()
+
+    models = Models()
+    short_prompt = "Summarize the quarterly report."
+    long_prompt = "Summarize the quarterly report. " * 40
+    cases = [
+        ("uncached method call (floor)", lambda: models.uncached(short_prompt)),
+        ("legacy decorator", lambda: models.legacy(short_prompt)),
+        ("legacy key, no logging", lambda: models.legacy_no_logging(short_prompt)),
+        ("cache_decorator, positional", lambda: models.positional(short_prompt)),
+        ("cache_decorator, keyword", lambda: models.keyword(short_prompt, temperature=0.2)),
+        ("cache_decorator, digest key (short)", lambda: models.digest(short_prompt)),
+        ("cache_decorator, digest key (long)", lambda: models.digest(long_prompt)),
+        ("functools.lru_cache", lambda: models.lru(short_prompt)),
+    ]
+
+    with quiet_logging():
+        print(f"Per-hit cost over {args.hits} hits")
+        for name, call in cases:
+            print(f"  {name:<38} {per_call_ns(call, args.hits):8.0f} ns")
@@ -0,0 +1,89 @@
+"""
+Peak memory and throughput of batch inference over a file on disk as the input grows: the
+in-memory BatchInference of 05_strategy/example_01.py, which loads the whole file and returns
+one result, versus ChunkedBatchInference reading a memory-mapped file in chunks and writing each
+result to an output file as it completes.
+
+Peak memory is the largest amount of memory allocated by Python and NumPy during the run, as
+reported by tracemalloc; pages of the memory-mapped input belong to the OS page cache and are
+not counted. The model scores every value with a few vectorized NumPy operations.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/chunked_batch_memory.py --sizes 1000000 4000000 16000000 --chunk-size 65536 --workers 2
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from typing import Callable
+from typing import Tuple
+from typing import List
+import numpy as np
+import tracemalloc
+import tempfile
+import argparse
+import time
+import os
+
+
+strategy_example = load_example("05_strategy/example_01.py", "strategy_example_01")
+
+
+class ScoringModel:
+    def predict_batch(self, data: np.ndarray) -> np.ndarray:
+        return np.tanh(np.asarray(data, dtype=np.float32) * 0.5) + 1
+
+
+def measure(run: Callable[[], None]) -> Tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20, elapsed
+
+
+def main(sizes: List[int], chunk_size: int, workers: int, processes: bool) -> None:
+    model = ScoringModel()
+    print(f"{'items':>10} {'input MiB':>10} {'strategy':>10} {'peak MiB':>9} {'M items/s':>10}")
+    with quiet_logging(), tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "input.npy")
+        output_path = os.path.join(tmp, "output.bin")
+        for size in sizes:
+            values = np.lib.format.open_memmap(input_path, mode="w+", dtype=np.float32, shape=(size,))
+            for start in range(0, size, chunk_size):
+                values[start:start + chunk_size] = np.random.default_rng(start).random(min(chunk_size, size - start))
+            values.flush()
+            del values
+
+            def in_memory() -> None:
+                result = strategy_example.BatchInference().infer(model, np.load(input_path))
+                with open(output_path, "wb") as output:
+                    output.write(result.tobytes())
+
+            def chunked() -> None:
+                with open(output_path, "wb") as output:
+                    strategy_example.ChunkedBatchInference(
+                        chunk_size=chunk_size,
+                        max_workers=workers,
+                        sink=lambda index, result: output.write(result.tobytes()),
+                        use_processes=processes,
+                    ).infer(model, np.load(input_path, mmap_mode="r"))
+
+            for name, run in (("in-memory", in_memory), ("chunked", chunked)):
+                peak, elapsed = measure(run)
+                print(f"{size:>10} {size * 4 / 2**20:>10.1f} {name:>10} {peak:>9.1f} {size / elapsed / 1e6:>10.1f}")
+
+            # The chunked output is written in input order and matches the in-memory result.
+            expected = model.predict_batch(np.load(input_path, mmap_mode="r")[:chunk_size * 3])
+            assert np.array_equal(np.fromfile(output_path, dtype=np.float32, count=len(expected)), expected)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 4_000_000, 16_000_000])
+    parser.add_argument("--chunk-size", type=int, default=65_536)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--processes", action="store_true", help="Run chunks in worker processes instead of threads.")
+    args = parser.parse_args()
+    main(args.sizes, args.chunk_size, args.workers, args.processes)
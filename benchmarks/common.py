@@ -0,0 +1,66 @@
+from src.config.logging import logger
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Iterator
+from typing import Sequence
+from pathlib import Path
+import importlib.util
+import logging
+import sys
+
+
+PATTERNS_DIR = Path(__file__).resolve().parent.parent / "src" / "patterns"
+
+
+def load_example(relative_path: str, module_name: str) -> ModuleType:
+    """
+    Imports a pattern example by file path. Pattern directories start with a digit,
+    so they cannot be imported with a regular import statement.
+
+    Args:
+        relative_path (str): Path of the example relative to src/patterns, e.g. '09_proxy/example_01.py'.
+        module_name (str): Name under which the module is registered in sys.modules.
+
+    Returns:
+        ModuleType: The imported example module.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, PATTERNS_DIR / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextmanager
+def quiet_logging(level: int = logging.WARNING) -> Iterator[None]:
+    """
+    Temporarily raises the root logger level so per-call logging does not dominate the measurements.
+
+    Args:
+        level (int): The level to apply while the block runs.
+    """
+    previous = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Returns the q-th percentile (0-100) of an already sorted sequence using the nearest-rank method.
+
+    Args:
+        sorted_values (Sequence[float]): Values sorted in ascending order.
+        q (float): The percentile to compute.
+
+    Returns:
+        float: The percentile value, or 0.0 for an empty sequence.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
@@ -0,0 +1,93 @@
+"""
+Per-item cost of a preprocessing chain as the number of stages grows: nested decorators in the
+style of 04_decorator/example_01.py (a wrapper frame and two log calls per stage, with logging
+below the enabled level) versus the compiled Pipeline of 04_decorator/example_02.py, one item at
+a time and over batches with per-item and vectorized (np.char) stages.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/decorator_pipeline_overhead.py --items 20000 --stages 1 2 5 10 20
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from src.config.logging import logger
+from typing import Callable
+from typing import List
+import numpy as np
+import argparse
+import time
+
+
+pipeline_example = load_example("04_decorator/example_02.py", "decorator_example_02")
+
+
+def suffix_stage(i: int) -> Callable[[str], str]:
+    suffix = f"|{i}"
+
+    def stage(data: str) -> str:
+        return data + suffix
+    return stage
+
+
+def nested(stages: int) -> Callable[[str], str]:
+    def decorate(func: Callable[[str], str], stage: Callable[[str], str]) -> Callable[[str], str]:
+        def wrapper(data: str) -> str:
+            logger.info("Processing data...")
+            result = stage(func(data))
+            logger.info("Data processed.")
+            return result
+        return wrapper
+
+    def check(data: str) -> str:
+        if not isinstance(data, str) or not data.strip():
+            raise ValueError("Invalid data: Input must be a non-empty string.")
+        return data
+
+    func = check
+    for i in range(stages):
+        func = decorate(func, suffix_stage(i))
+    return func
+
+
+def pipeline(stages: int, vectorized: bool) -> "pipeline_example.Pipeline":
+    result = pipeline_example.Pipeline(f"bench_{stages}")
+    result.validator(batch=pipeline_example.non_empty_strings)(pipeline_example.non_empty_string)
+    for i in range(stages):
+        stage = suffix_stage(i)
+        suffix = f"|{i}"
+        result.transform(batch=(lambda items, suffix=suffix: np.char.add(items, suffix)) if vectorized else None)(stage)
+    return result
+
+
+def per_item_ns(run: Callable[[List[str]], object], items: List[str]) -> float:
+    start = time.perf_counter_ns()
+    run(items)
+    return (time.perf_counter_ns() - start) / len(items)
+
+
+def main(items: int, stage_counts: List[int]) -> None:
+    data = [f" sample {i} " for i in range(items)]
+    array = np.array(data)
+    print(f"{'stages':>6} {'nested ns':>10} {'compiled ns':>12} {'batch ns':>10} {'vectorized ns':>14}")
+    with quiet_logging():
+        for stages in stage_counts:
+            nested_func = nested(stages)
+            compiled = pipeline(stages, vectorized=False)
+            compiled_func = compiled.compile()
+            vectorized = pipeline(stages, vectorized=True)
+            assert [compiled_func(item) for item in data[:3]] == [nested_func(item) for item in data[:3]]
+            rows = (
+                per_item_ns(lambda batch: [nested_func(item) for item in batch], data),
+                per_item_ns(lambda batch: [compiled_func(item) for item in batch], data),
+                per_item_ns(compiled.run_batch, data),
+                per_item_ns(vectorized.run_batch, array),
+            )
+            print(f"{stages:>6} {rows[0]:>10.0f} {rows[1]:>12.0f} {rows[2]:>10.0f} {rows[3]:>14.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--stages", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    args = parser.parse_args()
+    main(args.items, args.stages)
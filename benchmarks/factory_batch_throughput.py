@@ -0,0 +1,58 @@
+"""
+Compares per-text predict calls with predict_batch across batch sizes for the ModelFactory models.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/factory_batch_throughput.py --texts 200000
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from typing import Callable
+from typing import List
+import argparse
+import time
+
+
+factory = load_example("02_factory/example_01.py", "factory_example_01")
+
+
+class ThirdPartyModel(factory.BaseModel):
+    """
+    A subclass without its own predict_batch, which falls back to the default loop.
+    """
+    def predict(self, text: str) -> str:
+        return f"Third-party prediction with {self.model_name}: {text}"
+
+
+def throughput(run_batch: Callable[[List[str]], List[str]], texts: List[str], batch_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        run_batch(texts[i:i + batch_size])
+    return len(texts) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=200_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 64, 512, 4096])
+    args = parser.parse_args()
+
+    texts = [f"short text number {i}" for i in range(args.texts)]
+    with quiet_logging():
+        models = {
+            "classification": factory.ModelFactory.create_model("classification", model_name="bert_classifier"),
+            "summarization": factory.ModelFactory.create_model("summarization", model_name="gpt_summarizer"),
+            "translation": factory.ModelFactory.create_model("translation", model_name="marian_translator"),
+            "third-party (default loop)": ThirdPartyModel(model_name="custom"),
+        }
+
+        print(f"Throughput in texts/s over {args.texts} texts")
+        print(f"{'model':<28} {'batch':>6} {'predict loop':>14} {'predict_batch':>14} {'speedup':>8}")
+        for name, model in models.items():
+            def loop(batch: List[str], predict=model.predict) -> List[str]:
+                return [predict(text) for text in batch]
+
+            for batch_size in args.batch_sizes:
+                looped = throughput(loop, texts, batch_size)
+                batched = throughput(model.predict_batch, texts, batch_size)
+                print(f"{name:<28} {batch_size:>6} {looped:>14,.0f} {batched:>14,.0f} {batched / looped:>7.2f}x")
@@ -0,0 +1,62 @@
+"""
+Cold-start cost of the ModelFactory example with lazy plugin entry points versus importing every
+registered model up front, measured in fresh interpreters.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/factory_startup_time.py --runs 10
+"""
+from pathlib import Path
+from typing import Dict
+from typing import List
+import statistics
+import subprocess
+import argparse
+import json
+import sys
+import os
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import json, logging, sys, time
+start = time.perf_counter()
+from benchmarks.common import load_example
+factory = load_example("02_factory/example_01.py", "factory_example_01")
+logging.getLogger().setLevel(logging.WARNING)
+if {eager}:
+    for task_type in factory.ModelFactory.registry.task_types():
+        factory.ModelFactory.registry.resolve(task_type)
+imported = time.perf_counter()
+factory.ModelFactory.create_model("embedding")
+first_request = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "first_embedding_ms": (first_request - imported) * 1000,
+}}))
+"""
+
+
+def run(eager: bool) -> Dict[str, float]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+    # Run from a scratch directory so the example's log file does not land in the repository.
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(eager=eager)],
+        capture_output=True, text=True, check=True, env=env, cwd=os.environ.get("TMPDIR", "/tmp"),
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"Median over {args.runs} fresh interpreters")
+    print(f"{'mode':>6} {'import (ms)':>12} {'first embedding request (ms)':>30}")
+    for eager in (True, False):
+        samples: List[Dict[str, float]] = [run(eager) for _ in range(args.runs)]
+        import_ms = statistics.median(sample["import_ms"] for sample in samples)
+        first_ms = statistics.median(sample["first_embedding_ms"] for sample in samples)
+        print(f"{'eager' if eager else 'lazy':>6} {import_ms:>12.1f} {first_ms:>30.1f}")
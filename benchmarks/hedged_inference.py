@@ -0,0 +1,118 @@
+"""
+Tail latency and extra load of HedgedInference from 05_strategy/example_03.py on simulated
+backends, compared with sending every request to the primary only.
+
+Primary and secondary are independent replicas with the same latency distribution:
+- lognormal: median 10 ms, sigma 0.5.
+- bimodal: 10 ms with 2% of calls taking 200 ms (e.g. garbage collection pauses or queueing).
+- pareto: heavy tail with a 5 ms minimum and shape 1.8.
+
+Requests are served from one event loop in waves of `--concurrency` concurrent requests. Extra
+calls are the hedges sent. Extra busy time is the backend time spent beyond the primary-only run,
+where a cancelled call counts until it was cancelled.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/hedged_inference.py --requests 3000 --concurrency 30 --percentiles 90 95 99
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from benchmarks.common import percentile
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from typing import List
+from typing import Any
+import argparse
+import asyncio
+import random
+import time
+
+
+strategy_example = load_example("05_strategy/example_03.py", "strategy_example_03")
+
+DISTRIBUTIONS = {
+    "lognormal": lambda rng: 0.01 * rng.lognormvariate(0, 0.5),
+    "bimodal": lambda rng: 0.2 if rng.random() < 0.02 else 0.01,
+    "pareto": lambda rng: 0.005 * rng.paretovariate(1.8),
+}
+
+
+class SimulatedBackend:
+    def __init__(self, name: str, sample: Callable[[random.Random], float], seed: int) -> None:
+        self.name = name
+        self.sample = sample
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.busy = 0.0
+
+    async def predict_async(self, data: Any) -> str:
+        self.calls += 1
+        start = time.perf_counter()
+        try:
+            await asyncio.sleep(self.sample(self.rng))
+        finally:
+            self.busy += time.perf_counter() - start
+        return f"{self.name} prediction for {data}"
+
+
+async def serve(
+    requests: int,
+    concurrency: int,
+    primary: SimulatedBackend,
+    hedged: Optional["strategy_example.HedgedInference"],
+) -> List[float]:
+    async def timed(i: int) -> float:
+        start = time.perf_counter()
+        if hedged is None:
+            await primary.predict_async(i)
+        else:
+            await hedged.infer_async(primary, i)
+        return (time.perf_counter() - start) * 1000
+
+    latencies: List[float] = []
+    for wave in range(0, requests, concurrency):
+        latencies += await asyncio.gather(*(timed(i) for i in range(wave, min(requests, wave + concurrency))))
+    return sorted(latencies)
+
+
+def run(distribution: str, requests: int, concurrency: int, hedge_percentile: Optional[float], seed: int) -> Tuple[List[float], int, float]:
+    sample = DISTRIBUTIONS[distribution]
+    primary = SimulatedBackend("primary", sample, seed)
+    secondary = SimulatedBackend("secondary", sample, seed + 1)
+    hedged = None
+    if hedge_percentile is not None:
+        hedged = strategy_example.HedgedInference(secondary, percentile=hedge_percentile, max_hedge_ratio=0.2)
+    latencies = asyncio.run(serve(requests, concurrency, primary, hedged))
+    return latencies, secondary.calls, primary.busy + secondary.busy
+
+
+def main(requests: int, concurrency: int, percentiles: List[float], seed: int) -> None:
+    print(f"{requests} requests, {concurrency} concurrent")
+    print(
+        f"{'distribution':>12} {'hedge at':>9} {'p50 ms':>8} {'p99 ms':>8} {'p99.9 ms':>9} "
+        f"{'extra calls %':>14} {'extra busy %':>13}"
+    )
+    with quiet_logging():
+        for distribution in DISTRIBUTIONS:
+            baseline_busy = None
+            for hedge_percentile in [None, *percentiles]:
+                latencies, hedges, busy = run(distribution, requests, concurrency, hedge_percentile, seed)
+                if baseline_busy is None:
+                    baseline_busy = busy
+                label = "never" if hedge_percentile is None else f"p{hedge_percentile:g}"
+                print(
+                    f"{distribution:>12} {label:>9} {percentile(latencies, 50):>8.1f} {percentile(latencies, 99):>8.1f} "
+                    f"{percentile(latencies, 99.9):>9.1f} {hedges / requests * 100:>14.1f} "
+                    f"{(busy / baseline_busy - 1) * 100:>13.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3_000)
+    parser.add_argument("--concurrency", type=int, default=30)
+    parser.add_argument("--percentiles", type=float, nargs="+", default=[90.0, 95.0, 99.0])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    main(args.requests, args.concurrency, args.percentiles, args.seed)
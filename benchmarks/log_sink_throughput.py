@@ -0,0 +1,91 @@
+"""
+Write and read throughput of the JSON-lines log sink compared with the human-formatted text log.
+
+Records are written through an isolated logger into a scratch directory: once to a plain
+FileHandler with the repository's text format, and to JsonLinesRotatingHandler with and without
+gzip compression of rotated segments. Reading parses the text log with a regular expression
+and the structured log with read_log_records, which streams across all segments.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/log_sink_throughput.py --records 200000 --max-mb 4
+"""
+from src.config.log_sink import JsonLinesRotatingHandler
+from src.config.log_sink import read_log_records
+from src.config.log_sink import log_segments
+from typing import Iterator
+import tempfile
+import argparse
+import logging
+import time
+import re
+import os
+
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] [%(module)s] [%(pathname)s]: %(message)s"
+LINE_PATTERN = re.compile(r"^(\S+ \S+) \[(\w+)\] \[([^\]]*)\] \[([^\]]*)\]: (.*)$")
+
+
+def write(handler: logging.Handler, records: int) -> float:
+    bench_logger = logging.getLogger("benchmarks.log_sink_throughput")
+    bench_logger.propagate = False
+    bench_logger.handlers[:] = [handler]
+    bench_logger.setLevel(logging.INFO)
+    start = time.perf_counter()
+    for i in range(records):
+        if i % 100 == 0:
+            bench_logger.warning("Slow request %s for model %s: %.1f ms", i, "gpt_summarizer", 250.0)
+        else:
+            bench_logger.info("Served request %s for model %s in %.1f ms", i, "gpt_summarizer", 12.5)
+    handler.close()
+    return records / (time.perf_counter() - start)
+
+
+def read_text(path: str) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as lines:
+        for line in lines:
+            match = LINE_PATTERN.match(line.rstrip("\n"))
+            if match:
+                ts, level, module, pathname, msg = match.groups()
+                yield {"ts": ts, "level": level, "module": module, "path": pathname, "msg": msg}
+
+
+def timed(records: Iterator[dict], scanned: int) -> tuple:
+    """Returns the number of records yielded and the number of written records scanned per second."""
+    start = time.perf_counter()
+    count = sum(1 for _ in records)
+    return count, scanned / (time.perf_counter() - start)
+
+
+def main(records: int, max_mb: float) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "app.log")
+        text_handler = logging.FileHandler(text_path)
+        text_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        print(f"{'sink':>22} {'write rec/s':>12} {'files':>6} {'MiB':>8} {'read rec/s':>12} {'WARNING+ rec/s':>15}")
+        write_rate = write(text_handler, records)
+        _, read_rate = timed(read_text(text_path), records)
+        _, filtered_rate = timed((record for record in read_text(text_path) if record["level"] != "INFO"), records)
+        size = os.path.getsize(text_path) / 1024 ** 2
+        print(f"{'text (app.log)':>22} {write_rate:>12,.0f} {1:>6} {size:>8.1f} {read_rate:>12,.0f} {filtered_rate:>15,.0f}")
+
+        for compress in (False, True):
+            json_path = os.path.join(directory, f"app-{'gz' if compress else 'plain'}.jsonl")
+            handler = JsonLinesRotatingHandler(json_path, max_bytes=int(max_mb * 1024 ** 2), rotate_seconds=None, compress=compress)
+            write_rate = write(handler, records)
+            segments = log_segments(json_path)
+            count, read_rate = timed(read_log_records(json_path), records)
+            assert count == records, f"read {count} of {records} records"
+            _, filtered_rate = timed(read_log_records(json_path, level="WARNING"), records)
+            size = sum(os.path.getsize(segment) for segment in segments) / 1024 ** 2
+            name = "jsonl + gzip" if compress else "jsonl"
+            print(f"{name:>22} {write_rate:>12,.0f} {len(segments):>6} {size:>8.1f} {read_rate:>12,.0f} {filtered_rate:>15,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--max-mb", type=float, default=4.0, help="Rotation size of the structured sink in MiB.")
+    args = parser.parse_args()
+    main(args.records, args.max_mb)
@@ -0,0 +1,72 @@
+"""
+Per-request latency of LLMProxy.predict with synchronous logging versus queue-based logging
+(LOG_ASYNC=1). Every request logs four lines; each mode runs in a fresh interpreter writing
+logs/app.log in a scratch directory, with terminal output sent to /dev/null.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/logging_latency.py --requests 20000
+"""
+from pathlib import Path
+from typing import Dict
+import subprocess
+import tempfile
+import argparse
+import json
+import sys
+import os
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import json, time
+from benchmarks.common import load_example, percentile
+proxy_example = load_example("09_proxy/example_01.py", "proxy_example_01")
+proxy = proxy_example.LLMProxy(proxy_example.Model())
+samples = []
+start = time.perf_counter()
+for i in range({requests}):
+    t = time.perf_counter()
+    proxy.predict(f"prompt number {{i}}")
+    samples.append((time.perf_counter() - t) * 1e6)
+elapsed = time.perf_counter() - start
+samples.sort()
+print(json.dumps({{
+    "p50_us": percentile(samples, 50),
+    "p99_us": percentile(samples, 99),
+    "p999_us": percentile(samples, 99.9),
+    "throughput": {requests} / elapsed,
+}}))
+"""
+
+
+def run(async_logging: bool, requests: int, overflow: str) -> Dict[str, float]:
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])),
+        LOG_ASYNC="1" if async_logging else "0",
+        LOG_OVERFLOW=overflow,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(requests=requests)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True, env=env, cwd=directory,
+        )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--overflow", default="block", choices=["block", "drop_newest", "drop_oldest"])
+    args = parser.parse_args()
+
+    print(f"LLMProxy.predict latency over {args.requests} cache-miss requests (async overflow policy: {args.overflow})")
+    print(f"{'logging':>8} {'p50 (us)':>10} {'p99 (us)':>10} {'p99.9 (us)':>11} {'requests/s':>12}")
+    for async_logging in (False, True):
+        result = run(async_logging, args.requests, args.overflow)
+        print(
+            f"{'async' if async_logging else 'sync':>8} {result['p50_us']:>10.1f} {result['p99_us']:>10.1f} "
+            f"{result['p999_us']:>11.1f} {result['throughput']:>12,.0f}"
+        )
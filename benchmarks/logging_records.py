@@ -0,0 +1,85 @@
+"""
+Records per second of the logging layer on an isolated logger writing to an in-memory stream
+with the repository's log format:
+
+- disabled: calls below the logger level, with lazy %-style arguments and with an f-string;
+- records: construction of CustomLogRecord with the cached and the uncached path shortening;
+- emitted: enabled calls formatted by the handler, with lazy arguments and with an f-string.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/logging_records.py --records 200000
+"""
+from src.config.logging import CustomLogRecord
+from src.config.logging import custom_path_filter
+from typing import Callable
+import argparse
+import logging
+import time
+import io
+
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] [%(module)s] [%(pathname)s]: %(message)s"
+
+
+class UncachedLogRecord(logging.LogRecord):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pathname = custom_path_filter.__wrapped__(self.pathname)
+
+
+def make_logger() -> logging.Logger:
+    bench_logger = logging.getLogger("benchmarks.logging_records")
+    bench_logger.propagate = False
+    bench_logger.handlers.clear()
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    bench_logger.addHandler(handler)
+    return bench_logger
+
+
+def rate(records: int, body: Callable[[int], None]) -> float:
+    start = time.perf_counter()
+    body(records)
+    return records / (time.perf_counter() - start)
+
+
+def main(records: int) -> None:
+    bench_logger = make_logger()
+    stream = bench_logger.handlers[0].stream
+    model_name, accuracy = "Model A", 0.91234
+
+    def lazy(n: int) -> None:
+        for i in range(n):
+            bench_logger.info("Pushed data for %s - step %s, accuracy: %.4f", model_name, i, accuracy)
+
+    def eager(n: int) -> None:
+        for i in range(n):
+            bench_logger.info(f"Pushed data for {model_name} - step {i}, accuracy: {accuracy:.4f}")
+
+    def construct(factory: type) -> Callable[[int], None]:
+        def body(n: int) -> None:
+            for i in range(n):
+                factory("bench", logging.INFO, __file__, 42, "Pushed data for %s", (model_name,), None)
+        return body
+
+    print(f"{'scenario':>28} {'records/s':>14}")
+    bench_logger.setLevel(logging.WARNING)
+    for name, body in [("disabled, lazy args", lazy), ("disabled, f-string", eager)]:
+        print(f"{name:>28} {rate(records, body):>14,.0f}")
+
+    for name, factory in [("record, cached path", CustomLogRecord), ("record, uncached path", UncachedLogRecord)]:
+        print(f"{name:>28} {rate(records, construct(factory)):>14,.0f}")
+
+    bench_logger.setLevel(logging.INFO)
+    for name, body in [("emitted, lazy args", lazy), ("emitted, f-string", eager)]:
+        print(f"{name:>28} {rate(records, body):>14,.0f}")
+        stream.seek(0)
+        stream.truncate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+    main(args.records)
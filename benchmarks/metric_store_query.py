@@ -0,0 +1,68 @@
+"""
+Append throughput, range-query latency and downsampling latency of the columnar metric store
+used by ModelMonitor, on a synthetic history of one point per millisecond.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/metric_store_query.py --points 20000000
+"""
+from benchmarks.common import percentile
+from src.metrics.timeseries import ColumnarMetricStore
+from typing import Callable
+from typing import List
+import numpy as np
+import tempfile
+import argparse
+import random
+import time
+
+
+def latencies_ms(fn: Callable[[], object], runs: int) -> List[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=20_000_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        store = ColumnarMetricStore(directory, "model")
+        start = time.perf_counter()
+        for offset in range(0, args.points, args.batch_size):
+            n = min(args.batch_size, args.points - offset)
+            timestamps = (offset + np.arange(n)) / 1000.0
+            store.append(timestamps, rng.random(n, dtype=np.float32), rng.random(n, dtype=np.float32))
+        store.flush()
+        append_rate = args.points / (time.perf_counter() - start)
+        duration = args.points / 1000.0
+
+        def one_minute() -> None:
+            t = random.uniform(0, duration - 60)
+            store.range(t, t + 60)["accuracy"].mean()
+
+        def whole_history() -> None:
+            store.downsample(buckets=1000)
+
+        def one_hour() -> None:
+            t = random.uniform(0, max(0.0, duration - 3600))
+            store.downsample(t, t + 3600, buckets=1000)
+
+        print(f"{args.points:,} points ({args.points * 16 / 1024 ** 2:,.0f} MiB on disk), appended at {append_rate:,.0f} points/s")
+        print(f"{'query':<36} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+        for name, fn in [
+            ("range: 1 minute, mean accuracy", one_minute),
+            ("downsample: 1 hour to 1000 buckets", one_hour),
+            ("downsample: everything to 1000", whole_history),
+        ]:
+            samples = latencies_ms(fn, args.runs if fn is not whole_history else max(3, args.runs // 10))
+            print(f"{name:<36} {percentile(samples, 50):>10.2f} {percentile(samples, 99):>10.2f}")
+        store.close()
@@ -0,0 +1,114 @@
+"""
+Latency percentiles and throughput of MicroBatcher against direct per-request predict calls,
+under an open-loop (Poisson arrivals) synthetic load.
+
+The simulated model runs on one device: calls are serialized and each call costs a fixed launch
+overhead plus a small per-item cost, which is what makes batching pay off.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/micro_batching_latency.py --rate 2000 --duration 3
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from benchmarks.common import percentile
+from src.serving.batching import MicroBatcher
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Sequence
+from typing import List
+from typing import Any
+import threading
+import argparse
+import random
+import time
+
+
+factory = load_example("02_factory/example_01.py", "factory_example_01")
+
+
+class SimulatedDeviceModel(factory.TextClassificationModel):
+    """
+    Classification model whose calls are serialized on a single simulated accelerator.
+    """
+    def __init__(self, call_overhead_ms: float, per_item_ms: float, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.call_overhead = call_overhead_ms / 1000
+        self.per_item = per_item_ms / 1000
+        self._device = threading.Lock()
+
+    def _run(self, items: int) -> None:
+        with self._device:
+            time.sleep(self.call_overhead + items * self.per_item)
+
+    def predict(self, text: str) -> str:
+        self._run(1)
+        return super().predict(text)
+
+    def predict_batch(self, texts: Sequence[str]) -> List[str]:
+        self._run(len(texts))
+        return super().predict_batch(texts)
+
+
+def generate_load(call: Callable[[str], Any], rate: float, duration: float, clients: int) -> List[float]:
+    """
+    Issues requests at Poisson-distributed arrival times and returns each request's latency in ms,
+    measured from its scheduled arrival so that queueing delay is included.
+    """
+    rng = random.Random(0)
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def request(i: int, scheduled: float) -> None:
+        call(f"request {i}")
+        latency = (time.perf_counter() - scheduled) * 1000
+        with lock:
+            latencies.append(latency)
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        start = time.perf_counter()
+        scheduled, i = start, 0
+        while scheduled - start < duration:
+            scheduled += rng.expovariate(rate)
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(request, i, scheduled)
+            i += 1
+    return sorted(latencies)
+
+
+def report(name: str, latencies: List[float], elapsed: float) -> None:
+    print(
+        f"{name:<28} {len(latencies) / elapsed:>9,.0f} {percentile(latencies, 50):>8.2f} "
+        f"{percentile(latencies, 95):>8.2f} {percentile(latencies, 99):>8.2f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=2000, help="Offered load in requests per second.")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds of load per run.")
+    parser.add_argument("--clients", type=int, default=256, help="Maximum concurrent in-flight requests.")
+    parser.add_argument("--call-overhead-ms", type=float, default=2.0)
+    parser.add_argument("--per-item-ms", type=float, default=0.02)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with quiet_logging():
+        model = SimulatedDeviceModel(args.call_overhead_ms, args.per_item_ms, model_name="bert_classifier")
+        print(f"Offered load {args.rate:.0f} req/s for {args.duration:.0f} s; model call {args.call_overhead_ms} ms + {args.per_item_ms} ms/item")
+        print(f"{'mode':<28} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+
+        start = time.perf_counter()
+        latencies = generate_load(model.predict, args.rate, args.duration, args.clients)
+        report("direct predict", latencies, time.perf_counter() - start)
+
+        for batch_size in args.batch_sizes:
+            with MicroBatcher(model, max_batch_size=batch_size, max_wait_ms=args.max_wait_ms) as batcher:
+                start = time.perf_counter()
+                latencies = generate_load(batcher.predict, args.rate, args.duration, args.clients)
+                elapsed = time.perf_counter() - start
+            report(f"micro-batch {batch_size:>4} / {args.max_wait_ms:g} ms", latencies, elapsed)
+            print(f"{'':<28} mean batch size {batcher.stats.mean_batch_size:.1f}")
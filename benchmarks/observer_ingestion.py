@@ -0,0 +1,61 @@
+"""
+Metric ingestion throughput of ModelMonitor: per-event notify, batched notify_many, and submit
+with background draining (producer-side cost and end-to-end time until flush returns).
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/observer_ingestion.py --events 200000 --batch-size 256
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+import argparse
+import random
+import time
+
+
+observer = load_example("03_observer/example_01.py", "observer_example_01")
+
+
+def make_monitor() -> 'observer.ModelMonitor':
+    monitor = observer.ModelMonitor()
+    monitor.attach("model", observer.ModelPerformanceObserver("model"))
+    return monitor
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    accuracy = [random.uniform(0.7, 1.0) for _ in range(args.events)]
+    loss = [random.uniform(0.0, 1.0) for _ in range(args.events)]
+
+    with quiet_logging():
+        monitor = make_monitor()
+        start = time.perf_counter()
+        for a, l in zip(accuracy, loss):
+            monitor.notify("model", a, l)
+        notify_rate = args.events / (time.perf_counter() - start)
+
+        monitor = make_monitor()
+        start = time.perf_counter()
+        for i in range(0, args.events, args.batch_size):
+            monitor.notify_many("model", accuracy[i:i + args.batch_size], loss[i:i + args.batch_size])
+        many_rate = args.events / (time.perf_counter() - start)
+
+        with make_monitor() as monitor:
+            start = time.perf_counter()
+            for a, l in zip(accuracy, loss):
+                monitor.submit("model", a, l)
+            submitted = time.perf_counter()
+            monitor.flush()
+            drained = time.perf_counter()
+        submit_rate = args.events / (submitted - start)
+        drained_rate = args.events / (drained - start)
+
+    print(f"Ingestion throughput over {args.events} events (events/s)")
+    print(f"{'notify (per event)':<34} {notify_rate:>12,.0f}")
+    print(f"{f'notify_many (batches of {args.batch_size})':<34} {many_rate:>12,.0f}")
+    print(f"{'submit (producer side)':<34} {submit_rate:>12,.0f}")
+    print(f"{'submit (until flush returns)':<34} {drained_rate:>12,.0f}")
@@ -0,0 +1,80 @@
+"""
+Throughput of a CPU-bound model served in-process by a thread pool versus by ProcessPoolModel
+with an increasing number of worker processes.
+
+Threads share one GIL, so their throughput stays flat; worker processes should scale with the
+number of available cores (up to the core count of the machine).
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/process_pool_scaling.py --texts 20000 --workers 1 2 4 8
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
+from typing import Callable
+from typing import List
+import argparse
+import time
+import os
+
+
+factory = load_example("02_factory/example_01.py", "factory_example_01")
+
+
+class CPUBoundClassifier(factory.TextClassificationModel):
+    """
+    Classifier whose prediction is pure-Python work that holds the GIL.
+    """
+    work: int = 2000
+
+    def predict(self, text: str) -> str:
+        score = 0
+        for i in range(self.work):
+            score = (score * 31 + i + len(text)) % 1_000_003
+        return f"{text}: class {score % 10}"
+
+    def predict_batch(self, texts: Sequence[str]) -> List[str]:
+        return [self.predict(text) for text in texts]
+
+
+def throughput(run_batch: Callable[[List[str]], List[str]], texts: List[str], batch_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        run_batch(texts[i:i + batch_size])
+    return len(texts) / (time.perf_counter() - start)
+
+
+def threaded(model: factory.BaseModel, threads: int) -> Callable[[List[str]], List[str]]:
+    executor = ThreadPoolExecutor(max_workers=threads)
+
+    def run_batch(texts: List[str]) -> List[str]:
+        size = -(-len(texts) // threads)
+        futures = [executor.submit(model.predict_batch, texts[i:i + size]) for i in range(0, len(texts), size)]
+        return [result for future in futures for result in future.result()]
+
+    return run_batch
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    texts = [f"short text number {i}" for i in range(args.texts)]
+    print(f"{os.cpu_count()} CPUs; throughput in texts/s over {args.texts} texts, batch size {args.batch_size}")
+    print(f"{'workers':>8} {'threads':>12} {'processes':>12} {'speedup':>8}")
+    with quiet_logging():
+        local = CPUBoundClassifier(model_name="cpu_bound")
+        baseline = throughput(local.predict_batch, texts, args.batch_size)
+        for workers in args.workers:
+            thread_rate = throughput(threaded(local, workers), texts, args.batch_size)
+            model = factory.ProcessPoolModel(CPUBoundClassifier, num_workers=workers, model_name="cpu_bound")
+            try:
+                process_rate = throughput(model.predict_batch, texts, args.batch_size)
+            finally:
+                model.close()
+            print(f"{workers:>8} {thread_rate:>12,.0f} {process_rate:>12,.0f} {process_rate / baseline:>7.2f}x")
@@ -0,0 +1,81 @@
+"""
+Compares LLMProxy (thread pool) with AsyncLLMProxy (asyncio) at 1k concurrent requests.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/proxy_async_throughput.py --requests 1000 --unique 250 --latency-ms 20
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import argparse
+import asyncio
+import random
+import time
+
+
+proxy = load_example("09_proxy/example_01.py", "proxy_example_01")
+
+
+class SleepingModel:
+    """
+    Synchronous model whose latency is dominated by waiting on a remote service.
+    """
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def predict(self, text: str) -> str:
+        time.sleep(self.latency)
+        return f"Prediction for {text}"
+
+
+class AsyncSleepingModel:
+    """
+    Coroutine model with the same simulated latency.
+    """
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def predict(self, text: str) -> str:
+        await asyncio.sleep(self.latency)
+        return f"Prediction for {text}"
+
+
+def run_sync(prompts: List[str], latency: float, workers: int) -> float:
+    llm_proxy = proxy.LLMProxy(SleepingModel(latency))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(llm_proxy.predict, prompts))
+    return time.perf_counter() - start
+
+
+def run_async(prompts: List[str], latency: float) -> float:
+    async def main() -> float:
+        llm_proxy = proxy.AsyncLLMProxy(AsyncSleepingModel(latency))
+        start = time.perf_counter()
+        await asyncio.gather(*(llm_proxy.predict(prompt) for prompt in prompts))
+        return time.perf_counter() - start
+
+    return asyncio.run(main())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--unique", type=int, default=250, help="Number of distinct prompts among the requests.")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[16, 64, 256])
+    args = parser.parse_args()
+
+    random.seed(0)
+    prompts = [f"prompt {random.randrange(args.unique)}" for _ in range(args.requests)]
+    latency = args.latency_ms / 1000
+
+    with quiet_logging():
+        print(f"{args.requests} concurrent requests, {args.unique} distinct prompts, {args.latency_ms:.0f} ms model latency")
+        for workers in args.workers:
+            elapsed = run_sync(prompts, latency, workers)
+            print(f"  sync  LLMProxy, {workers:>4} threads: {elapsed:7.3f} s  {args.requests / elapsed:9.0f} req/s")
+        elapsed = run_async(prompts, latency)
+        print(f"  async AsyncLLMProxy          : {elapsed:7.3f} s  {args.requests / elapsed:9.0f} req/s")
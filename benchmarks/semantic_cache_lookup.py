@@ -0,0 +1,75 @@
+"""
+Measures SemanticCache lookup latency and paraphrase recall as the number of entries grows.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/semantic_cache_lookup.py --entries 100000 --queries 2000
+"""
+from benchmarks.common import percentile
+from src.cache.semantic import SemanticCache
+from typing import List
+from typing import Tuple
+import argparse
+import random
+import time
+
+
+VOCABULARY = [
+    "summarize", "translate", "classify", "explain", "list", "compare", "describe", "write", "review", "rank",
+    "report", "article", "email", "contract", "invoice", "paper", "ticket", "review", "policy", "dataset",
+    "quarterly", "french", "german", "legal", "medical", "financial", "customer", "product", "security", "model",
+    "sales", "churn", "revenue", "latency", "accuracy", "pipeline", "incident", "release", "budget", "roadmap",
+]
+
+
+def make_prompt(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(VOCABULARY) + str(rng.randrange(500)) for _ in range(words))
+
+
+def paraphrase(rng: random.Random, prompt: str) -> str:
+    """
+    Changes casing, punctuation and one word, which keeps the prompt semantically the same for the cache.
+    """
+    words = prompt.split()
+    words[rng.randrange(len(words))] = "please"
+    return " ".join(words).upper() + "?"
+
+
+def measure(cache: SemanticCache, queries: List[Tuple[str, int]]) -> Tuple[List[float], float]:
+    latencies, found = [], 0
+    for text, expected in queries:
+        start = time.perf_counter()
+        value = cache.get(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found += value == expected
+    latencies.sort()
+    return latencies, found / len(queries)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--tables", type=int, default=32, help="Number of LSH hash tables.")
+    parser.add_argument("--bits", type=int, default=16, help="Hyperplanes per LSH table.")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    prompts = [make_prompt(rng) for _ in range(args.entries)]
+    picked = rng.sample(range(args.entries), args.queries)
+    queries = [(paraphrase(rng, prompts[i]), i) for i in picked]
+
+    indexed = SemanticCache(threshold=args.threshold, capacity=args.entries, n_tables=args.tables, n_bits=args.bits)
+    exhaustive = SemanticCache(threshold=args.threshold, capacity=args.entries, exact_search_below=args.entries + 1)
+    start = time.perf_counter()
+    for i, prompt in enumerate(prompts):
+        indexed.put(prompt, i)
+    print(f"Inserted {args.entries} entries in {time.perf_counter() - start:.1f} s")
+    for i, prompt in enumerate(prompts):
+        exhaustive.put(prompt, i)
+
+    print(f"{'search':<12} {'p50 ms':>8} {'p99 ms':>8} {'recall':>8}")
+    for name, cache in [("exhaustive", exhaustive), ("lsh", indexed)]:
+        latencies, recall = measure(cache, queries)
+        print(f"{name:<12} {percentile(latencies, 50):8.3f} {percentile(latencies, 99):8.3f} {recall:8.1%}")
@@ -0,0 +1,105 @@
+"""
+Simulated request latencies of the static strategy rule versus the learned cost model of
+05_strategy/example_02.py.
+
+Payload sizes are log-normal and network latencies mix a fast and a slow network. In the
+simulated backend, batch inference pays one round trip plus per-item work and has a heavy tail
+on very large batches. Stream inference pays a fraction of a round trip for every 64-item
+chunk. Both selectors see the same requests; the cost model learns from the latencies it
+observes. The oracle always picks the strategy with the lower true mean latency.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/strategy_selection.py --requests 50000
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from benchmarks.common import percentile
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from typing import List
+import argparse
+import random
+import math
+
+
+strategy_example = load_example("05_strategy/example_02.py", "strategy_example_02")
+
+
+def mean_latency(strategy: str, size: int, network_latency: float) -> float:
+    rtt = network_latency / 1000
+    if strategy == "batch":
+        return (rtt + 0.002 + size * 0.00004) * (1.3 if size > 2000 else 1.0)
+    return math.ceil(size / 64) * 0.3 * rtt + size * 0.00006
+
+
+def sample_latency(rng: random.Random, strategy: str, size: int, network_latency: float) -> float:
+    rtt = network_latency / 1000
+    if strategy == "batch":
+        latency = rtt + 0.002 + size * 0.00004
+        # Very large batches occasionally queue behind each other on the server.
+        if size > 2000 and rng.random() < 0.1:
+            latency *= 4
+    else:
+        latency = math.ceil(size / 64) * 0.3 * rtt + size * 0.00006
+    return latency * rng.lognormvariate(0, 0.1)
+
+
+def workload(rng: random.Random, requests: int) -> List[Tuple[int, float]]:
+    result = []
+    for _ in range(requests):
+        size = max(1, min(20_000, int(rng.lognormvariate(math.log(200), 1.5))))
+        network_latency = rng.uniform(10, 90) if rng.random() < 0.7 else rng.uniform(100, 300)
+        result.append((size, network_latency))
+    return result
+
+
+def simulate(
+    requests: List[Tuple[int, float]],
+    select: Callable[[int, float], str],
+    seed: int,
+    learn: Optional[Callable[[str, int, float, float], None]] = None,
+) -> Tuple[List[float], float]:
+    rng = random.Random(seed)
+    latencies = []
+    batch = 0
+    for size, network_latency in requests:
+        strategy = select(size, network_latency)
+        batch += strategy == "batch"
+        latency = sample_latency(rng, strategy, size, network_latency)
+        if learn is not None:
+            learn(strategy, size, network_latency, latency)
+        latencies.append(latency * 1000)
+    return sorted(latencies), batch / len(requests)
+
+
+def main(requests: int, seed: int) -> None:
+    load = workload(random.Random(seed), requests)
+    context = strategy_example.InferenceContext(strategy_example.StrategyCostModel(seed=seed))
+
+    def learned(size: int, network_latency: float) -> str:
+        return context.select_strategy(range(size), network_latency)
+
+    selectors = [
+        ("static rule", lambda size, network_latency: strategy_example.static_rule(range(size), network_latency), None),
+        ("cost model", learned, context.cost_model.observe),
+        ("oracle", lambda size, network_latency: min(("batch", "stream"), key=lambda s: mean_latency(s, size, network_latency)), None),
+    ]
+    print(f"Simulated {requests} requests")
+    print(f"{'selector':>12} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'p99.9 ms':>9} {'batch %':>8}")
+    with quiet_logging():
+        for name, select, learn in selectors:
+            latencies, batch_share = simulate(load, select, seed + 1, learn)
+            print(
+                f"{name:>12} {sum(latencies) / len(latencies):>9.1f} {percentile(latencies, 50):>9.1f} "
+                f"{percentile(latencies, 99):>9.1f} {percentile(latencies, 99.9):>9.1f} {batch_share * 100:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    main(args.requests, args.seed)
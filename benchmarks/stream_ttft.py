@@ -0,0 +1,101 @@
+"""
+Time to first result and total time of BatchInference versus the generator-based
+StreamInference of 05_strategy/example_01.py, for a model that takes a fixed time per token.
+
+Streams are consumed synchronously, asynchronously through the model's native async generator,
+and asynchronously through the executor fallback used for models without one. The last row
+cancels each stream after its first five tokens.
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/stream_ttft.py --requests 20 --tokens 60 --token-ms 1
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from benchmarks.common import percentile
+from typing import Callable
+from typing import Iterator
+from typing import Tuple
+from typing import List
+from typing import Any
+import argparse
+import asyncio
+import time
+
+
+strategy_example = load_example("05_strategy/example_01.py", "strategy_example_01")
+
+
+class SyncOnlyModel:
+    """Exposes only the synchronous generator, so async iteration uses the executor fallback."""
+
+    def __init__(self, model: Any) -> None:
+        self.model = model
+
+    def predict_stream(self, data: Any) -> Iterator[str]:
+        return self.model.predict_stream(data)
+
+
+def batch_request(context: Any, model: Any, data: str) -> Tuple[float, float]:
+    start = time.perf_counter()
+    context.execute_inference(model, data)
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+def stream_request(context: Any, model: Any, data: str, limit: int = 0) -> Tuple[float, float]:
+    start = time.perf_counter()
+    first = None
+    with context.execute_inference(model, data) as stream:
+        for i, _ in enumerate(stream, 1):
+            if first is None:
+                first = time.perf_counter() - start
+            if limit and i >= limit:
+                break
+    return first, time.perf_counter() - start
+
+
+def async_request(context: Any, model: Any, data: str) -> Tuple[float, float]:
+    async def consume() -> Tuple[float, float]:
+        start = time.perf_counter()
+        first = None
+        async with context.execute_inference(model, data) as stream:
+            async for _ in stream:
+                if first is None:
+                    first = time.perf_counter() - start
+        return first, time.perf_counter() - start
+    return asyncio.run(consume())
+
+
+def measure(requests: int, run: Callable[[], Tuple[float, float]]) -> Tuple[List[float], List[float]]:
+    samples = [run() for _ in range(requests)]
+    return sorted(first * 1000 for first, _ in samples), sorted(total * 1000 for _, total in samples)
+
+
+def main(requests: int, tokens: int, token_ms: float) -> None:
+    model = strategy_example.Model(token_delay=token_ms / 1000)
+    data = " ".join(f"word{i}" for i in range(tokens - 3))
+    batch_context = strategy_example.InferenceContext(strategy_example.BatchInference())
+    stream_context = strategy_example.InferenceContext(strategy_example.StreamInference())
+    runs = [
+        ("batch", lambda: batch_request(batch_context, model, data)),
+        ("stream", lambda: stream_request(stream_context, model, data)),
+        ("stream, async", lambda: async_request(stream_context, model, data)),
+        ("stream, async executor", lambda: async_request(stream_context, SyncOnlyModel(model), data)),
+        ("stream, cancel after 5", lambda: stream_request(stream_context, model, data, limit=5)),
+    ]
+    print(f"{requests} requests of {tokens} tokens at {token_ms} ms per token")
+    print(f"{'strategy':>24} {'p50 first ms':>13} {'p99 first ms':>13} {'p50 total ms':>13}")
+    with quiet_logging():
+        for name, run in runs:
+            first, total = measure(requests, run)
+            print(f"{name:>24} {percentile(first, 50):>13.2f} {percentile(first, 99):>13.2f} {percentile(total, 50):>13.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--tokens", type=int, default=60)
+    parser.add_argument("--token-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    main(args.requests, args.tokens, args.token_ms)
@@ -0,0 +1,105 @@
+"""
+Overhead of the tracing layer, and a sample trace of requests flowing through the strategy,
+proxy, adapter and mediator examples.
+
+The microbenchmark compares a trivial traced method and function with undecorated ones, with
+tracing disabled and enabled. The end-to-end run sends requests through
+InferenceContext -> LLMProxy -> LLMAdapter and through the mediator Workflow, then prints the
+per-component latency histograms and writes a Chrome trace (open it in chrome://tracing or
+https://ui.perfetto.dev).
+
+Usage:
+    $ export PYTHONPATH=$PYTHONPATH:.
+    $ python benchmarks/tracing_overhead.py --calls 500000 --requests 2000 --trace-file traces/requests.json
+"""
+from benchmarks.common import load_example
+from benchmarks.common import quiet_logging
+from src.config import tracing
+from typing import Callable
+from typing import List
+from typing import Any
+import argparse
+import time
+
+
+def per_call_ns(func: Callable[[int], int], calls: int) -> float:
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def identity(x: int) -> int:
+    return x
+
+
+class Plain:
+    def call(self, x: int) -> int:
+        return x
+
+
+class Traced:
+    @tracing.traced("bench")
+    def call(self, x: int) -> int:
+        return x
+
+
+def microbenchmark(calls: int) -> None:
+    traced_identity = tracing.traced("bench")(identity)
+    rows = []
+    for enabled in (False, True):
+        tracing.enable(enabled)
+        state = "enabled" if enabled else "disabled"
+        rows.append((f"method, {state}", per_call_ns(Traced().call, calls), per_call_ns(Plain().call, calls)))
+        rows.append((f"function, {state}", per_call_ns(traced_identity, calls), per_call_ns(identity, calls)))
+    tracing.enable(False)
+    tracing.tracer.reset()
+
+    print(f"{'traced':>22} {'ns/call':>10} {'overhead ns':>12}")
+    for label, traced_ns, baseline_ns in rows:
+        print(f"{label:>22} {traced_ns:>10.0f} {traced_ns - baseline_ns:>12.0f}")
+
+
+def end_to_end(requests: int, trace_file: str) -> None:
+    with quiet_logging():
+        strategy = load_example("05_strategy/example_01.py", "strategy_example_01")
+        adapter = load_example("06_adapter/example_01.py", "adapter_example_01")
+        proxy = load_example("09_proxy/example_01.py", "proxy_example_01")
+        mediator = load_example("10_mediator/example_01.py", "mediator_example_01")
+
+        llm_proxy = proxy.LLMProxy(adapter.LLMAdapter(adapter.CohereLLM()))
+
+        class ProxiedModel:
+            def predict_batch(self, data: List[str]) -> List[Any]:
+                return [llm_proxy.predict(text) for text in data]
+
+        context = strategy.InferenceContext(strategy.BatchInference())
+        data_agent = mediator.DataAgent()
+        mediator.Workflow(data_agent, mediator.InferenceAgent(), mediator.EvaluationAgent())
+
+        tracing.tracer.reset()
+        tracing.enable(True)
+        for i in range(requests):
+            # Half of the prompts repeat, so the proxy serves some of them from its cache.
+            context.execute_inference(ProxiedModel(), [f"prompt {i}", f"prompt {i // 2}"])
+            data_agent.process()
+        tracing.enable(False)
+
+    print(f"\n{'component':>10} {'count':>8} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'p99.9 ms':>9} {'max ms':>9}")
+    for component, summary in tracing.latency_summary().items():
+        print(
+            f"{component:>10} {summary['count']:>8.0f} {summary['mean_ms']:>9.4f} {summary['p50_ms']:>9.4f} "
+            f"{summary['p99_ms']:>9.4f} {summary['p99.9_ms']:>9.4f} {summary['max_ms']:>9.4f}"
+        )
+    exported = tracing.export_chrome_trace(trace_file)
+    print(f"\nWrote {exported} spans to {trace_file}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--trace-file", default="traces/requests.json")
+    args = parser.parse_args()
+    microbenchmark(args.calls)
+    end_to_end(args.requests, args.trace_file)
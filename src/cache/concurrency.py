@@ -0,0 +1,293 @@
+from src.cache.store import BoundedCache
+from src.cache.store import CacheStats
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+from typing import Hashable
+from typing import TypeVar
+from typing import Dict
+from typing import List
+from typing import Any
+import threading
+import asyncio
+import time
+import sys
+
+
+T = TypeVar("T")
+
+
+def _share(total: int, parts: int, index: int) -> int:
+    # Splits total into parts that differ by at most one and sum to total.
+    return total // parts + (index < total % parts)
+
+
+class ShardedCache:
+    """
+    Thread-safe cache split into independently locked BoundedCache shards.
+
+    A key always maps to the same shard, so threads working on different keys rarely contend
+    for the same lock. The entry and byte bounds are divided between the shards so that the
+    per-shard bounds add up exactly to the configured totals.
+    """
+
+    def __init__(
+        self,
+        num_shards: int = 16,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        policy: str = "lru",
+        size_of: Callable[[Any], int] = sys.getsizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the shards.
+
+        Args:
+            num_shards (int): Number of shards; rounded up to a power of two, then halved while
+                there would be fewer entries or bytes than shards.
+            max_entries (int): Maximum number of entries across all shards.
+            max_bytes (Optional[int]): Maximum total size of the cached values across all shards.
+            ttl (Optional[float]): Default time-to-live in seconds.
+            policy (str): Eviction policy name used by every shard.
+            size_of (Callable[[Any], int]): Function estimating the size of a value in bytes.
+            clock (Callable[[], float]): Monotonic clock used for expiry.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        shards = 1
+        while shards < num_shards:
+            shards <<= 1
+        # Every shard needs at least one entry and one byte, so small limits get fewer shards.
+        while shards > 1 and (shards > max_entries or (max_bytes is not None and shards > max_bytes)):
+            shards >>= 1
+        self._mask = shards - 1
+        self._shards: List[BoundedCache] = [
+            BoundedCache(
+                max_entries=_share(max_entries, shards, i),
+                max_bytes=_share(max_bytes, shards, i) if max_bytes is not None else None,
+                ttl=ttl,
+                policy=policy,
+                size_of=size_of,
+                clock=clock,
+            )
+            for i in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _index(self, key: Hashable) -> int:
+        return hash(key) & self._mask
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, key: Hashable) -> bool:
+        index = self._index(key)
+        with self._locks[index]:
+            return key in self._shards[index]
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Returns the statistics summed over all shards.
+        """
+        total = CacheStats()
+        for shard in self._shards:
+            total.hits += shard.stats.hits
+            total.misses += shard.stats.misses
+            total.evictions += shard.stats.evictions
+            total.expirations += shard.stats.expirations
+        return total
+
+    @property
+    def total_bytes(self) -> int:
+        """
+        Returns the approximate size of all cached values.
+        """
+        return sum(shard.total_bytes for shard in self._shards)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key, or the default when it is missing or expired.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): Value returned on a miss.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        index = self._index(key)
+        with self._locks[index]:
+            return self._shards[index].get(key, default)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key without updating statistics or the eviction order.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): Value returned when the key is missing or expired.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        index = self._index(key)
+        with self._locks[index]:
+            return self._shards[index].peek(key, default)
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value in the shard owning the key.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            ttl (Optional[float]): Time-to-live for this entry; defaults to the cache-wide ttl.
+        """
+        index = self._index(key)
+        with self._locks[index]:
+            self._shards[index].put(key, value, ttl)
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Removes a key from the cache.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            bool: True if the key was present.
+        """
+        index = self._index(key)
+        with self._locks[index]:
+            return self._shards[index].delete(key)
+
+    def purge_expired(self) -> int:
+        """
+        Removes every expired entry, one shard at a time.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        removed = 0
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                removed += shard.purge_expired()
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes every entry while keeping the statistics.
+        """
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into a single execution.
+
+    The first caller for a key (the leader) runs the function; callers arriving while it is in
+    flight wait for it and receive the same result or exception.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the registry of in-flight calls.
+        """
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Runs fn for the key unless an identical call is already in flight.
+
+        Args:
+            key (Hashable): Identifies calls that may share a result.
+            fn (Callable[[], T]): The function to execute.
+
+        Returns:
+            T: The result of the (possibly shared) execution.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+            else:
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent awaits for the same key into a single task on the running event loop.
+
+    Every caller awaits the same shielded task, so cancelling one waiter does not cancel the
+    shared work for the others.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the registry of in-flight tasks.
+        """
+        self._tasks: Dict[Hashable, 'asyncio.Future[Any]'] = {}
+        self.executions = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Awaits fn for the key unless an identical call is already in flight.
+
+        Args:
+            key (Hashable): Identifies calls that may share a result.
+            fn (Callable[[], Awaitable[T]]): Factory returning the awaitable to run.
+
+        Returns:
+            T: The result of the (possibly shared) execution.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: 'asyncio.Future[Any]') -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
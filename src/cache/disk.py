@@ -0,0 +1,186 @@
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from typing import Dict
+from typing import Any
+import zlib
+import mmap
+import time
+import os
+import struct
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl; writers are then only safe within one process
+    fcntl = None
+
+
+class MmapStore:
+    """
+    Append-only, memory-mapped key/value store used as a persistent cache tier.
+
+    Each record is written as a fixed header (key length, value length, CRC32, expiry) followed by
+    the key and value bytes. The newest record for a key wins. Opening a store only scans the record
+    headers to rebuild an in-memory hash index from key to value offset; values stay in the mapped file
+    and are read through the OS page cache, so several processes on one host share a single copy.
+    Appends are serialized across processes with an exclusive file lock.
+    """
+
+    MAGIC = b"PDPMMAP1"
+    _HEADER = struct.Struct("<IIId")
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens (or creates) the store and indexes the records already on disk.
+
+        Args:
+            path (str): Location of the store file. Parent directories are created as needed.
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._map: Optional[mmap.mmap] = None
+        self._index: Dict[bytes, Tuple[int, int, int, int, float]] = {}
+        self._scanned = len(self.MAGIC)
+        self._with_lock(self._recover)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _with_lock(self, action: Callable[[], Any]) -> Any:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            return action()
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _recover(self) -> None:
+        # Runs under the lock, so no other process is halfway through an append: a short tail can
+        # only be a record torn by a crash. It is cut off, or the next append would land after it
+        # and the scan would read the torn header's lengths into the new record.
+        if os.fstat(self._fd).st_size == 0:
+            os.write(self._fd, self.MAGIC)
+        self.refresh()
+        if os.fstat(self._fd).st_size > self._scanned:
+            os.ftruncate(self._fd, self._scanned)
+
+    def refresh(self) -> int:
+        """
+        Maps records appended since the last refresh, including those written by other processes.
+
+        Returns:
+            int: The number of new records indexed.
+        """
+        size = os.fstat(self._fd).st_size
+        if size <= self._scanned:
+            return 0
+
+        # Dropping the old map (instead of closing it) keeps views handed out earlier valid.
+        self._map = mmap.mmap(self._fd, size, access=mmap.ACCESS_READ)
+        if self._map[:len(self.MAGIC)] != self.MAGIC:
+            raise ValueError(f"{self.path} is not a cache store file.")
+
+        # Only headers and keys are read here; checksums are verified lazily when a value is read,
+        # so reopening a large store does not touch the value pages.
+        header_size = self._HEADER.size
+        offset, added = self._scanned, 0
+        while offset + header_size <= size:
+            key_len, value_len, checksum, expires_at = self._HEADER.unpack_from(self._map, offset)
+            key_start = offset + header_size
+            end = key_start + key_len + value_len
+            # A short tail is a record another process is still writing; stop before it.
+            if end > size:
+                break
+            self._index[self._map[key_start:key_start + key_len]] = (key_start, key_len, value_len, checksum, expires_at)
+            offset = end
+            added += 1
+        self._scanned = offset
+        return added
+
+    def get_view(self, key: bytes) -> Optional[memoryview]:
+        """
+        Returns a zero-copy view of the stored value.
+
+        Args:
+            key (bytes): The record key.
+
+        Returns:
+            Optional[memoryview]: A read-only view into the mapped file, or None if missing or expired.
+        """
+        location = self._index.get(key)
+        if location is None and self.refresh():
+            location = self._index.get(key)
+        if location is None:
+            return None
+        key_start, key_len, value_len, checksum, expires_at = location
+        if expires_at and expires_at <= time.time():
+            return None
+        view = memoryview(self._map)[key_start:key_start + key_len + value_len]
+        if zlib.crc32(view) != checksum:
+            return None
+        return view[key_len:]
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Returns a copy of the stored value.
+
+        Args:
+            key (bytes): The record key.
+
+        Returns:
+            Optional[bytes]: The value, or None if missing or expired.
+        """
+        view = self.get_view(key)
+        return bytes(view) if view is not None else None
+
+    def put(self, key: bytes, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Appends a record for the key; it supersedes any earlier record for the same key.
+
+        Args:
+            key (bytes): The record key.
+            value (bytes): The value to store.
+            ttl (Optional[float]): Time-to-live in seconds. None keeps the record until compaction.
+        """
+        expires_at = time.time() + ttl if ttl is not None else 0.0
+        payload = key + value
+        record = self._HEADER.pack(len(key), len(value), zlib.crc32(payload), expires_at) + payload
+        self._with_lock(lambda: os.write(self._fd, record))
+        self.refresh()
+
+    def compact(self) -> None:
+        """
+        Rewrites the store keeping only the newest record of every unexpired key.
+        Run it while no other process is writing; readers keep their old mapping until they reopen the store.
+        """
+        def rewrite() -> None:
+            self.refresh()
+            now = time.time()
+            temp_path = f"{self.path}.compact"
+            with open(temp_path, "wb") as out:
+                out.write(self.MAGIC)
+                for key_start, key_len, value_len, checksum, expires_at in self._index.values():
+                    if expires_at and expires_at <= now:
+                        continue
+                    out.write(self._HEADER.pack(key_len, value_len, checksum, expires_at))
+                    out.write(self._map[key_start:key_start + key_len + value_len])
+            os.replace(temp_path, self.path)
+
+        self._with_lock(rewrite)
+        os.close(self._fd)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._map = None
+        self._index = {}
+        self._scanned = len(self.MAGIC)
+        self.refresh()
+
+    def close(self) -> None:
+        """
+        Closes the underlying file descriptor. Views returned earlier remain readable.
+        """
+        os.close(self._fd)
@@ -0,0 +1,321 @@
+from collections import OrderedDict
+from abc import ABC, abstractmethod
+from typing import Optional
+from typing import Hashable
+from typing import Dict
+from typing import List
+
+
+class EvictionPolicy(ABC):
+    """
+    Abstract base class for cache eviction policies.
+
+    A policy only tracks keys; the cache owns the values. Every hook must run in O(1)
+    so that the cache keeps constant-time get and put operations.
+    """
+
+    @abstractmethod
+    def on_insert(self, key: Hashable) -> None:
+        """
+        Records that a new key was inserted into the cache.
+
+        Args:
+            key (Hashable): The inserted key.
+        """
+        raise NotImplementedError("Subclasses must implement the on_insert method.")
+
+    @abstractmethod
+    def on_access(self, key: Hashable) -> None:
+        """
+        Records a cache hit (or an overwrite) for an existing key.
+
+        Args:
+            key (Hashable): The accessed key.
+        """
+        raise NotImplementedError("Subclasses must implement the on_access method.")
+
+    @abstractmethod
+    def on_remove(self, key: Hashable) -> None:
+        """
+        Stops tracking a key that was removed by the cache (expired or deleted).
+
+        Args:
+            key (Hashable): The removed key.
+        """
+        raise NotImplementedError("Subclasses must implement the on_remove method.")
+
+    @abstractmethod
+    def evict(self) -> Hashable:
+        """
+        Chooses a victim, stops tracking it and returns it to the cache for removal.
+
+        Returns:
+            Hashable: The key to evict.
+
+        Raises:
+            KeyError: If the policy is not tracking any key.
+        """
+        raise NotImplementedError("Subclasses must implement the evict method.")
+
+    def on_miss(self, key: Hashable) -> None:
+        """
+        Records a cache miss. Only frequency-based admission policies care about misses.
+
+        Args:
+            key (Hashable): The key that was looked up but not found.
+        """
+
+
+class LRUPolicy(EvictionPolicy):
+    """
+    Least-recently-used eviction backed by an ordered dictionary.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        """
+        Initializes the policy.
+
+        Args:
+            capacity (int): Expected number of entries. Unused, accepted for a uniform constructor.
+        """
+        self._order: 'OrderedDict[Hashable, None]' = OrderedDict()
+
+    def on_insert(self, key: Hashable) -> None:
+        self._order[key] = None
+
+    def on_access(self, key: Hashable) -> None:
+        self._order.move_to_end(key)
+
+    def on_remove(self, key: Hashable) -> None:
+        self._order.pop(key, None)
+
+    def evict(self) -> Hashable:
+        key, _ = self._order.popitem(last=False)
+        return key
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Least-frequently-used eviction with O(1) frequency buckets.
+
+    Ties inside a frequency bucket are broken in least-recently-used order.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        """
+        Initializes the policy.
+
+        Args:
+            capacity (int): Expected number of entries. Unused, accepted for a uniform constructor.
+        """
+        self._freq: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, 'OrderedDict[Hashable, None]'] = {}
+        self._min_freq = 0
+
+    def _bucket(self, freq: int) -> 'OrderedDict[Hashable, None]':
+        bucket = self._buckets.get(freq)
+        if bucket is None:
+            bucket = self._buckets[freq] = OrderedDict()
+        return bucket
+
+    def on_insert(self, key: Hashable) -> None:
+        self._freq[key] = 1
+        self._bucket(1)[key] = None
+        self._min_freq = 1
+
+    def on_access(self, key: Hashable) -> None:
+        freq = self._freq[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._bucket(freq + 1)[key] = None
+
+    def on_remove(self, key: Hashable) -> None:
+        freq = self._freq.pop(key, None)
+        if freq is None:
+            return
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                # Removal is rare compared to eviction, so a scan over the distinct frequencies is acceptable.
+                self._min_freq = min(self._buckets, default=0)
+
+    def evict(self) -> Hashable:
+        if not self._freq:
+            raise KeyError("evict from an empty policy")
+        bucket = self._buckets[self._min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_freq]
+            self._min_freq = min(self._buckets, default=0)
+        del self._freq[key]
+        return key
+
+
+class CountMinSketch:
+    """
+    Approximate frequency counter with periodic aging, used as the TinyLFU admission filter.
+    """
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes the sketch.
+
+        Args:
+            capacity (int): Expected number of cache entries; sizes the counter rows and the aging period.
+        """
+        width = 16
+        while width < max(capacity, 1) * 2:
+            width <<= 1
+        self._mask = width - 1
+        self._rows: List[List[int]] = [[0] * width for _ in self._SEEDS]
+        self._additions = 0
+        self._sample_size = max(capacity, 1) * 10
+
+    def _indexes(self, key: Hashable) -> List[int]:
+        h = hash(key)
+        return [((h ^ seed) * 0x01000193 >> 7) & self._mask for seed in self._SEEDS]
+
+    def increment(self, key: Hashable) -> None:
+        """
+        Counts one occurrence of a key, halving every counter once the sample period is reached.
+
+        Args:
+            key (Hashable): The key to count.
+        """
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        """
+        Estimates how often a key was seen within the current sample period.
+
+        Args:
+            key (Hashable): The key to look up.
+
+        Returns:
+            int: The (over-)estimated frequency.
+        """
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        for row in self._rows:
+            for i, count in enumerate(row):
+                row[i] = count >> 1
+        self._additions //= 2
+
+
+class WTinyLFUPolicy(EvictionPolicy):
+    """
+    Window TinyLFU eviction.
+
+    New keys enter a small LRU window. Keys overflowing the window move to the probation segment
+    of the main region, and when the cache must evict, the newest of them competes with the oldest
+    probation key: the one with the lower sketch frequency is evicted. The main region is a
+    segmented LRU (probation/protected), so one-hit wonders never displace frequently requested entries.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8) -> None:
+        """
+        Initializes the policy.
+
+        Args:
+            capacity (int): Expected number of entries in the cache.
+            window_ratio (float): Share of the capacity reserved for the admission window.
+            protected_ratio (float): Share of the main region reserved for the protected segment.
+        """
+        capacity = max(capacity, 1)
+        self._window_capacity = max(1, int(capacity * window_ratio))
+        self._protected_capacity = max(1, int((capacity - self._window_capacity) * protected_ratio))
+        self._window: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self._probation: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self._protected: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self._candidate: Optional[Hashable] = None
+        self._sketch = CountMinSketch(capacity)
+
+    def on_insert(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+        self._window[key] = None
+        if len(self._window) > self._window_capacity:
+            candidate, _ = self._window.popitem(last=False)
+            self._probation[candidate] = None
+            self._candidate = candidate
+
+    def on_miss(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+
+    def on_access(self, key: Hashable) -> None:
+        self._sketch.increment(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        else:
+            # A hit in probation promotes the entry; the protected overflow is demoted back.
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def on_remove(self, key: Hashable) -> None:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def evict(self) -> Hashable:
+        main = self._probation if self._probation else self._protected
+        if not main:
+            if not self._window:
+                raise KeyError("evict from an empty policy")
+            key, _ = self._window.popitem(last=False)
+            return key
+
+        victim = next(iter(main))
+        candidate, self._candidate = self._candidate, None
+        if candidate is not None and candidate != victim and candidate in self._probation:
+            if self._sketch.estimate(candidate) <= self._sketch.estimate(victim):
+                del self._probation[candidate]
+                return candidate
+        del main[victim]
+        return victim
+
+
+POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "w-tinylfu": WTinyLFUPolicy,
+}
+
+
+def make_policy(name: str, capacity: int) -> EvictionPolicy:
+    """
+    Builds an eviction policy by name.
+
+    Args:
+        name (str): One of 'lru', 'lfu' or 'w-tinylfu'.
+        capacity (int): Expected number of cache entries.
+
+    Returns:
+        EvictionPolicy: A new policy instance.
+
+    Raises:
+        ValueError: If the policy name is unknown.
+    """
+    policy_class = POLICIES.get(name.lower())
+    if policy_class is None:
+        raise ValueError(f"Unknown eviction policy: {name}")
+    return policy_class(capacity)
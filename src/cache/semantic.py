@@ -0,0 +1,252 @@
+from typing import Protocol
+from typing import Optional
+from typing import Tuple
+from typing import List
+from typing import Any
+import numpy as np
+import threading
+import zlib
+import re
+
+
+_TOKEN = re.compile(r"\w+")
+
+
+class Embedder(Protocol):
+    """
+    Protocol for embedders used by SemanticCache. Embeddings must be L2-normalized float32 vectors
+    so that a dot product is the cosine similarity.
+    """
+    dim: int
+
+    def embed(self, text: str) -> np.ndarray:
+        ...
+
+
+class HashingEmbedder:
+    """
+    Dependency-free embedder based on the hashing trick.
+
+    Lower-cased words and their character n-grams are hashed into a fixed number of signed buckets.
+    Texts that share most of their words and word fragments, such as prompts that only differ in
+    punctuation, casing or a few words, end up with a high cosine similarity.
+    """
+
+    def __init__(self, dim: int = 256, ngram: int = 3) -> None:
+        """
+        Initializes the embedder.
+
+        Args:
+            dim (int): Number of dimensions of the embedding.
+            ngram (int): Length of the character n-grams extracted from each word.
+        """
+        self.dim = dim
+        self.ngram = ngram
+
+    def _features(self, text: str) -> List[str]:
+        features = []
+        for word in _TOKEN.findall(text.lower()):
+            features.append(word)
+            padded = f"#{word}#"
+            features.extend(padded[i:i + self.ngram] for i in range(len(padded) - self.ngram + 1))
+        return features
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embeds a text.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            np.ndarray: A unit-length float32 vector (all zeros for texts without word characters).
+        """
+        features = self._features(text)
+        hashes = np.fromiter((zlib.crc32(f.encode("utf-8")) for f in features), dtype=np.uint32, count=len(features))
+        # The top bit picks the sign so that colliding features tend to cancel out instead of adding up.
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0)
+        vector = np.bincount(hashes % self.dim, weights=signs, minlength=self.dim).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SemanticCache:
+    """
+    Cache that returns a stored value when a new text is similar enough to a previously stored one.
+
+    Embeddings are kept in a contiguous float32 matrix. Small caches are searched exhaustively with
+    one matrix-vector product. Larger ones use random-hyperplane LSH: each entry gets one n_bits code
+    per hash table, the codes are kept in one sorted array, and a lookup binary-searches the query's
+    codes and re-ranks only the matching entries exactly. New entries are compared exhaustively until
+    they are merged into the index in small batches. This keeps lookups sub-millisecond at 100k entries.
+    When the cache is full, the oldest entry is replaced.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        threshold: float = 0.9,
+        capacity: int = 100_000,
+        n_tables: int = 32,
+        n_bits: int = 16,
+        exact_search_below: int = 4096,
+        index_batch_size: int = 256,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            embedder (Optional[Embedder]): Embedder for the texts. Defaults to a HashingEmbedder.
+            threshold (float): Minimum cosine similarity for a lookup to count as a hit.
+            capacity (int): Maximum number of entries.
+            n_tables (int): Number of LSH hash tables. More tables raise recall and the candidate count.
+            n_bits (int): Hyperplanes per table (at most 31). More bits make buckets smaller and recall lower.
+            exact_search_below (int): Below this many entries every entry is compared with the query.
+            index_batch_size (int): Number of new entries compared exhaustively before they are merged into the index.
+            seed (int): Seed for the random hyperplanes.
+        """
+        if not 0 < n_bits < 32:
+            raise ValueError("n_bits must be between 1 and 31.")
+        self.embedder = embedder if embedder is not None else HashingEmbedder()
+        self.threshold = threshold
+        self.capacity = capacity
+        self.exact_search_below = exact_search_below
+        self.index_batch_size = index_batch_size
+        self.hits = 0
+        self.misses = 0
+
+        dim = self.embedder.dim
+        initial = min(capacity, 1024)
+        self._vectors = np.zeros((initial, dim), dtype=np.float32)
+        self._codes = np.zeros((initial, n_tables), dtype=np.int32)
+        self._values: List[Any] = []
+        self._size = 0
+        self._next = 0
+
+        self._n_tables = n_tables
+        self._n_bits = n_bits
+        self._planes = np.random.default_rng(seed).standard_normal((n_tables * n_bits, dim)).astype(np.float32)
+        self._bit_weights = (1 << np.arange(n_bits)).astype(np.int32)
+        # Index keys are (table << n_bits) | code, so one sorted array serves every table.
+        self._table_offsets = np.arange(n_tables, dtype=np.int64) << n_bits
+        self._sorted_keys = np.zeros(0, dtype=np.int64)
+        self._sorted_slots = np.zeros(0, dtype=np.int32)
+        self._unindexed: List[int] = []
+        self._stale = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _hash(self, vector: np.ndarray) -> np.ndarray:
+        bits = (self._planes @ vector > 0).reshape(self._n_tables, self._n_bits)
+        return bits.astype(np.int32) @ self._bit_weights
+
+    def _grow(self) -> None:
+        rows = min(self.capacity, self._vectors.shape[0] * 2)
+        vectors = np.zeros((rows, self._vectors.shape[1]), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        codes = np.zeros((rows, self._n_tables), dtype=np.int32)
+        codes[:self._size] = self._codes[:self._size]
+        self._vectors, self._codes = vectors, codes
+
+    def _index_keys(self, slots: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        keys = (self._codes[slots].astype(np.int64) | self._table_offsets).ravel()
+        order = np.argsort(keys, kind="stable")
+        return keys[order], np.repeat(slots.astype(np.int32), self._n_tables)[order]
+
+    def _update_index(self) -> None:
+        if self._stale > self._size // 4:
+            # Replaced slots leave stale keys behind; rebuild from scratch once they pile up.
+            self._sorted_keys, self._sorted_slots = self._index_keys(np.arange(self._size))
+            self._stale = 0
+        else:
+            keys, slots = self._index_keys(np.asarray(self._unindexed))
+            positions = np.searchsorted(self._sorted_keys, keys)
+            self._sorted_keys = np.insert(self._sorted_keys, positions, keys)
+            self._sorted_slots = np.insert(self._sorted_slots, positions, slots)
+        self._unindexed = []
+
+    def put(self, text: str, value: Any) -> None:
+        """
+        Stores a value under the embedding of a text.
+
+        Args:
+            text (str): The text, e.g. a prompt.
+            value (Any): The value to return for similar texts.
+        """
+        vector = self.embedder.embed(text)
+        codes = self._hash(vector)
+        with self._lock:
+            if self._size < self.capacity:
+                slot = self._size
+                if slot == self._vectors.shape[0]:
+                    self._grow()
+                self._values.append(value)
+                self._size += 1
+            else:
+                # The replaced slot keeps stale keys in the index until the next rebuild; stale
+                # candidates only cost an extra dot product because every candidate is re-ranked.
+                slot = self._next
+                self._next = (slot + 1) % self.capacity
+                self._values[slot] = value
+                self._stale += 1
+
+            self._vectors[slot] = vector
+            self._codes[slot] = codes
+            self._unindexed.append(slot)
+            if len(self._unindexed) >= self.index_batch_size:
+                self._update_index()
+
+    def search(self, text: str) -> Tuple[Optional[Any], float]:
+        """
+        Finds the most similar stored text.
+
+        Args:
+            text (str): The query text.
+
+        Returns:
+            Tuple[Optional[Any], float]: The value of the nearest entry and its cosine similarity,
+            or (None, 0.0) when nothing was found.
+        """
+        vector = self.embedder.embed(text)
+        with self._lock:
+            if self._size == 0:
+                return None, 0.0
+            if self._size < self.exact_search_below:
+                similarities = self._vectors[:self._size] @ vector
+                best = int(np.argmax(similarities))
+                return self._values[best], float(similarities[best])
+
+            keys = self._hash(vector).astype(np.int64) | self._table_offsets
+            starts = np.searchsorted(self._sorted_keys, keys, side="left").tolist()
+            ends = np.searchsorted(self._sorted_keys, keys, side="right").tolist()
+            parts = [self._sorted_slots[start:end] for start, end in zip(starts, ends) if end > start]
+            parts.append(np.asarray(self._unindexed, dtype=np.int32))
+            slots = np.unique(np.concatenate(parts))
+            if slots.size == 0:
+                return None, 0.0
+            similarities = self._vectors[slots] @ vector
+            best = int(np.argmax(similarities))
+            return self._values[int(slots[best])], float(similarities[best])
+
+    def get(self, text: str, default: Any = None) -> Any:
+        """
+        Returns the value stored for the most similar text if it meets the similarity threshold.
+
+        Args:
+            text (str): The query text.
+            default (Any): Value returned when no stored text is similar enough.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        value, similarity = self.search(text)
+        hit = similarity >= self.threshold
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return value if hit else default
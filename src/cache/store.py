@@ -0,0 +1,206 @@
+from src.cache.policies import EvictionPolicy
+from src.cache.policies import make_policy
+from dataclasses import dataclass
+from typing import Callable
+from typing import Optional
+from typing import Hashable
+from typing import Union
+from typing import Dict
+from typing import Any
+import time
+import sys
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing how a cache has been used.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the share of lookups that were served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: Optional[float]) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class BoundedCache:
+    """
+    In-memory cache bounded by entry count and by an approximate byte budget.
+
+    Entries may carry a time-to-live and are expired lazily when they are read. When either bound
+    is exceeded the configured eviction policy picks the victims. Both get and put are O(1).
+    The cache is not thread-safe; guard it with a lock when it is shared between threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        policy: Union[str, EvictionPolicy] = "lru",
+        size_of: Callable[[Any], int] = sys.getsizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept in the cache.
+            max_bytes (Optional[int]): Maximum total size of the cached values, as measured by size_of.
+            ttl (Optional[float]): Default time-to-live in seconds. None keeps entries until evicted.
+            policy (Union[str, EvictionPolicy]): Eviction policy name ('lru', 'lfu', 'w-tinylfu') or instance.
+            size_of (Callable[[Any], int]): Function estimating the size of a value in bytes.
+            clock (Callable[[], float]): Monotonic clock used for expiry.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.policy = make_policy(policy, max_entries) if isinstance(policy, str) else policy
+        self.stats = CacheStats()
+        self.total_bytes = 0
+        self._size_of = size_of
+        self._clock = clock
+        self._entries: Dict[Hashable, _Entry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and (entry.expires_at is None or entry.expires_at > self._clock())
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key, or the default when it is missing or expired.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): Value returned on a miss.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            self.policy.on_miss(key)
+            return default
+        if entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            self.policy.on_miss(key)
+            return default
+        self.stats.hits += 1
+        self.policy.on_access(key)
+        return entry.value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key without updating statistics or the eviction order.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): Value returned when the key is missing or expired.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        entry = self._entries.get(key)
+        if entry is None or (entry.expires_at is not None and entry.expires_at <= self._clock()):
+            return default
+        return entry.value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value, evicting other entries if the cache exceeds its bounds.
+
+        Values larger than the whole byte budget are not cached.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            ttl (Optional[float]): Time-to-live for this entry; defaults to the cache-wide ttl.
+        """
+        size = self._size_of(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.total_bytes += size - entry.size
+            entry.value, entry.size, entry.expires_at = value, size, expires_at
+            self.policy.on_access(key)
+        else:
+            self._entries[key] = _Entry(value, size, expires_at)
+            self.total_bytes += size
+            self.policy.on_insert(key)
+
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self.total_bytes > self.max_bytes
+        ):
+            victim = self.policy.evict()
+            self.total_bytes -= self._entries.pop(victim).size
+            self.stats.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Removes a key from the cache.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            bool: True if the key was present.
+        """
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def purge_expired(self) -> int:
+        """
+        Removes every expired entry. This is O(n) and meant for periodic housekeeping.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        now = self._clock()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at is not None and entry.expires_at <= now]
+        for key in expired:
+            self._remove(key)
+        self.stats.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """
+        Removes every entry while keeping the statistics.
+        """
+        for key in list(self._entries):
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        self.total_bytes -= self._entries.pop(key).size
+        self.policy.on_remove(key)
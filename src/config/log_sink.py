@@ -0,0 +1,238 @@
+from logging.handlers import BaseRotatingHandler
+from typing import Iterator
+from typing import Optional
+from typing import Union
+from typing import List
+from typing import Dict
+from typing import Any
+import logging
+import shutil
+import gzip
+import json
+import glob
+import time
+import re
+import os
+
+
+# Attributes every LogRecord has; anything else on a record was passed through `extra`.
+_STANDARD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+_LEVEL_NAMES = {number: logging.getLevelName(number) for number in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)}
+_SEGMENT_STAMP = re.compile(r"\.(\d{8}T\d{6})(?:_\d+)?\.[^.]+(?:\.gz)?$")
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats a record as one compact JSON object per line. Values passed through `extra`
+    become additional keys; values JSON cannot encode are written with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "path": record.pathname,
+            "line": record.lineno,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRIBUTES and key not in entry:
+                entry[key] = value
+        return json.dumps(entry, separators=(",", ":"), default=str)
+
+
+class JsonLinesRotatingHandler(BaseRotatingHandler):
+    """
+    Writes records as JSON lines and rotates the file by size and by age.
+
+    On rollover the active file (e.g. logs/app.jsonl) is renamed to a time-stamped segment
+    (logs/app.20261017T083000.jsonl), optionally gzip-compressed, and a new file is started.
+    With backup_count > 0 only that many segments are kept.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 64 * 1024 ** 2,
+        rotate_seconds: Optional[float] = 3600.0,
+        compress: bool = False,
+        backup_count: int = 0,
+    ) -> None:
+        """
+        Initializes the handler.
+
+        Args:
+            filename (str): Path of the active file.
+            max_bytes (int): Size at which the file is rotated; 0 disables size-based rotation.
+            rotate_seconds (Optional[float]): Age at which the file is rotated; None disables time-based rotation.
+            compress (bool): Whether rotated segments are gzip-compressed.
+            backup_count (int): Number of rotated segments to keep; 0 keeps all of them.
+        """
+        super().__init__(filename, "a", encoding="utf-8", delay=True)
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.compress = compress
+        self.backup_count = backup_count
+        self.setFormatter(JsonLinesFormatter())
+        # JSON is written ASCII-only, so the size in characters is the size in bytes.
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        self._rollover_at = self._next_rollover(time.time())
+
+    def _next_rollover(self, now: float) -> float:
+        return now + self.rotate_seconds if self.rotate_seconds else float("inf")
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.write_batch([record])
+
+    def write_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Writes several records with a single flush, rotating between records when needed.
+
+        Args:
+            records (List[logging.LogRecord]): The records to write.
+        """
+        with self.lock:
+            lines: List[str] = []
+            for record in records:
+                try:
+                    line = self.format(record) + "\n"
+                except Exception:
+                    self.handleError(record)
+                    continue
+                if self._size and (
+                    (self.max_bytes and self._size + len(line) > self.max_bytes) or record.created >= self._rollover_at
+                ):
+                    self._write_lines(lines, record)
+                    lines = []
+                    self.doRollover()
+                lines.append(line)
+                self._size += len(line)
+            if records:
+                self._write_lines(lines, records[-1])
+
+    def _write_lines(self, lines: List[str], record: logging.LogRecord) -> None:
+        if not lines:
+            return
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write("".join(lines))
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self._size = 0
+        self._rollover_at = self._next_rollover(time.time())
+        if not os.path.exists(self.baseFilename):
+            return
+
+        stem, suffix = os.path.splitext(self.baseFilename)
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        segment = f"{stem}.{stamp}{suffix}"
+        sequence = 1
+        while os.path.exists(segment) or os.path.exists(segment + ".gz"):
+            # '_' sorts after '.', so later segments of the same second also sort later.
+            segment = f"{stem}.{stamp}_{sequence:03d}{suffix}"
+            sequence += 1
+        os.replace(self.baseFilename, segment)
+        if self.compress:
+            with open(segment, "rb") as source, gzip.open(segment + ".gz.tmp", "wb", compresslevel=6) as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+            os.replace(segment + ".gz.tmp", segment + ".gz")
+            os.remove(segment)
+
+        if self.backup_count:
+            rotated = [path for path in log_segments(self.baseFilename) if path != self.baseFilename]
+            for old in rotated[:-self.backup_count]:
+                os.remove(old)
+
+
+def _level_number(name: str) -> int:
+    number = logging.getLevelName(name)
+    return number if isinstance(number, int) else 0
+
+
+def _segment_closed_at(filename: str) -> Optional[float]:
+    # Rotated segments are named after the second they were closed in; no record in them is newer.
+    match = _SEGMENT_STAMP.search(os.path.basename(filename))
+    if match is None:
+        return None
+    return time.mktime(time.strptime(match.group(1), "%Y%m%dT%H%M%S")) + 1
+
+
+def log_segments(filename: str) -> List[str]:
+    """
+    Returns the rotated segments of a JSON-lines log followed by the active file, oldest first.
+
+    Args:
+        filename (str): Path of the active file, e.g. 'logs/app.jsonl'.
+
+    Returns:
+        List[str]: The existing files in chronological order.
+    """
+    stem, suffix = os.path.splitext(filename)
+    pattern = f"{glob.escape(stem)}.*{suffix}"
+    segments = sorted(glob.glob(pattern) + glob.glob(pattern + ".gz"), key=lambda path: path[:-3] if path.endswith(".gz") else path)
+    if os.path.exists(filename):
+        segments.append(filename)
+    return segments
+
+
+def read_log_records(
+    path: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    level: Union[int, str, None] = None,
+    all_segments: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterates over the records of a JSON-lines log, one line at a time, across all of its
+    rotated (and compressed) segments, so the memory used does not depend on the log size.
+
+    Args:
+        path (str): The active file of the log, or a single segment.
+        start (Optional[float]): Only yield records with ts >= start.
+        end (Optional[float]): Only yield records with ts < end.
+        level (Union[int, str, None]): Only yield records at or above this level, e.g. 'WARNING'.
+        all_segments (bool): Whether to read the rotated segments of `path` before it, or only `path`.
+
+    Yields:
+        Dict[str, Any]: The decoded records, oldest first.
+    """
+    min_level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+    # The sink writes '"level":"NAME"' verbatim, so lines below the level are skipped before decoding.
+    skipped_levels = tuple(
+        f'"level":"{name}"' for number, name in _LEVEL_NAMES.items() if min_level is not None and number < min_level
+    )
+    files = log_segments(path) if all_segments else [path]
+    for filename in files:
+        closed_at = _segment_closed_at(filename)
+        if start is not None and closed_at is not None and closed_at < start:
+            continue
+        opener = gzip.open if filename.endswith(".gz") else open
+        with opener(filename, "rt", encoding="utf-8") as lines:
+            for line in lines:
+                if skipped_levels and any(token in line for token in skipped_levels):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash is skipped rather than ending the iteration.
+                    continue
+                if start is not None and record["ts"] < start:
+                    continue
+                if end is not None and record["ts"] >= end:
+                    continue
+                if min_level is not None and _level_number(record["level"]) < min_level:
+                    continue
+                yield record
@@ -1,7 +1,18 @@
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from src.config.log_sink import JsonLinesRotatingHandler
+import functools
 import logging
+import threading
+import atexit
+import copy
+import queue
+import time
 import os
 
 
+# Every record from the same source file carries the same path, so each path is shortened only once.
+@functools.lru_cache(maxsize=None)
 def custom_path_filter(path):
     # Define the project root name
     project_root = "Python Design Patterns for AI"
@@ -20,7 +31,177 @@ class CustomLogRecord(logging.LogRecord):
         self.pathname = custom_path_filter(self.pathname)
 
 
-def setup_logger(log_filename="app.log", log_dir="logs"):
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+# Put on the queue by BatchingQueueListener.stop() to end the drain loop.
+_STOP = object()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue that applies an overflow policy when the queue is full:
+    'block' waits for space, 'drop_newest' discards the new record and 'drop_oldest' discards
+    the oldest queued record. Dropped records are counted in `dropped`.
+    """
+
+    def __init__(self, log_queue, overflow="drop_newest"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Only the message arguments are merged here (so later mutation of arguments cannot change
+        # the record); time stamps and the line format are applied by the listener thread.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.overflow == "drop_newest":
+                    self.dropped += 1
+                    return
+                try:
+                    oldest = self.queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self.dropped += 1
+                if oldest is _STOP or oldest is None:
+                    # Never drop a listener's stop sentinel (None for a plain QueueListener), or
+                    # stop() would wait forever at exit: put it back and drop the new record.
+                    self.queue.put(oldest)
+                    return
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener that drains up to `batch_size` records at a time and writes them to each
+    stream handler with a single flush per batch instead of one flush per record. After a
+    partial batch it sleeps for `flush_interval` seconds, so records accumulate into larger
+    batches instead of waking the listener (and contending for the GIL) on every log call.
+    """
+
+    def __init__(self, log_queue, *handlers, batch_size=64, flush_interval=0.05):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._batch_thread = None
+
+    # start(), stop() and the drain loop are implemented here on top of the public dequeue(), so
+    # the listener does not depend on QueueListener's private _monitor, _thread or _sentinel.
+    def start(self):
+        self._batch_thread = threading.Thread(target=self._drain_batches, name="log-listener", daemon=True)
+        self._batch_thread.start()
+
+    def stop(self):
+        if self._batch_thread is None:
+            return
+        self.enqueue_sentinel()
+        self._batch_thread.join()
+        self._batch_thread = None
+
+    def enqueue_sentinel(self):
+        # A blocking put: put_nowait would raise queue.Full when the bounded queue is full at exit.
+        # The listener keeps draining, so wait for space, unless its thread is already gone.
+        while True:
+            try:
+                self.queue.put(_STOP, timeout=0.1)
+                return
+            except queue.Full:
+                if self._batch_thread is None or not self._batch_thread.is_alive():
+                    return
+
+    def _drain_batches(self):
+        has_task_done = hasattr(self.queue, "task_done")
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            # Records logged during shutdown can follow the sentinel in the same drain; write them
+            # too, but stop draining after this batch.
+            stop = any(item is _STOP for item in batch)
+            records = [item for item in batch if item is not _STOP] if stop else batch
+            if records:
+                self.handle_batch(records)
+            if has_task_done:
+                for _ in batch:
+                    self.queue.task_done()
+            if stop:
+                break
+            # Sleeping hands the GIL back to the application threads between batches.
+            time.sleep(self.flush_interval if len(batch) < self.batch_size else 0)
+
+    def handle_batch(self, records):
+        for handler in self.handlers:
+            records_for_handler = [record for record in records if record.levelno >= handler.level]
+            if not records_for_handler:
+                continue
+            if isinstance(handler, JsonLinesRotatingHandler):
+                # The structured sink checks for rotation between records, so it writes the batch itself.
+                handler.write_batch([record for record in records_for_handler if handler.filter(record)])
+                continue
+            if not isinstance(handler, logging.StreamHandler):
+                for record in records_for_handler:
+                    handler.handle(record)
+                continue
+            lines = []
+            for record in records_for_handler:
+                if handler.filter(record):
+                    try:
+                        lines.append(handler.format(record) + handler.terminator)
+                    except Exception:
+                        handler.handleError(record)
+            if not lines:
+                continue
+            with handler.lock:
+                try:
+                    if handler.stream is None and isinstance(handler, logging.FileHandler):
+                        handler.stream = handler._open()
+                    handler.stream.write("".join(lines))
+                    handler.flush()
+                except Exception:
+                    handler.handleError(records_for_handler[-1])
+
+
+def _env_flag(name):
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def setup_logger(log_filename="app.log", log_dir="logs", async_logging=None, queue_size=None, overflow=None, batch_size=64, flush_interval=0.05, level=None, structured=None):
+    """
+    Configures the root logger to write to the terminal and to log_dir/log_filename.
+
+    The level defaults to the LOG_LEVEL environment variable, or INFO. Calls below it are
+    rejected by the logger's cached level check before any record is built, so pass message
+    arguments lazily (logger.info("Loaded %s", name)) rather than as f-strings to keep them free.
+
+    With async_logging (or the LOG_ASYNC=1 environment variable), log calls only put the record
+    on a bounded queue; a background QueueListener does the formatting and the disk and terminal
+    I/O in batches. LOG_QUEUE_SIZE and LOG_OVERFLOW ('block', 'drop_newest', 'drop_oldest')
+    configure the queue when the matching arguments are not given.
+
+    With structured (or LOG_STRUCTURED=1), records are also written as JSON lines to
+    log_dir/<log_filename stem>.jsonl, rotated at LOG_MAX_BYTES bytes (default 64 MiB) or every
+    LOG_ROTATE_SECONDS seconds (default 3600); LOG_COMPRESS=1 gzips the rotated segments.
+    Read them back with src.config.log_sink.read_log_records.
+    """
     # Ensure the logging directory exists
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -28,18 +209,46 @@ def setup_logger(log_filename="app.log", log_dir="logs"):
     # Define the log file path
     log_filepath = os.path.join(log_dir, log_filename)
 
+    if async_logging is None:
+        async_logging = _env_flag("LOG_ASYNC")
+    handlers = [
+        logging.StreamHandler(),
+        logging.FileHandler(log_filepath)
+    ]
+    if structured is None:
+        structured = _env_flag("LOG_STRUCTURED")
+    if structured:
+        handlers.append(JsonLinesRotatingHandler(
+            os.path.join(log_dir, os.path.splitext(log_filename)[0] + ".jsonl"),
+            max_bytes=int(os.environ.get("LOG_MAX_BYTES", 64 * 1024 ** 2)),
+            rotate_seconds=float(os.environ.get("LOG_ROTATE_SECONDS", 3600)) or None,
+            compress=_env_flag("LOG_COMPRESS"),
+        ))
+    log_format = "%(asctime)s [%(levelname)s] [%(module)s] [%(pathname)s]: %(message)s"
+
+    if async_logging:
+        formatter = logging.Formatter(log_format)
+        for handler in handlers:
+            if handler.formatter is None:
+                handler.setFormatter(formatter)
+        log_queue = queue.Queue(maxsize=queue_size or int(os.environ.get("LOG_QUEUE_SIZE", 10_000)))
+        queue_handler = BoundedQueueHandler(log_queue, overflow=overflow or os.environ.get("LOG_OVERFLOW", "drop_newest"))
+        listener = BatchingQueueListener(log_queue, *handlers, batch_size=batch_size, flush_interval=flush_interval)
+        listener.start()
+        # Drain the queue before the interpreter shuts down so no queued record is lost.
+        atexit.register(listener.stop)
+        queue_handler.listener = listener
+        handlers = [queue_handler]
+
     # Define the logging configuration
     logging.setLogRecordFactory(CustomLogRecord)
     logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] [%(module)s] [%(pathname)s]: %(message)s",
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler(log_filepath)
-        ]
+        level=level or os.environ.get("LOG_LEVEL", "INFO").upper(),
+        format=log_format,
+        handlers=handlers
     )
 
     # Return the configured logger
     return logging.getLogger()
 
-logger = setup_logger()
\ No newline at end of file
+logger = setup_logger()
@@ -0,0 +1,238 @@
+from src.config.logging import logger
+from concurrent.futures import Executor
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+from typing import Callable
+from typing import Union
+from typing import Tuple
+from typing import Deque
+from typing import Any
+import threading
+import inspect
+import asyncio
+import time
+
+
+DELIVERY_MODES = ("inline", "thread", "asyncio")
+DROP_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+
+@dataclass
+class DeliveryStats:
+    """
+    Delivery counters and latencies of one observer. Latencies run from the moment a notification
+    was sent until the observer finished handling it, over the most recent deliveries.
+    """
+    observer: str
+    mode: str
+    delivered: int = 0
+    dropped: int = 0
+    failed: int = 0
+    queued: int = 0
+    mean_latency_ms: float = 0.0
+    p50_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+
+class ObserverChannel:
+    """
+    Delivers notifications to a single observer in one of three modes.
+
+    'inline' calls the observer in the notifying thread. 'thread' and 'asyncio' put notifications
+    into a bounded queue owned by the channel and drain it on a thread pool or an event loop, so a
+    slow observer only delays itself. At most one drain runs per channel, which keeps deliveries to
+    an observer in order. When the queue is full, the drop policy decides whether the sender blocks
+    ('block'), the new notification is discarded ('drop_newest') or the oldest queued one is ('drop_oldest').
+    """
+
+    def __init__(
+        self,
+        observer: Any,
+        mode: str = "inline",
+        max_queue_size: int = 1024,
+        drop_policy: str = "block",
+        executor: Optional[Union[Executor, Callable[[], Executor]]] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        latency_window: int = 1024,
+    ) -> None:
+        """
+        Initializes the channel.
+
+        Args:
+            observer (Any): The observer; notifications call its methods by name. In 'asyncio' mode
+                the methods may be coroutine functions.
+            mode (str): One of 'inline', 'thread' or 'asyncio'.
+            max_queue_size (int): Capacity of the queue for 'thread' and 'asyncio' delivery.
+            drop_policy (str): One of 'block', 'drop_newest' or 'drop_oldest'.
+            executor (Optional[Union[Executor, Callable[[], Executor]]]): Pool draining the queue in
+                'thread' mode, or a function returning it. A function is called for every drain, so
+                the owner can shut the pool down and replace it.
+            loop (Optional[asyncio.AbstractEventLoop]): Event loop draining the queue in 'asyncio' mode.
+                Senders on the loop's own thread must not use the 'block' policy.
+            latency_window (int): Number of recent deliveries kept for the latency percentiles.
+
+        Raises:
+            ValueError: If the mode or drop policy is unknown, or the mode's executor or loop is missing.
+        """
+        if mode not in DELIVERY_MODES:
+            raise ValueError(f"Unknown delivery mode: {mode}")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        if mode == "thread" and executor is None:
+            raise ValueError("Thread delivery requires an executor.")
+        if mode == "asyncio" and loop is None:
+            raise ValueError("Asyncio delivery requires an event loop.")
+        self.observer = observer
+        self.mode = mode
+        self.max_queue_size = max_queue_size
+        self.drop_policy = drop_policy
+        self._executor = executor
+        self._loop = loop
+        self._queue: Deque[Tuple[float, str, Tuple[Any, ...]]] = deque()
+        self._cond = threading.Condition()
+        self._scheduled = False
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._max_latency = 0.0
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def send(self, method: str, *args: Any) -> bool:
+        """
+        Delivers a notification, or queues it for delivery.
+
+        Args:
+            method (str): Name of the observer method to call, e.g. 'update_batch'.
+            *args (Any): Arguments for the method.
+
+        Returns:
+            bool: False if the notification was dropped.
+        """
+        sent_at = time.perf_counter()
+        if self.mode == "inline":
+            self._invoke(sent_at, method, args)
+            return True
+
+        with self._cond:
+            if len(self._queue) >= self.max_queue_size:
+                if self.drop_policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self.drop_policy == "drop_oldest":
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    self._cond.wait_for(lambda: len(self._queue) < self.max_queue_size)
+            self._queue.append((sent_at, method, args))
+            if self._scheduled:
+                return True
+            self._scheduled = True
+
+        try:
+            if self.mode == "thread":
+                executor = self._executor() if callable(self._executor) else self._executor
+                executor.submit(self._drain)
+            else:
+                self._loop.call_soon_threadsafe(lambda: self._loop.create_task(self._drain_async()))
+        except Exception:
+            # Nothing will drain the queue. It held only this notification when the drain was
+            # scheduled, so everything in it is undeliverable: this one is reported by the exception,
+            # later ones count as dropped. Clearing it lets join() and blocked senders return, and
+            # the next send schedules a new drain.
+            with self._cond:
+                self.dropped += len(self._queue) - 1
+                self._queue.clear()
+                self._scheduled = False
+                self._cond.notify_all()
+            raise
+        return True
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every queued notification has been delivered.
+
+        Args:
+            timeout (Optional[float]): Maximum number of seconds to wait.
+
+        Returns:
+            bool: True if the queue drained in time.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._queue and not self._scheduled, timeout)
+
+    def stats(self) -> DeliveryStats:
+        """
+        Returns the delivery counters and latency percentiles of the channel.
+
+        Returns:
+            DeliveryStats: A snapshot of the statistics.
+        """
+        with self._cond:
+            latencies = sorted(self._latencies)
+            stats = DeliveryStats(
+                observer=getattr(self.observer, "model_name", type(self.observer).__name__),
+                mode=self.mode,
+                delivered=self.delivered,
+                dropped=self.dropped,
+                failed=self.failed,
+                queued=len(self._queue),
+                max_latency_ms=self._max_latency * 1000,
+            )
+        if latencies:
+            stats.mean_latency_ms = sum(latencies) / len(latencies) * 1000
+            stats.p50_latency_ms = latencies[int(0.50 * (len(latencies) - 1))] * 1000
+            stats.p99_latency_ms = latencies[int(0.99 * (len(latencies) - 1))] * 1000
+        return stats
+
+    def _next(self) -> Optional[Tuple[float, str, Tuple[Any, ...]]]:
+        with self._cond:
+            item = self._queue.popleft() if self._queue else None
+            if item is None:
+                self._scheduled = False
+            self._cond.notify_all()
+            return item
+
+    def _drain(self) -> None:
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            self._invoke(*item)
+
+    async def _drain_async(self) -> None:
+        while True:
+            item = self._next()
+            if item is None:
+                return
+            sent_at, method, args = item
+            try:
+                result = getattr(self.observer, method)(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self._record(sent_at, failed=True)
+                logger.error("Observer %s.%s failed: %s", type(self.observer).__name__, method, e)
+            else:
+                self._record(sent_at)
+
+    def _invoke(self, sent_at: float, method: str, args: Tuple[Any, ...]) -> None:
+        try:
+            getattr(self.observer, method)(*args)
+        except Exception as e:
+            self._record(sent_at, failed=True)
+            logger.error("Observer %s.%s failed: %s", type(self.observer).__name__, method, e)
+        else:
+            self._record(sent_at)
+
+    def _record(self, sent_at: float, failed: bool = False) -> None:
+        latency = time.perf_counter() - sent_at
+        with self._cond:
+            if failed:
+                self.failed += 1
+            else:
+                self.delivered += 1
+            self._latencies.append(latency)
+            if latency > self._max_latency:
+                self._max_latency = latency
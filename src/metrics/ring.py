@@ -0,0 +1,67 @@
+from typing import Sequence
+from typing import Tuple
+import numpy as np
+
+
+class MetricRingBuffer:
+    """
+    Fixed-capacity ring buffer holding the most recent (timestamp, accuracy, loss) points of a model.
+
+    The arrays are allocated once; appending a batch is a couple of vectorized slice assignments,
+    and once the buffer is full the oldest points are overwritten.
+    """
+
+    def __init__(self, capacity: int = 65_536) -> None:
+        """
+        Preallocates the buffer.
+
+        Args:
+            capacity (int): Maximum number of points kept.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        self.capacity = capacity
+        self.total = 0
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._accuracy = np.zeros(capacity, dtype=np.float32)
+        self._loss = np.zeros(capacity, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def extend(self, timestamps: Sequence[float], accuracy: Sequence[float], loss: Sequence[float]) -> None:
+        """
+        Appends a batch of points, overwriting the oldest ones when the buffer is full.
+
+        Args:
+            timestamps (Sequence[float]): Wall-clock times of the points.
+            accuracy (Sequence[float]): Accuracy values.
+            loss (Sequence[float]): Loss values.
+        """
+        n = len(timestamps)
+        if n == 0:
+            return
+        skip = max(0, n - self.capacity)
+        start = (self.total + skip) % self.capacity
+        for target, values in ((self._timestamps, timestamps), (self._accuracy, accuracy), (self._loss, loss)):
+            values = np.asarray(values)[skip:]
+            head = min(len(values), self.capacity - start)
+            target[start:start + head] = values[:head]
+            target[:len(values) - head] = values[head:]
+        self.total += n
+
+    def latest(self, n: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns copies of the newest points in chronological order.
+
+        Args:
+            n (int): Number of points to return; 0 returns everything kept.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Timestamps, accuracy and loss arrays.
+        """
+        size = len(self)
+        n = size if n <= 0 else min(n, size)
+        end = self.total % self.capacity
+        indexes = np.arange(end - n, end) % self.capacity
+        return self._timestamps[indexes], self._accuracy[indexes], self._loss[indexes]
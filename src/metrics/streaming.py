@@ -0,0 +1,336 @@
+from typing import Sequence
+from typing import Optional
+from typing import Dict
+from typing import List
+import numpy as np
+import math
+
+
+class EWMA:
+    """
+    Exponentially weighted moving average.
+    """
+
+    def __init__(self, alpha: float = 0.1) -> None:
+        """
+        Initializes the average.
+
+        Args:
+            alpha (float): Weight of the newest value, between 0 and 1.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1].")
+        self.alpha = alpha
+        self.value: Optional[float] = None
+
+    def update(self, x: float) -> float:
+        """
+        Adds a value.
+
+        Args:
+            x (float): The new value.
+
+        Returns:
+            float: The updated average.
+        """
+        self.value = x if self.value is None else self.value + self.alpha * (x - self.value)
+        return self.value
+
+    def update_many(self, values: np.ndarray) -> Optional[float]:
+        """
+        Adds a batch of values with one vectorized weighted sum.
+
+        Args:
+            values (np.ndarray): The new values, oldest first.
+
+        Returns:
+            Optional[float]: The updated average.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return self.value
+        if self.value is None:
+            self.value = float(values[0])
+            values = values[1:]
+        decay = 1.0 - self.alpha
+        weights = self.alpha * decay ** np.arange(values.size - 1, -1, -1)
+        self.value = decay ** values.size * self.value + float(weights @ values)
+        return self.value
+
+
+class RollingWindow:
+    """
+    Mean and variance over the last `size` values, maintained with running sums.
+
+    Each update adds the new value and subtracts the one leaving the window. The sums are
+    recomputed from the window once every `size` updates to cancel accumulated rounding errors,
+    which keeps updates amortized O(1).
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initializes an empty window.
+
+        Args:
+            size (int): Number of most recent values in the window.
+        """
+        if size < 1:
+            raise ValueError("size must be positive.")
+        self.size = size
+        self.count = 0
+        self._values = np.zeros(size, dtype=np.float64)
+        self._next = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._since_refresh = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+
+    @property
+    def mean(self) -> float:
+        """
+        Returns the mean of the window, or NaN when it is empty.
+        """
+        n = len(self)
+        return self._sum / n if n else math.nan
+
+    @property
+    def variance(self) -> float:
+        """
+        Returns the sample variance of the window, or NaN with fewer than two values.
+        """
+        n = len(self)
+        if n < 2:
+            return math.nan
+        return max(0.0, (self._sum_sq - self._sum * self._sum / n) / (n - 1))
+
+    @property
+    def std(self) -> float:
+        """
+        Returns the sample standard deviation of the window.
+        """
+        return math.sqrt(self.variance)
+
+    def update(self, x: float) -> None:
+        """
+        Adds a value, evicting the oldest one once the window is full.
+
+        Args:
+            x (float): The new value.
+        """
+        if self.count >= self.size:
+            old = self._values[self._next]
+            self._sum -= old
+            self._sum_sq -= old * old
+        self._values[self._next] = x
+        self._sum += x
+        self._sum_sq += x * x
+        self._next = (self._next + 1) % self.size
+        self.count += 1
+        self._since_refresh += 1
+        if self._since_refresh >= self.size:
+            self._refresh()
+
+    def update_many(self, values: np.ndarray) -> None:
+        """
+        Adds a batch of values with vectorized slice updates, in O(batch size) time.
+
+        Args:
+            values (np.ndarray): The new values, oldest first.
+        """
+        values = np.asarray(values, dtype=np.float64)[-self.size:]
+        n = values.size
+        if n == 0:
+            return
+        head = min(n, self.size - self._next)
+        # Slots that were never filled still hold zeros, so subtracting every overwritten slot is exact.
+        slices = ((self._values[self._next:self._next + head], values[:head]), (self._values[:n - head], values[head:]))
+        for target, new in slices:
+            self._sum += float(new.sum() - target.sum())
+            self._sum_sq += float(new @ new - target @ target)
+            target[:] = new
+        self._next = (self._next + n) % self.size
+        self.count += n
+        self._since_refresh += n
+        if self._since_refresh >= self.size:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        window = self._values[:len(self)]
+        self._sum = float(window.sum())
+        self._sum_sq = float(window @ window)
+        self._since_refresh = 0
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate using the P-square algorithm (Jain and Chlamtac, 1985).
+
+    Five markers track the minimum, the target quantile, the quantiles halfway to it and the
+    maximum; each update adjusts them with a parabolic interpolation in O(1) time and memory.
+    """
+
+    def __init__(self, q: float) -> None:
+        """
+        Initializes the estimator.
+
+        Args:
+            q (float): The quantile to estimate, between 0 and 1.
+        """
+        if not 0 < q < 1:
+            raise ValueError("q must be in (0, 1).")
+        self.q = q
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        # Desired marker positions grow linearly with the count, so they are derived instead of stored.
+        self._initial_desired = (0.0, 1.0 + 2 * q, 1.0 + 4 * q, 3.0 + 2 * q)
+        self._increments = (0.0, q / 2, q, (1 + q) / 2)
+
+    @property
+    def value(self) -> float:
+        """
+        Returns the current estimate, or NaN before the first value.
+        """
+        if self.count >= 5:
+            return self._heights[2]
+        if not self._heights:
+            return math.nan
+        ordered = sorted(self._heights)
+        return ordered[min(len(ordered) - 1, int(self.q * len(ordered)))]
+
+    def update(self, x: float) -> None:
+        """
+        Adds a value.
+
+        Args:
+            x (float): The new value.
+        """
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(x)
+            if self.count == 5:
+                heights.sort()
+            return
+
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= heights[k + 1]:
+                k += 1
+
+        positions = self._positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+
+        observed = self.count - 5
+        for i in (1, 2, 3):
+            d = self._initial_desired[i] + observed * self._increments[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or (d <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+
+class StreamingStats:
+    """
+    Constant-memory summary of a metric stream: an EWMA, rolling mean and variance over one or
+    more windows, and P-square estimates of selected quantiles. Every update is O(1).
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[int] = (100,),
+        alpha: float = 0.1,
+        quantiles: Sequence[float] = (0.5, 0.95, 0.99),
+    ) -> None:
+        """
+        Initializes the summary.
+
+        Args:
+            windows (Sequence[int]): Sizes of the rolling windows.
+            alpha (float): Smoothing factor of the EWMA.
+            quantiles (Sequence[float]): Quantiles to estimate, between 0 and 1.
+        """
+        self.count = 0
+        self.ewma = EWMA(alpha)
+        self.windows: Dict[int, RollingWindow] = {size: RollingWindow(size) for size in windows}
+        self.quantiles: Dict[float, P2Quantile] = {q: P2Quantile(q) for q in quantiles}
+
+    def update(self, x: float) -> None:
+        """
+        Adds a value.
+
+        Args:
+            x (float): The new value.
+        """
+        self.count += 1
+        self.ewma.update(x)
+        for window in self.windows.values():
+            window.update(x)
+        for sketch in self.quantiles.values():
+            sketch.update(x)
+
+    def update_many(self, values: Sequence[float]) -> None:
+        """
+        Adds a batch of values. The EWMA and windows are updated with vectorized operations.
+
+        Args:
+            values (Sequence[float]): The new values, oldest first.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self.count += values.size
+        self.ewma.update_many(values)
+        for window in self.windows.values():
+            window.update_many(values)
+        if self.quantiles:
+            as_floats = values.tolist()
+            for sketch in self.quantiles.values():
+                update = sketch.update
+                for x in as_floats:
+                    update(x)
+
+    def window(self, size: Optional[int] = None) -> RollingWindow:
+        """
+        Returns a rolling window by size, or the first configured window.
+
+        Args:
+            size (Optional[int]): The window size.
+
+        Returns:
+            RollingWindow: The window.
+        """
+        return self.windows[size] if size is not None else next(iter(self.windows.values()))
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Returns the current statistics as a flat dictionary, e.g. {'ewma': ..., 'mean_100': ..., 'p99': ...}.
+
+        Returns:
+            Dict[str, float]: The statistics.
+        """
+        result = {"count": float(self.count), "ewma": float(self.ewma.value) if self.ewma.value is not None else math.nan}
+        for size, window in self.windows.items():
+            result[f"mean_{size}"] = window.mean
+            result[f"std_{size}"] = window.std if len(window) > 1 else math.nan
+        for q, sketch in self.quantiles.items():
+            result[f"p{q * 100:g}"] = float(sketch.value)
+        return result
+
@@ -0,0 +1,179 @@
+from urllib.parse import quote
+from typing import Sequence
+from typing import Optional
+from typing import Tuple
+from typing import Dict
+import numpy as np
+import os
+
+
+class ColumnarMetricStore:
+    """
+    Append-only, columnar time-series store for the metrics of one model.
+
+    Every column lives in its own raw file (float64 timestamps, float32 metric values) inside the
+    model's directory, so appending is a plain file write and reading maps the files with np.memmap
+    without loading them into memory. Timestamps are kept in non-decreasing order, which makes the
+    timestamp column its own index: range queries binary-search it and only touch the pages they return.
+    """
+
+    COLUMNS: Tuple[str, ...] = ("accuracy", "loss")
+
+    def __init__(self, directory: str, model_name: str) -> None:
+        """
+        Opens (or creates) the store of a model.
+
+        Args:
+            directory (str): Root directory holding one subdirectory per model.
+            model_name (str): The name of the model; its directory is the percent-encoded name.
+
+        Raises:
+            ValueError: If the name is empty or made only of dots.
+        """
+        if not model_name.strip("."):
+            raise ValueError(f"Invalid model name for a metric store: {model_name!r}")
+        self.model_name = model_name
+        # Percent-encoding is reversible, so different names never share a directory, and it
+        # escapes path separators; names made only of dots are rejected above.
+        self.path = os.path.join(directory, quote(model_name, safe=""))
+        os.makedirs(self.path, exist_ok=True)
+        paths = {
+            name: (os.path.join(self.path, f"{name}.{suffix}"), itemsize)
+            for name, suffix, itemsize in [("timestamps", "f64", 8)] + [(column, "f32", 4) for column in self.COLUMNS]
+        }
+        # A crash between column writes leaves columns of different lengths. Cut every column back
+        # to the complete rows before appending, or the columns would stay misaligned for good.
+        sizes = {name: os.path.getsize(path) if os.path.exists(path) else 0 for name, (path, _) in paths.items()}
+        rows = min(sizes[name] // itemsize for name, (_, itemsize) in paths.items())
+        for name, (path, itemsize) in paths.items():
+            if sizes[name] > rows * itemsize:
+                os.truncate(path, rows * itemsize)
+        self._files = {name: open(path, "ab") for name, (path, _) in paths.items()}
+        self._maps: Dict[str, np.ndarray] = {}
+        self._mapped_rows = -1
+        self._dirty = False
+        timestamps = self._columns()["timestamps"]
+        self._last_timestamp = float(timestamps[-1]) if len(timestamps) else -np.inf
+
+    def __len__(self) -> int:
+        return len(self._columns()["timestamps"])
+
+    def append(self, timestamps: Sequence[float], accuracy: Sequence[float], loss: Sequence[float]) -> None:
+        """
+        Appends a batch of points. A batch is sorted by timestamp if necessary; points older than
+        the newest stored point are stamped with that point's time to keep the index ordered.
+
+        Args:
+            timestamps (Sequence[float]): Wall-clock times of the points.
+            accuracy (Sequence[float]): Accuracy values.
+            loss (Sequence[float]): Loss values.
+        """
+        stamps = np.asarray(timestamps, dtype=np.float64)
+        if stamps.size == 0:
+            return
+        values = [np.asarray(accuracy, dtype=np.float32), np.asarray(loss, dtype=np.float32)]
+        if np.any(stamps[1:] < stamps[:-1]):
+            order = np.argsort(stamps, kind="stable")
+            stamps, values = stamps[order], [column[order] for column in values]
+        stamps = np.maximum(stamps, self._last_timestamp)
+        self._last_timestamp = float(stamps[-1])
+
+        self._files["timestamps"].write(stamps.tobytes())
+        for name, column in zip(self.COLUMNS, values):
+            self._files[name].write(column.tobytes())
+        self._dirty = True
+
+    def flush(self) -> None:
+        """
+        Writes buffered points to disk so that queries, including those of other processes, see them.
+        """
+        if self._dirty:
+            for file in self._files.values():
+                file.flush()
+            self._dirty = False
+
+    def close(self) -> None:
+        """
+        Flushes and closes the column files. Arrays returned earlier remain readable.
+        """
+        self.flush()
+        for file in self._files.values():
+            file.close()
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        self.flush()
+        # Columns grow one after another, so a reader can see a partly appended batch; only complete rows count.
+        rows = min(os.path.getsize(file.name) // (8 if name == "timestamps" else 4) for name, file in self._files.items())
+        if rows != self._mapped_rows:
+            # Remapping only happens when the files grew; mapped arrays handed out earlier stay valid.
+            self._maps = {}
+            for name, file in self._files.items():
+                dtype = np.float64 if name == "timestamps" else np.float32
+                self._maps[name] = np.memmap(file.name, dtype=dtype, mode="r", shape=(rows,)) if rows else np.zeros(0, dtype=dtype)
+            self._mapped_rows = rows
+        return self._maps
+
+    def _bounds(self, timestamps: np.ndarray, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, end, side="left"))
+        return lo, max(lo, hi)
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns the points with start <= timestamp < end as read-only memory-mapped slices.
+
+        Args:
+            start (Optional[float]): Inclusive lower bound; None starts at the first point.
+            end (Optional[float]): Exclusive upper bound; None ends after the last point.
+
+        Returns:
+            Dict[str, np.ndarray]: The 'timestamps', 'accuracy' and 'loss' columns of the range.
+        """
+        columns = self._columns()
+        lo, hi = self._bounds(columns["timestamps"], start, end)
+        return {name: column[lo:hi] for name, column in columns.items()}
+
+    def downsample(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        buckets: int = 1000,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Aggregates a range into equal-width time buckets, e.g. one per dashboard pixel.
+
+        Args:
+            start (Optional[float]): Inclusive lower bound; None starts at the first point.
+            end (Optional[float]): Exclusive upper bound; None ends after the last point.
+            buckets (int): Number of time buckets; empty buckets are omitted.
+
+        Returns:
+            Dict[str, np.ndarray]: 'timestamps' (bucket start), 'count', and '<column>_mean',
+            '<column>_min' and '<column>_max' for every metric column.
+        """
+        columns = self._columns()
+        timestamps = columns["timestamps"]
+        lo, hi = self._bounds(timestamps, start, end)
+        result: Dict[str, np.ndarray] = {"timestamps": np.zeros(0), "count": np.zeros(0, dtype=np.int64)}
+        if hi == lo:
+            for name in self.COLUMNS:
+                for stat in ("mean", "min", "max"):
+                    result[f"{name}_{stat}"] = np.zeros(0, dtype=np.float32)
+            return result
+
+        first = float(timestamps[lo]) if start is None else start
+        last = float(timestamps[hi - 1]) if end is None else end
+        edges = np.linspace(first, last, buckets + 1)
+        # Bucket boundaries are found by binary search, so only the rows in the range are read.
+        offsets = lo + np.searchsorted(timestamps[lo:hi], edges[:-1], side="left")
+        counts = np.diff(np.append(offsets, hi))
+        non_empty = counts > 0
+        starts = offsets[non_empty] - lo
+        result["timestamps"] = edges[:-1][non_empty]
+        result["count"] = counts[non_empty]
+        for name in self.COLUMNS:
+            values = columns[name][lo:hi]
+            result[f"{name}_mean"] = (np.add.reduceat(values, starts, dtype=np.float64) / result["count"]).astype(np.float32)
+            result[f"{name}_min"] = np.minimum.reduceat(values, starts)
+            result[f"{name}_max"] = np.maximum.reduceat(values, starts)
+        return result
@@ -0,0 +1,56 @@
+from src.config.logging import logger
+from src.cache.semantic import HashingEmbedder
+from typing import Sequence
+from typing import List
+import numpy as np
+
+
+class EmbeddingModel:
+    """
+    Text embedding model used as a lazily loaded ModelFactory plugin.
+
+    Importing this module pulls in numpy, standing in for the heavy framework imports of a real
+    model. It implements the BaseModel interface (predict, predict_batch and memory_footprint_bytes)
+    without depending on the factory example, the way a third-party plugin would.
+    """
+    memory_footprint_bytes = 300 * 1024 ** 2
+
+    def __init__(self, model_name: str = 'base_model', pretrained: bool = False, dim: int = 256) -> None:
+        """
+        Initializes the embedding model.
+
+        Args:
+            model_name (str): The name of the model.
+            pretrained (bool): Flag to indicate if pre-trained weights should be loaded.
+            dim (int): Number of dimensions of the embeddings.
+        """
+        self.model_name = model_name
+        self.pretrained = pretrained
+        logger.info("Initializing embedding model %s with %s dimensions", model_name, dim)
+        self._embedder = HashingEmbedder(dim=dim)
+
+    def predict(self, text: str) -> List[float]:
+        """
+        Embeds the input text.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            List[float]: The unit-length embedding.
+        """
+        return self._embedder.embed(text).tolist()
+
+    def predict_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        """
+        Embeds a batch of texts.
+
+        Args:
+            texts (Sequence[str]): The input texts.
+
+        Returns:
+            List[List[float]]: One embedding per input text, in input order.
+        """
+        if not texts:
+            return []
+        return np.stack([self._embedder.embed(text) for text in texts]).tolist()
@@ -37,16 +37,16 @@ class ModelConfig:
 if __name__ == "__main__":
     # Creating the first instance of ModelConfig
     config1 = ModelConfig()
-    logger.info(f"Config1 Instance: {config1}")
-    logger.info(f"Model Name: {config1.model_name}")
+    logger.info("Config1 Instance: %s", config1)
+    logger.info("Model Name: %s", config1.model_name)
 
     # Attempting to create a second instance, should return the same instance as config1
     config2 = ModelConfig()
-    logger.info(f"Config2 Instance: {config2}")
+    logger.info("Config2 Instance: %s", config2)
 
     # Asserting that both variables point to the same instance
     assert config1 is config2
     logger.info("Config1 and Config2 are the same instance.")
 
     # Logging model name from the singleton instance
-    logger.info(f"Model Name from Config1: {config1.model_name}")
+    logger.info("Model Name from Config1: %s", config1.model_name)
@@ -1,9 +1,26 @@
 from src.config.logging import logger 
+from src.serving.batching import MicroBatcher
+from src.serving.workers import ProcessWorkerPool
+from src.serving.registry import ModelRegistry
+from src.serving.registry import EntryPoint
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Sequence
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from typing import List
+from typing import Type
 from typing import Any 
+import threading
 
 
 class BaseModel(ABC):
+    # Approximate resident size of the loaded weights; used to keep the model pool within its memory budget.
+    memory_footprint_bytes: int = 100 * 1024 ** 2
+
     def __init__(self, model_name: str = 'base_model', pretrained: bool = False) -> None:
         """
         Initialize the base model.
@@ -22,10 +39,10 @@ class BaseModel(ABC):
         Initializes the model, either by loading pre-trained weights or initializing from scratch.
         """
         if self.pretrained:
-            logger.info(f"Loading pre-trained weights for {self.model_name}")
+            logger.info("Loading pre-trained weights for %s", self.model_name)
             # Here, you would load the actual model weights.
         else:
-            logger.info(f"Initializing {self.model_name} from scratch")
+            logger.info("Initializing %s from scratch", self.model_name)
             # Here, you would initialize the model's parameters.
 
     @abstractmethod
@@ -41,11 +58,27 @@ class BaseModel(ABC):
         """
         raise NotImplementedError("Subclasses must implement the predict method")
 
+    def predict_batch(self, texts: Sequence[str]) -> List[Any]:
+        """
+        Predicts a batch of texts. Subclasses should override this with a vectorized
+        implementation; the default simply calls predict for every text.
+
+        Args:
+            texts (Sequence[str]): The input texts for prediction.
+        
+        Returns:
+            List[Any]: One prediction result per input text, in input order.
+        """
+        predict = self.predict
+        return [predict(text) for text in texts]
+
 
 class TextClassificationModel(BaseModel):
     """
     Model for text classification tasks.
     """
+    memory_footprint_bytes = 450 * 1024 ** 2
+
     def predict(self, text: str) -> str:
         """
         Predicts the class of the input text.
@@ -59,11 +92,27 @@ class TextClassificationModel(BaseModel):
         # Replace with actual classification logic.
         return f"Classifying text with {self.model_name}: {text}"
 
+    def predict_batch(self, texts: Sequence[str]) -> List[str]:
+        """
+        Classifies a batch of texts in one pass.
+
+        Args:
+            texts (Sequence[str]): The input texts.
+        
+        Returns:
+            List[str]: The classification results, in input order.
+        """
+        # Replace with a single batched forward pass; the shared prefix is built once per batch.
+        prefix = f"Classifying text with {self.model_name}: "
+        return [prefix + text for text in texts]
+
 
 class SummarizationModel(BaseModel):
     """
     Model for text summarization tasks.
     """
+    memory_footprint_bytes = 1600 * 1024 ** 2
+
     def predict(self, text: str) -> str:
         """
         Summarizes the input text.
@@ -77,11 +126,27 @@ class SummarizationModel(BaseModel):
         # Replace with actual summarization logic.
         return f"Summarizing text with {self.model_name}: {text}"
 
+    def predict_batch(self, texts: Sequence[str]) -> List[str]:
+        """
+        Summarizes a batch of texts in one pass.
+
+        Args:
+            texts (Sequence[str]): The input texts.
+        
+        Returns:
+            List[str]: The summarization results, in input order.
+        """
+        # Replace with a single batched forward pass; the shared prefix is built once per batch.
+        prefix = f"Summarizing text with {self.model_name}: "
+        return [prefix + text for text in texts]
+
 
 class TranslationModel(BaseModel):
     """
     Model for text translation tasks.
     """
+    memory_footprint_bytes = 1200 * 1024 ** 2
+
     def predict(self, text: str) -> str:
         """
         Translates the input text.
@@ -95,18 +160,225 @@ class TranslationModel(BaseModel):
         # Replace with actual translation logic.
         return f"Translating text with {self.model_name}: {text}"
 
+    def predict_batch(self, texts: Sequence[str]) -> List[str]:
+        """
+        Translates a batch of texts in one pass.
+
+        Args:
+            texts (Sequence[str]): The input texts.
+        
+        Returns:
+            List[str]: The translation results, in input order.
+        """
+        # Replace with a single batched forward pass; the shared prefix is built once per batch.
+        prefix = f"Translating text with {self.model_name}: "
+        return [prefix + text for text in texts]
+
+
+class ProcessPoolModel(BaseModel):
+    """
+    Proxy that serves a model from a pool of worker processes, so CPU-bound predictions are not
+    serialized by the GIL. Every worker loads its own copy of the weights once at startup.
+    """
+
+    def __init__(self, model_class: Type[BaseModel], num_workers: Optional[int] = None, **kwargs: Any) -> None:
+        """
+        Starts the worker processes.
+
+        Args:
+            model_class (Type[BaseModel]): The model class hosted by each worker.
+            num_workers (Optional[int]): Number of worker processes; defaults to the CPU count.
+            **kwargs (Any): Arguments passed to the model's constructor inside every worker.
+        """
+        self.model_class = model_class
+        self.num_workers = num_workers
+        self._model_kwargs = kwargs
+        super().__init__(model_name=kwargs.get('model_name', 'base_model'), pretrained=kwargs.get('pretrained', False))
+
+    def _initialize_model(self) -> None:
+        """
+        Starts the workers instead of loading weights in this process.
+        """
+        logger.info("Starting worker processes for %s", self.model_name)
+        self._workers = ProcessWorkerPool(self.model_class, self._model_kwargs, num_workers=self.num_workers)
+        self.num_workers = self._workers.num_workers
+        self.memory_footprint_bytes = self.model_class.memory_footprint_bytes * self.num_workers
+
+    def predict(self, text: str) -> Any:
+        """
+        Predicts a single text in one of the workers.
+
+        Args:
+            text (str): The input text for prediction.
+        
+        Returns:
+            Any: The prediction result.
+        """
+        return self._workers.predict_batch([text])[0]
+
+    def predict_batch(self, texts: Sequence[str]) -> List[Any]:
+        """
+        Predicts a batch of texts, split across the workers when it is large enough.
+
+        Args:
+            texts (Sequence[str]): The input texts for prediction.
+        
+        Returns:
+            List[Any]: One prediction result per input text, in input order.
+        """
+        return self._workers.predict_batch(texts)
+
+    def close(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        self._workers.close()
+
+
+PoolKey = Tuple[str, str, bool]
+
+
+@dataclass
+class PoolStats:
+    """
+    Counters describing how the model pool has been used.
+    """
+    loads: int = 0
+    reuses: int = 0
+    evictions: int = 0
+
+
+class ModelPool:
+    """
+    Pool of loaded models keyed by (task_type, model_name, pretrained), bounded by a memory budget.
+
+    A model is constructed the first time its key is requested and reused afterwards. When the
+    summed footprint of the pooled models exceeds the budget, the least recently used models are
+    dropped from the pool. Callers still holding an evicted model can keep using it.
+    """
+
+    def __init__(self, max_memory_bytes: int) -> None:
+        """
+        Initializes an empty pool.
+
+        Args:
+            max_memory_bytes (int): Memory budget for all pooled models together.
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.used_memory_bytes = 0
+        self.stats = PoolStats()
+        self._models: 'OrderedDict[PoolKey, BaseModel]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[PoolKey, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, key: PoolKey) -> bool:
+        return key in self._models
+
+    def _reuse(self, key: PoolKey) -> Any:
+        model = self._models.get(key)
+        if model is not None:
+            self._models.move_to_end(key)
+            self.stats.reuses += 1
+        return model
+
+    def get_or_load(self, key: PoolKey, loader: Callable[[], BaseModel]) -> BaseModel:
+        """
+        Returns the pooled model for a key, loading it on first use.
+
+        Loading happens outside the pool lock, so a slow load does not block reuse of other models;
+        concurrent requests for the same key wait for a single load.
+
+        Args:
+            key (PoolKey): The (task_type, model_name, pretrained) key.
+            loader (Callable[[], BaseModel]): Constructs the model when it is not pooled.
+
+        Returns:
+            BaseModel: The pooled model instance.
+        """
+        with self._lock:
+            model = self._reuse(key)
+            if model is not None:
+                return model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                model = self._reuse(key)
+                if model is not None:
+                    return model
+
+            try:
+                model = loader()
+                with self._lock:
+                    self._models[key] = model
+                    self.used_memory_bytes += model.memory_footprint_bytes
+                    self.stats.loads += 1
+                    self._evict_over_budget(keep=key)
+            finally:
+                # Also dropped when the load fails; threads still waiting on it retry the load.
+                with self._lock:
+                    if self._load_locks.get(key) is load_lock:
+                        del self._load_locks[key]
+            logger.info("Pooled %s; pool uses %.0f MiB", key, self.used_memory_bytes / 1024 ** 2)
+            return model
+
+    def _evict_over_budget(self, keep: PoolKey) -> None:
+        while self.used_memory_bytes > self.max_memory_bytes and len(self._models) > 1:
+            key, model = next(iter(self._models.items()))
+            if key == keep:
+                break
+            del self._models[key]
+            self.used_memory_bytes -= model.memory_footprint_bytes
+            self.stats.evictions += 1
+            logger.info("Evicted %s from the model pool.", key)
+
+    def clear(self) -> None:
+        """
+        Drops every pooled model.
+        """
+        with self._lock:
+            self._models.clear()
+            self.used_memory_bytes = 0
+
 
 class ModelFactory:
     """
     Factory class to create models based on the task type.
+    Models are kept in a shared pool, so repeated requests reuse loaded weights.
+    Task types are looked up in a registry built once; plugins registered as 'module:Class'
+    entry points are only imported the first time their task type is requested.
     """
+    pool = ModelPool(max_memory_bytes=4 * 1024 ** 3)
+    registry = ModelRegistry({
+        'classification': TextClassificationModel,
+        'summarization': SummarizationModel,
+        'translation': TranslationModel,
+        'embedding': 'src.models.embedding:EmbeddingModel',
+    })
+
+    @staticmethod
+    def register(task_type: str, target: EntryPoint) -> None:
+        """
+        Registers a model for a task type.
+
+        Args:
+            task_type (str): The task type, e.g. 'sentiment'.
+            target (EntryPoint): The model class, or a lazy 'package.module:ClassName' entry point.
+        """
+        ModelFactory.registry.register(task_type, target)
+
     @staticmethod
     def create_model(task_type: str, **kwargs: Any) -> BaseModel:
         """
         Factory method to create models based on the task type.
+        Returns the pooled instance when a model with the same task type, name and
+        pretrained flag was created before and has not been evicted.
 
         Args:
-            task_type (str): The type of task ('classification', 'summarization', 'translation').
+            task_type (str): A registered task type ('classification', 'summarization', 'translation', 'embedding').
             **kwargs (Any): Additional arguments to pass to the model's constructor.
         
         Returns:
@@ -115,21 +387,48 @@ class ModelFactory:
         Raises:
             ValueError: If the task type is unknown.
         """
-        logger.info(f"Creating model for task type: {task_type}")
-        
-        task_map: dict[str, Type[BaseModel]] = {
-            'classification': TextClassificationModel,
-            'summarization': SummarizationModel,
-            'translation': TranslationModel
-        }
+        logger.info("Creating model for task type: %s", task_type)
+        model_class = ModelFactory._model_class(task_type)
+        key = (task_type, kwargs.get('model_name', 'base_model'), kwargs.get('pretrained', False))
+        return ModelFactory.pool.get_or_load(key, lambda: model_class(**kwargs))
+
+    @staticmethod
+    def create_process_model(task_type: str, num_workers: Optional[int] = None, **kwargs: Any) -> ProcessPoolModel:
+        """
+        Creates a model served by a pool of worker processes for CPU-bound prediction.
+        Process models own their workers, so they are not pooled; call close() when done.
+
+        Args:
+            task_type (str): A registered task type ('classification', 'summarization', 'translation', 'embedding').
+            num_workers (Optional[int]): Number of worker processes; defaults to the CPU count.
+            **kwargs (Any): Additional arguments to pass to the model's constructor in every worker.
         
-        model_class = task_map.get(task_type)
+        Returns:
+            ProcessPoolModel: A proxy implementing the BaseModel interface.
         
-        if model_class is None:
-            logger.error(f"Unknown task type: {task_type}")
+        Raises:
+            ValueError: If the task type is unknown.
+        """
+        logger.info("Creating process-backed model for task type: %s", task_type)
+        return ProcessPoolModel(ModelFactory._model_class(task_type), num_workers=num_workers, **kwargs)
+
+    @staticmethod
+    def _model_class(task_type: str) -> Type[BaseModel]:
+        try:
+            return ModelFactory.registry.resolve(task_type)
+        except KeyError:
+            logger.error("Unknown task type: %s", task_type)
             raise ValueError(f"Unknown task type: {task_type}")
-        
-        return model_class(**kwargs)
+
+    @staticmethod
+    def pool_stats() -> PoolStats:
+        """
+        Returns the load, reuse and eviction counters of the shared model pool.
+
+        Returns:
+            PoolStats: The pool statistics.
+        """
+        return ModelFactory.pool.stats
 
 
 if __name__ == "__main__":
@@ -139,5 +438,34 @@ if __name__ == "__main__":
 
         summarization_model = ModelFactory.create_model('summarization', model_name='gpt_summarizer', pretrained=False)
         logger.info(summarization_model.predict("This is a long article that needs summarization."))
+
+        # The second request for the same model reuses the pooled instance instead of reloading weights
+        same_classifier = ModelFactory.create_model('classification', model_name='bert_classifier', pretrained=True)
+        assert same_classifier is classification_model
+
+        # Classify several texts in a single batched call
+        logger.info(classification_model.predict_batch(["First text.", "Second text.", "Third text."]))
+
+        # Serve single requests from many threads; the micro-batcher groups them into predict_batch calls
+        with MicroBatcher(classification_model, max_batch_size=16, max_wait_ms=5) as batcher:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                results = list(pool.map(batcher.predict, [f"Request {i}" for i in range(64)]))
+        logger.info("Served %s requests in %s batches; last result: %s", len(results), batcher.stats.batches, results[-1])
+
+        # Host a translator in worker processes; each worker loads the weights once
+        process_translator = ModelFactory.create_process_model('translation', num_workers=2, model_name='marian_translator')
+        try:
+            logger.info(process_translator.predict_batch([f"Sentence {i}." for i in range(64)])[-1])
+        finally:
+            process_translator.close()
+
+        # The embedding plugin and its numpy dependency are imported on this first request
+        embedding_model = ModelFactory.create_model('embedding', model_name='hashing_embedder')
+        logger.info("Embedding has %s dimensions", len(embedding_model.predict('This is an example text.')))
+
+        # Loading a second summarizer exceeds the 4 GiB budget and evicts the least recently used model
+        ModelFactory.create_model('translation', model_name='marian_translator', pretrained=True)
+        ModelFactory.create_model('summarization', model_name='pegasus_summarizer', pretrained=True)
+        logger.info("Model pool stats: %s", ModelFactory.pool_stats())
     except ValueError as e:
-        logger.error(f"Error occurred: {e}")
+        logger.error("Error occurred: %s", e)
@@ -1,22 +1,74 @@
 from src.config.logging import logger 
+from src.metrics.ring import MetricRingBuffer
+from src.metrics.delivery import ObserverChannel
+from src.metrics.delivery import DeliveryStats
+from src.metrics.streaming import StreamingStats
+from src.metrics.timeseries import ColumnarMetricStore
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
 from typing import Optional
+from typing import Tuple
+from typing import Union
 from typing import Dict 
+from typing import List
+import numpy as np
+import threading
+import asyncio
+import random
+import queue
+import time
+
+
+_STOP = object()
 
 
 class ModelPerformanceObserver:
     """
     Observer class that monitors and logs model performance metrics such as accuracy and loss.
-    Alerts when performance metrics fall below predefined thresholds.
+    Alerts when the rolling mean accuracy falls below a threshold, so single noisy points do not
+    trigger alerts, and counts anomalous points that lie far outside the rolling window.
+    Statistics are kept in constant memory and every update is O(1).
     """
     
-    def __init__(self, model_name: str) -> None:
+    def __init__(
+        self,
+        model_name: str,
+        accuracy_threshold: float = 0.7,
+        window: int = 100,
+        min_samples: int = 10,
+        alpha: float = 0.1,
+        anomaly_zscore: float = 4.0,
+        quantiles: Sequence[float] = (0.5, 0.95, 0.99),
+    ) -> None:
         """
         Initializes the observer with the model name.
 
         Args:
             model_name (str): The name of the model being observed.
+            accuracy_threshold (float): Alert when the rolling mean accuracy falls below this value.
+            window (int): Number of most recent updates in the rolling window.
+            min_samples (int): Number of updates needed before alerts and anomalies are evaluated.
+            alpha (float): Smoothing factor of the EWMA.
+            anomaly_zscore (float): Distance from the rolling mean, in standard deviations, that marks a point as anomalous.
+            quantiles (Sequence[float]): Quantiles estimated for accuracy and loss.
         """
         self.model_name = model_name
+        self.accuracy_threshold = accuracy_threshold
+        self.min_samples = min_samples
+        self.anomaly_zscore = anomaly_zscore
+        self.accuracy = StreamingStats(windows=(window,), alpha=alpha, quantiles=quantiles)
+        self.loss = StreamingStats(windows=(window,), alpha=alpha, quantiles=quantiles)
+        self.alerting = False
+        self.anomalies = 0
+
+    def statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the streaming statistics of accuracy and loss.
+
+        Returns:
+            Dict[str, Dict[str, float]]: EWMA, rolling mean and standard deviation, and quantiles per metric.
+        """
+        return {"accuracy": self.accuracy.snapshot(), "loss": self.loss.snapshot()}
 
     def update(self, accuracy: float, loss: float) -> None:
         """
@@ -26,45 +78,178 @@ class ModelPerformanceObserver:
             accuracy (float): The accuracy of the model.
             loss (float): The loss value of the model.
         """
-        if accuracy < 0.7:
-            logger.warning(f"Alert: {self.model_name} accuracy dropped below threshold!")
-        logger.info(f"Pushed Data for {self.model_name} - Accuracy: {accuracy}, Loss: {loss}")
+        anomalies = int(self._is_anomaly(self.accuracy, accuracy) or self._is_anomaly(self.loss, loss))
+        self.accuracy.update(accuracy)
+        self.loss.update(loss)
+        self._evaluate(anomalies, 1)
+        logger.info("Pushed Data for %s - Accuracy: %s, Loss: %s", self.model_name, accuracy, loss)
+
+    def update_batch(self, timestamps: np.ndarray, accuracy: np.ndarray, loss: np.ndarray) -> None:
+        """
+        Updates the observer with a coalesced batch of metrics, logging once per batch.
+
+        Args:
+            timestamps (np.ndarray): Wall-clock times of the points.
+            accuracy (np.ndarray): The accuracy values, oldest first.
+            loss (np.ndarray): The loss values, oldest first.
+        """
+        anomalies = self._count_anomalies(accuracy, loss)
+        self.accuracy.update_many(accuracy)
+        self.loss.update_many(loss)
+        self._evaluate(anomalies, len(accuracy))
+        logger.info("Pushed %s points for %s - Last accuracy: %.4f, Last loss: %.4f", len(accuracy), self.model_name, accuracy[-1], loss[-1])
+
+    def _is_anomaly(self, stats: StreamingStats, value: float) -> bool:
+        window = stats.window()
+        if len(window) < self.min_samples:
+            return False
+        std = window.std
+        return std > 0 and abs(value - window.mean) > self.anomaly_zscore * std
+
+    def _count_anomalies(self, accuracy: np.ndarray, loss: np.ndarray) -> int:
+        # New points are compared with the window as it was before they arrived.
+        anomalies = np.zeros(len(accuracy), dtype=bool)
+        for stats, values in ((self.accuracy, accuracy), (self.loss, loss)):
+            window = stats.window()
+            if len(window) < self.min_samples:
+                continue
+            std = window.std
+            if std > 0:
+                anomalies |= np.abs(values - window.mean) > self.anomaly_zscore * std
+        return int(np.count_nonzero(anomalies))
+
+    def _evaluate(self, anomalies: int, updates: int) -> None:
+        if anomalies:
+            self.anomalies += anomalies
+            logger.warning("Anomaly: %s of %s updates for %s deviate more than %s standard deviations from the rolling mean.", anomalies, updates, self.model_name, self.anomaly_zscore)
+
+        window = self.accuracy.window()
+        if len(window) < self.min_samples:
+            return
+        below = window.mean < self.accuracy_threshold
+        if below and not self.alerting:
+            logger.warning("Alert: %s accuracy dropped below threshold! Rolling mean over %s updates: %.4f", self.model_name, len(window), window.mean)
+        elif self.alerting and not below:
+            logger.info("%s accuracy recovered. Rolling mean over %s updates: %.4f", self.model_name, len(window), window.mean)
+        self.alerting = below
 
 
 class ModelMonitor:
     """
     Subject class that manages observers and notifies them of model performance updates.
     Implements the observer design pattern to monitor model performance.
+
+    Besides the synchronous notify, metrics can be ingested in batches with notify_many, or
+    submitted from hot loops with submit: events go into a queue that a background thread drains,
+    coalescing them into one batch per model. Every point is kept in a preallocated ring buffer per model.
+
+    A model can have many observers. Each one is delivered to inline, on a thread pool or on an
+    event loop through its own bounded queue, so a slow observer does not stall the sender.
+
+    With a store directory, the full history of every model is also persisted to a columnar,
+    memory-mapped time-series store that supports range queries and downsampling.
     """
     
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        buffer_capacity: int = 65_536,
+        max_batch_size: int = 4096,
+        delivery_workers: int = 4,
+        store_directory: Optional[str] = None,
+    ) -> None:
         """
         Initializes the ModelMonitor with an empty dictionary of observers.
+
+        Args:
+            buffer_capacity (int): Number of recent points kept per model.
+            max_batch_size (int): Maximum number of queued events coalesced into one drain cycle.
+            delivery_workers (int): Threads shared by the observers attached in 'thread' mode.
+            store_directory (Optional[str]): Directory for the persistent metric history; None keeps only the ring buffers.
         """
-        self._observers: Dict[str, ModelPerformanceObserver] = {}
+        # Observer tuples are replaced rather than mutated, so notifying never takes a lock.
+        self._observers: Dict[str, Tuple[ObserverChannel, ...]] = {}
+        self._observers_lock = threading.Lock()
+        self.delivery_workers = delivery_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.buffer_capacity = buffer_capacity
+        self.max_batch_size = max_batch_size
+        self._buffers: Dict[str, MetricRingBuffer] = {}
+        self._buffers_lock = threading.Lock()
+        self.store_directory = store_directory
+        self._stores: Dict[str, ColumnarMetricStore] = {}
+        self._queue: 'queue.SimpleQueue[Union[Tuple[str, float, float, float], threading.Event, object]]' = queue.SimpleQueue()
+        self._drainer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
 
-    def attach(self, model_name: str, observer: ModelPerformanceObserver) -> None:
+    def __enter__(self) -> 'ModelMonitor':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def attach(
+        self,
+        model_name: str,
+        observer: ModelPerformanceObserver,
+        mode: str = "inline",
+        max_queue_size: int = 1024,
+        drop_policy: str = "block",
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
         """
-        Attaches an observer to a specific model.
+        Attaches an observer to a specific model. Attaching the same observer twice has no effect.
 
         Args:
             model_name (str): The name of the model to be observed.
             observer (ModelPerformanceObserver): The observer instance to attach.
+            mode (str): Delivery mode: 'inline', 'thread' or 'asyncio'.
+            max_queue_size (int): Capacity of the observer's queue in 'thread' and 'asyncio' mode.
+            drop_policy (str): What to do when the queue is full: 'block', 'drop_newest' or 'drop_oldest'.
+            loop (Optional[asyncio.AbstractEventLoop]): Event loop for 'asyncio' mode; defaults to the running loop.
         """
-        if model_name not in self._observers:
-            self._observers[model_name] = observer
-            logger.info(f"Attached observer to {model_name}.")
+        with self._observers_lock:
+            channels = self._observers.get(model_name, ())
+            if any(channel.observer is observer for channel in channels):
+                return
+            if mode == "asyncio" and loop is None:
+                loop = asyncio.get_running_loop()
+            channel = ObserverChannel(observer, mode, max_queue_size, drop_policy, executor=self._delivery_executor, loop=loop)
+            self._observers[model_name] = channels + (channel,)
+        logger.info("Attached observer to %s.", model_name)
 
-    def detach(self, model_name: str) -> None:
+    def detach(self, model_name: str, observer: Optional[ModelPerformanceObserver] = None) -> None:
         """
-        Detaches an observer from a specific model.
+        Detaches one or all observers from a specific model. Queued notifications are still delivered.
 
         Args:
             model_name (str): The name of the model to stop observing.
+            observer (Optional[ModelPerformanceObserver]): The observer to detach; None detaches every observer.
+        """
+        with self._observers_lock:
+            channels = self._observers.get(model_name)
+            if not channels:
+                return
+            remaining = tuple(channel for channel in channels if observer is not None and channel.observer is not observer)
+            if len(remaining) == len(channels):
+                return
+            if remaining:
+                self._observers[model_name] = remaining
+            else:
+                del self._observers[model_name]
+        logger.info("Detached observer from %s.", model_name)
+
+    def delivery_stats(self, model_name: str) -> List[DeliveryStats]:
+        """
+        Returns the delivery counters and latencies of every observer of a model.
+
+        Args:
+            model_name (str): The name of the model.
+
+        Returns:
+            List[DeliveryStats]: One entry per attached observer.
         """
-        if model_name in self._observers:
-            del self._observers[model_name]
-            logger.info(f"Detached observer from {model_name}.")
+        return [channel.stats() for channel in self._observers.get(model_name, ())]
 
     def notify(self, model_name: str, accuracy: float, loss: float) -> None:
         """
@@ -75,12 +260,207 @@ class ModelMonitor:
             accuracy (float): The latest accuracy value.
             loss (float): The latest loss value.
         """
-        observer: Optional[ModelPerformanceObserver] = self._observers.get(model_name)
-        if observer:
-            logger.info(f"Notifying observer for {model_name}.")
-            observer.update(accuracy, loss)
+        self._record(model_name, (time.time(),), (accuracy,), (loss,))
+        channels = self._observers.get(model_name)
+        if channels:
+            for channel in channels:
+                channel.send("update", accuracy, loss)
         else:
-            logger.warning(f"No observer found for {model_name}.")
+            logger.warning("No observer found for %s.", model_name)
+
+    def notify_many(
+        self,
+        model_name: str,
+        accuracies: Sequence[float],
+        losses: Sequence[float],
+        timestamps: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Records a batch of metrics for a model and delivers it to every observer in a single call.
+
+        Args:
+            model_name (str): The name of the model being observed.
+            accuracies (Sequence[float]): The accuracy values, oldest first.
+            losses (Sequence[float]): The loss values, oldest first.
+            timestamps (Optional[Sequence[float]]): Wall-clock times of the points; defaults to now.
+        """
+        if len(accuracies) == 0:
+            return
+        accuracy = np.asarray(accuracies, dtype=np.float32)
+        loss = np.asarray(losses, dtype=np.float32)
+        stamps = np.full(len(accuracy), time.time()) if timestamps is None else np.asarray(timestamps, dtype=np.float64)
+        self._record(model_name, stamps, accuracy, loss)
+        channels = self._observers.get(model_name)
+        if channels:
+            for channel in channels:
+                channel.send("update_batch", stamps, accuracy, loss)
+        else:
+            logger.warning("No observer found for %s.", model_name)
+
+    def submit(self, model_name: str, accuracy: float, loss: float) -> None:
+        """
+        Queues a metric point without blocking; the background drainer delivers it in a batch.
+
+        Args:
+            model_name (str): The name of the model being observed.
+            accuracy (float): The latest accuracy value.
+            loss (float): The latest loss value.
+        """
+        if self._drainer is None:
+            self._start_drainer()
+        self._queue.put((model_name, time.time(), accuracy, loss))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every point submitted before the call has reached every observer. Must not be
+        called from the event loop thread of an observer attached in 'asyncio' mode.
+
+        Args:
+            timeout (Optional[float]): Maximum number of seconds to wait.
+
+        Returns:
+            bool: True if everything was delivered in time.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        if self._drainer is not None:
+            marker = threading.Event()
+            self._queue.put(marker)
+            if not marker.wait(timeout):
+                return False
+        for channels in list(self._observers.values()):
+            for channel in channels:
+                remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                if not channel.join(remaining):
+                    return False
+        with self._buffers_lock:
+            for store in self._stores.values():
+                store.flush()
+        return True
+
+    def close(self) -> None:
+        """
+        Delivers the queued points and stops the background drainer and the delivery threads.
+        Both are started again by the next notification.
+        """
+        with self._start_lock:
+            drainer, self._drainer = self._drainer, None
+        if drainer is not None:
+            self._queue.put(_STOP)
+            drainer.join()
+        for channels in list(self._observers.values()):
+            for channel in channels:
+                if channel.mode == "thread":
+                    channel.join()
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._buffers_lock:
+            for store in self._stores.values():
+                store.close()
+            self._stores = {}
+
+    def history(self, model_name: str, n: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the most recent points recorded for a model.
+
+        Args:
+            model_name (str): The name of the model.
+            n (int): Number of points to return; 0 returns everything kept.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Timestamps, accuracy and loss, oldest first.
+        """
+        with self._buffers_lock:
+            buffer = self._buffers.get(model_name)
+            if buffer is None:
+                empty = np.zeros(0, dtype=np.float32)
+                return np.zeros(0, dtype=np.float64), empty, empty
+            return buffer.latest(n)
+
+    def metric_store(self, model_name: str) -> ColumnarMetricStore:
+        """
+        Returns the persistent metric history of a model for range queries and downsampling.
+
+        Args:
+            model_name (str): The name of the model.
+
+        Returns:
+            ColumnarMetricStore: The model's store, with every recorded point flushed.
+
+        Raises:
+            ValueError: If the monitor was created without a store directory.
+        """
+        if self.store_directory is None:
+            raise ValueError("The monitor was created without a store directory.")
+        with self._buffers_lock:
+            store = self._store(model_name)
+            store.flush()
+            return store
+
+    def _record(self, model_name: str, timestamps: Sequence[float], accuracy: Sequence[float], loss: Sequence[float]) -> None:
+        with self._buffers_lock:
+            buffer = self._buffers.get(model_name)
+            if buffer is None:
+                buffer = self._buffers[model_name] = MetricRingBuffer(self.buffer_capacity)
+            buffer.extend(timestamps, accuracy, loss)
+            if self.store_directory is not None:
+                self._store(model_name).append(timestamps, accuracy, loss)
+
+    def _store(self, model_name: str) -> ColumnarMetricStore:
+        store = self._stores.get(model_name)
+        if store is None:
+            store = self._stores[model_name] = ColumnarMetricStore(self.store_directory, model_name)
+        return store
+
+    def _delivery_executor(self) -> ThreadPoolExecutor:
+        # Channels in 'thread' mode fetch the pool on every drain instead of caching it, so they
+        # keep working with a new pool after close() has shut the old one down.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.delivery_workers, thread_name_prefix="observer-delivery")
+            return self._executor
+
+    def _start_drainer(self) -> None:
+        with self._start_lock:
+            if self._drainer is None:
+                self._drainer = threading.Thread(target=self._drain, name="model-monitor-drainer", daemon=True)
+                self._drainer.start()
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # Coalesce everything queued meanwhile so observers see one batch per model.
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            pending: Dict[str, Tuple[List[float], List[float], List[float]]] = {}
+            for item in batch:
+                if type(item) is tuple:
+                    model_name, timestamp, accuracy, loss = item
+                    columns = pending.get(model_name)
+                    if columns is None:
+                        columns = pending[model_name] = ([], [], [])
+                    columns[0].append(timestamp)
+                    columns[1].append(accuracy)
+                    columns[2].append(loss)
+                    continue
+                self._deliver(pending)
+                pending = {}
+                if item is _STOP:
+                    return
+                item.set()
+            self._deliver(pending)
+
+    def _deliver(self, pending: Dict[str, Tuple[List[float], List[float], List[float]]]) -> None:
+        for model_name, (timestamps, accuracies, losses) in pending.items():
+            try:
+                self.notify_many(model_name, accuracies, losses, timestamps)
+            except Exception as e:
+                logger.error("Failed to deliver metrics for %s: %s", model_name, e)
 
 
 if __name__ == "__main__":
@@ -94,15 +474,50 @@ if __name__ == "__main__":
     monitor.attach("Model A", observer_a)
     monitor.attach("Model B", observer_b)
 
-    # Simulate model training for Model A
-    accuracy_a = 0.65
-    loss_a = 0.43
-    monitor.notify("Model A", accuracy_a, loss_a)  # Output: Alert: Model A accuracy dropped below threshold!
+    # Simulate model training for Model A, whose accuracy stays low
+    for step in range(20):
+        accuracy_a = 0.65 + 0.01 * (step % 3)
+        loss_a = 0.43
+        monitor.notify("Model A", accuracy_a, loss_a)  # Output: Alert: Model A accuracy dropped below threshold! (once)
+
+    # Simulate model training for Model B; a single noisy point does not trigger an alert
+    for step in range(20):
+        accuracy_b = 0.55 if step == 15 else 0.75
+        loss_b = 0.39
+        monitor.notify("Model B", accuracy_b, loss_b)  # Output: Pushed Data for Model B - Accuracy: 0.75, Loss: 0.39
+    logger.info("Model B accuracy statistics: %s", observer_b.statistics()['accuracy'])
+
+    # Stream per-step metrics from a training loop; they reach the observer in coalesced batches
+    # and are persisted under metrics/ for later range queries
+    with ModelMonitor(store_directory="metrics") as streaming_monitor:
+        streaming_monitor.attach("Model B", observer_b)
+        for step in range(10_000):
+            streaming_monitor.submit("Model B", random.gauss(0.8, 0.02), random.gauss(0.3, 0.02))
+        streaming_monitor.flush()
+        timestamps, accuracy, loss = streaming_monitor.history("Model B")
+        logger.info("Kept %s points for Model B; mean accuracy %.4f", len(accuracy), accuracy.mean())
+
+        store = streaming_monitor.metric_store("Model B")
+        recent = store.range(start=timestamps[-1] - 0.01)
+        dashboard = store.downsample(buckets=20)
+        logger.info("Stored %s points for Model B; %s in the last 10 ms; %s dashboard buckets", len(store), len(recent['accuracy']), len(dashboard['count']))
+
+    # A slow dashboard gets its own bounded queue on the thread pool, so it cannot stall the training loop
+    class SlowDashboard:
+        def update(self, accuracy: float, loss: float) -> None:
+            time.sleep(0.001)
+
+        def update_batch(self, timestamps: np.ndarray, accuracy: np.ndarray, loss: np.ndarray) -> None:
+            time.sleep(0.001)
 
-    # Simulate model training for Model B
-    accuracy_b = 0.75
-    loss_b = 0.39
-    monitor.notify("Model B", accuracy_b, loss_b)  # Output: Pushed Data for Model B - Accuracy: 0.75, Loss: 0.3
+    with ModelMonitor() as fan_out_monitor:
+        fan_out_monitor.attach("Model B", observer_b)
+        fan_out_monitor.attach("Model B", SlowDashboard(), mode="thread", max_queue_size=64, drop_policy="drop_oldest")
+        for step in range(200):
+            fan_out_monitor.notify("Model B", random.gauss(0.8, 0.02), random.gauss(0.3, 0.02))
+        fan_out_monitor.flush()
+        for stats in fan_out_monitor.delivery_stats("Model B"):
+            logger.info("%s (%s): delivered %s, dropped %s, p99 latency %.2f ms", stats.observer, stats.mode, stats.delivered, stats.dropped, stats.p99_latency_ms)
 
     # Deattach observer for Model A 
     monitor.detach("Model A")
\ No newline at end of file
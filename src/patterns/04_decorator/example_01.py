@@ -1,87 +1,266 @@
-from src.config.logging import logger 
+from src.config.logging import logger
+from typing import Iterable
+from typing import Iterator
 from typing import Callable
+from typing import Sequence
+from typing import Union
+from typing import List
+from typing import TYPE_CHECKING
+from typing import Any
+import itertools
+import sys
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+CHUNK_SIZE = 1024
+
+# NumPy is optional: it is only imported to process NumPy arrays, which cannot exist without it.
+Batch = Union[List[str], "np.ndarray"]
+
+
+class DataValidationError(ValueError):
+    """
+    Raised when data fails validation. Batch and stream modes report every invalid row at once.
+    """
+
+    def __init__(self, message: str, invalid_indices: Sequence[int]) -> None:
+        """
+        Initializes the error.
+
+        Args:
+            message (str): The error message.
+            invalid_indices (Sequence[int]): Positions of the invalid rows in the input.
+        """
+        super().__init__(message)
+        self.invalid_indices = list(invalid_indices)
+
+
+def supports_batch(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Marks a processing function as accepting a whole list or NumPy string array and returning
+    the processed rows in the same order. The decorators below call unmarked functions once per row.
+
+    Args:
+        func (Callable[..., Any]): The function to mark.
+
+    Returns:
+        Callable[..., Any]: The same function.
+    """
+    func.supports_batch = True
+    return func
+
+
+def _call_batch(func: Callable[..., Any], batch: Batch) -> Batch:
+    if getattr(func, "supports_batch", False):
+        return func(batch)
+    return [func(item) for item in batch]
+
+
+def _chunks(data: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(data)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _is_ndarray(data: Any) -> bool:
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(data, numpy.ndarray)
+
+
+def _is_batch(data: Any) -> bool:
+    return isinstance(data, (list, tuple)) or _is_ndarray(data)
+
+
+def _is_stream(data: Any) -> bool:
+    return not isinstance(data, (str, bytes)) and not _is_batch(data) and hasattr(data, "__iter__")
+
+
+def _invalid_indices(batch: Batch) -> List[int]:
+    if _is_ndarray(batch) and batch.dtype.kind == "U":
+        import numpy as np
+
+        # String arrays are checked with vectorized string operations instead of a Python loop.
+        return np.flatnonzero(np.char.str_len(np.char.strip(batch)) == 0).tolist()
+    return [i for i, item in enumerate(batch) if not isinstance(item, str) or not item.strip()]
+
+
+def _validation_error(invalid: Sequence[int], total: int) -> DataValidationError:
+    shown = ", ".join(str(i) for i in invalid[:10]) + (", ..." if len(invalid) > 10 else "")
+    return DataValidationError(
+        f"Invalid data: {len(invalid)} of {total} rows are not non-empty strings (rows {shown}).",
+        invalid,
+    )
 
 
 def validate_data(func: Callable[[str], str]) -> Callable[[str], str]:
     """
     Decorator that validates the input data before processing.
 
+    The wrapped function accepts a single string, a batch (a list, tuple or NumPy string array)
+    or any other iterable such as a generator. A batch is validated in one pass and passed on as
+    a whole; all invalid rows are reported together in a DataValidationError. An iterable is
+    processed lazily in chunks of CHUNK_SIZE rows, so memory stays constant: invalid rows are
+    skipped and reported together once the stream is exhausted.
+
     Args:
         func (Callable[[str], str]): The function to be decorated.
 
     Returns:
         Callable[[str], str]: The wrapped function with additional validation logic.
     """
-    def wrapper(data: str) -> str:
+    def wrapper(data: Any) -> Any:
+        if _is_batch(data):
+            return validate_batch(data)
+        if _is_stream(data):
+            return validate_stream(data)
+
         logger.info("Validating data...")
-        
+
         # Check if the data is a non-empty string
         if not isinstance(data, str) or not data.strip():
             logger.error("Invalid data: Input must be a non-empty string.")
-            raise ValueError("Invalid data: Input must be a non-empty string.")
-        
+            raise DataValidationError("Invalid data: Input must be a non-empty string.", [0])
+
         # If validation passes, call the original function
         logger.info("Data validation passed.")
         return func(data)
-    
-    return wrapper
+
+    def validate_batch(batch: Batch) -> Batch:
+        batch = batch if _is_ndarray(batch) else list(batch)
+        logger.info("Validating a batch of %s rows...", len(batch))
+        invalid = _invalid_indices(batch)
+        if invalid:
+            error = _validation_error(invalid, len(batch))
+            logger.error("%s", error)
+            raise error
+        logger.info("Batch validation passed.")
+        return _call_batch(func, batch)
+
+    def validate_stream(stream: Iterable[Any]) -> Iterator[Any]:
+        invalid: List[int] = []
+        offset = 0
+        for chunk in _chunks(stream, CHUNK_SIZE):
+            bad = _invalid_indices(chunk)
+            if bad:
+                invalid.extend(offset + i for i in bad)
+                skipped = set(bad)
+                valid = [item for i, item in enumerate(chunk) if i not in skipped]
+            else:
+                valid = chunk
+            offset += len(chunk)
+            if valid:
+                yield from _call_batch(func, valid)
+        logger.info("Validated a stream of %s rows.", offset)
+        if invalid:
+            error = _validation_error(invalid, offset)
+            logger.error("%s", error)
+            raise error
+
+    return supports_batch(wrapper)
 
 def augment_data(func: Callable[[str], str]) -> Callable[[str], str]:
     """
     Decorator that augments the output of a data processing function.
 
+    Like validate_data, the wrapped function also accepts a batch, which is processed and
+    augmented in one pass, or an iterable, which is processed lazily in chunks of CHUNK_SIZE rows.
+
     Args:
         func (Callable[[str], str]): The function to be decorated.
 
     Returns:
         Callable[[str], str]: The wrapped function with additional augmentation logic.
     """
-    def wrapper(data: str) -> str:
+    def wrapper(data: Any) -> Any:
+        if _is_batch(data):
+            return augment_batch(data)
+        if _is_stream(data):
+            return (row for chunk in _chunks(data, CHUNK_SIZE) for row in augment_batch(chunk))
+
         logger.info("Processing data...")
-        
+
         # Call the original function to process the data
         processed_data = func(data)
-        
+
         # Augment the processed data with additional information
         augmented_data = f"{processed_data} + augmented"
         logger.info("Data processed and augmented.")
-        
+
         # Return the augmented data
         return augmented_data
-    
-    return wrapper
+
+    def augment_batch(batch: Batch) -> Batch:
+        batch = batch if _is_ndarray(batch) else list(batch)
+        logger.info("Processing a batch of %s rows...", len(batch))
+        processed = _call_batch(func, batch)
+        if _is_ndarray(processed):
+            import numpy as np
+
+            augmented = np.char.add(processed, " + augmented")
+        else:
+            augmented = [f"{item} + augmented" for item in processed]
+        logger.info("Batch processed and augmented.")
+        return augmented
+
+    return supports_batch(wrapper)
 
 
 @validate_data
 @augment_data
-def preprocess_data(data: str) -> str:
+@supports_batch
+def preprocess_data(data: Union[str, Batch]) -> Union[str, Batch]:
     """
     Function to preprocess the given data by cleaning it.
 
     Args:
-        data (str): The raw input data to be cleaned.
+        data (Union[str, Batch]): The raw input data to be cleaned, or a batch of it.
 
     Returns:
-        str: The cleaned data.
+        Union[str, Batch]: The cleaned data.
     """
+    if _is_ndarray(data):
+        import numpy as np
+
+        return np.char.add("cleaned ", np.char.strip(data))
+    if not isinstance(data, str):
+        return [f"cleaned {item.strip()}" for item in data]
+
     cleaned_data = f"cleaned {data.strip()}"
-    logger.info(f"Data cleaned: {cleaned_data}")
+    logger.info("Data cleaned: %s", cleaned_data)
     return cleaned_data
 
 
 if __name__ == "__main__":
     try:
         raw_data = " raw_data "
-        
+
         # Process the raw data using the decorated preprocess_data function
         processed_data = preprocess_data(raw_data)
-        
+
         # Output the processed and augmented data
-        logger.info(f"Final Output: {processed_data}")  # Output: cleaned raw_data + augmented
-        
+        logger.info("Final Output: %s", processed_data)  # Output: cleaned raw_data + augmented
+
+        # A batch (list, or NumPy string array when NumPy is installed) is validated and processed in one pass
+        logger.info("Batch Output: %s", preprocess_data([" first ", "second "]))
+
+        # A generator is processed lazily, CHUNK_SIZE rows at a time
+        rows = (f" row {i} " for i in range(5_000))
+        logger.info("Streamed %s rows", sum(1 for _ in preprocess_data(rows)))
+
+        # Invalid rows of a batch are reported together
+        try:
+            preprocess_data(["ok", "", "fine", "   "])
+        except DataValidationError as e:
+            logger.error("Invalid rows: %s", e.invalid_indices)
+
         # Uncommenting the following line will raise a ValueError due to invalid data
         # invalid_data = ""
         # preprocess_data(invalid_data)
 
     except ValueError as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
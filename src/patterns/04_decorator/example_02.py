@@ -0,0 +1,274 @@
+from src.config.logging import logger
+from dataclasses import dataclass
+from typing import Optional
+from typing import Callable
+from typing import Sequence
+from typing import Union
+from typing import Tuple
+from typing import List
+from typing import Dict
+from typing import Any
+import numpy as np
+
+
+Batch = Union[Sequence[Any], np.ndarray]
+
+
+@dataclass
+class Stage:
+    """
+    A registered pipeline stage. Validators return True for valid items; transforms return the
+    new item. The optional batch function does the same for a whole batch at once: a boolean
+    mask for validators, the transformed batch for transforms.
+    """
+    name: str
+    kind: str
+    func: Callable[[Any], Any]
+    batch_func: Optional[Callable[[Batch], Any]] = None
+    message: str = ""
+
+
+class Pipeline:
+    """
+    Declarative replacement for stacked decorators.
+
+    Stages are registered in order with the `validator` and `transform` decorators and compiled
+    into a single generated function that calls every stage directly, instead of a chain of
+    wrapper frames that each log and hand an intermediate result to the next layer. Batches run
+    the batch form of a stage when one is registered, so validation can be vectorized.
+    """
+
+    def __init__(self, name: str = "pipeline") -> None:
+        """
+        Initializes an empty pipeline.
+
+        Args:
+            name (str): Name of the pipeline, used in logs and as the compiled function's name.
+        """
+        self.name = name
+        self.stages: List[Stage] = []
+        self._compiled: Optional[Callable[[Any], Any]] = None
+        self._plan: Optional[List[Tuple[str, Any]]] = None
+
+    def validator(
+        self,
+        message: Optional[str] = None,
+        batch: Optional[Callable[[Batch], Any]] = None,
+    ) -> Callable[[Callable[[Any], bool]], Callable[[Any], bool]]:
+        """
+        Registers a validation stage.
+
+        Args:
+            message (Optional[str]): Error message for invalid items; defaults to naming the stage.
+            batch (Optional[Callable[[Batch], Any]]): Vectorized form returning a boolean mask.
+
+        Returns:
+            Callable: A decorator that registers the function and returns it unchanged.
+        """
+        def register(func: Callable[[Any], bool]) -> Callable[[Any], bool]:
+            self._add(Stage(func.__name__, "validate", func, batch, message or f"Invalid data: {func.__name__} failed."))
+            return func
+        return register
+
+    def transform(
+        self,
+        batch: Optional[Callable[[Batch], Any]] = None,
+    ) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+        """
+        Registers a transformation stage.
+
+        Args:
+            batch (Optional[Callable[[Batch], Any]]): Vectorized form transforming a whole batch.
+
+        Returns:
+            Callable: A decorator that registers the function and returns it unchanged.
+        """
+        def register(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+            self._add(Stage(func.__name__, "transform", func, batch))
+            return func
+        return register
+
+    def _add(self, stage: Stage) -> None:
+        self.stages.append(stage)
+        self._compiled = None
+        self._plan = None
+
+    def compile(self) -> Callable[[Any], Any]:
+        """
+        Returns the pipeline as one flat function of a single item. The function is generated
+        once and cached until another stage is registered.
+
+        Returns:
+            Callable[[Any], Any]: The compiled pipeline; raises ValueError for invalid items.
+        """
+        if self._compiled is None:
+            self._compiled = _generate(self.name, self.stages)
+            logger.info("Compiled pipeline %s with %s stages.", self.name, len(self.stages))
+        return self._compiled
+
+    def __call__(self, data: Any) -> Any:
+        return self.compile()(data)
+
+    def run_batch(self, items: Batch) -> Batch:
+        """
+        Runs the pipeline over a batch, with the stages in registration order like the compiled
+        function. Consecutive validators are checked together, so every item they reject is
+        reported in a single error. Stages with a batch form process the whole batch in one call;
+        runs of consecutive per-item transforms are compiled into one function per item.
+
+        Args:
+            items (Batch): A list or NumPy array of items.
+
+        Returns:
+            Batch: The transformed items, as a NumPy array if the last stage returned one.
+
+        Raises:
+            ValueError: If any item fails validation, with the number and first indices of invalid items.
+        """
+        data: Batch = items if isinstance(items, np.ndarray) else list(items)
+        for kind, step in self._batch_plan():
+            if kind == "validate":
+                _check_batch(data, step)
+            elif kind == "batch":
+                data = step(data)
+            else:
+                data = [step(item) for item in data]
+        return data
+
+    def _batch_plan(self) -> List[Tuple[str, Any]]:
+        # Steps are ('validate', [stages]), ('batch', batch function) or ('items', compiled function).
+        if self._plan is None:
+            plan: List[Tuple[str, Any]] = []
+            run: List[Stage] = []
+            for stage in self.stages:
+                if stage.kind == "transform" and stage.batch_func is None:
+                    run.append(stage)
+                    continue
+                if run:
+                    plan.append(("items", _generate(f"{self.name}_items", run)))
+                    run = []
+                if stage.kind == "transform":
+                    plan.append(("batch", stage.batch_func))
+                elif plan and plan[-1][0] == "validate":
+                    plan[-1][1].append(stage)
+                else:
+                    plan.append(("validate", [stage]))
+            if run:
+                plan.append(("items", _generate(f"{self.name}_items", run)))
+            self._plan = plan
+        return self._plan
+
+
+def _check_batch(data: Batch, validators: Sequence[Stage]) -> None:
+    """
+    Runs a group of validators over a batch and raises one error naming every invalid item.
+    """
+    valid = np.ones(len(data), dtype=bool)
+    messages: List[str] = []
+    for stage in validators:
+        if stage.batch_func is not None:
+            mask = np.asarray(stage.batch_func(data), dtype=bool)
+        else:
+            mask = np.fromiter(map(stage.func, data), dtype=bool, count=len(data))
+        if not mask.all():
+            messages.append(stage.message)
+        valid &= mask
+    if messages:
+        invalid = np.flatnonzero(~valid)
+        raise ValueError(f"{len(invalid)} invalid items at indices {invalid[:10].tolist()}: {' '.join(messages)}")
+
+
+def _generate(name: str, stages: Sequence[Stage]) -> Callable[[Any], Any]:
+    """
+    Generates the source of a function calling every stage in order, without wrapper frames.
+    """
+    namespace: Dict[str, Any] = {"ValueError": ValueError}
+    lines = ["def run(data):"]
+    for i, stage in enumerate(stages):
+        namespace[f"stage_{i}"] = stage.func
+        if stage.kind == "validate":
+            namespace[f"message_{i}"] = stage.message
+            lines.append(f"    if not stage_{i}(data):")
+            lines.append(f"        raise ValueError(message_{i})")
+        else:
+            lines.append(f"    data = stage_{i}(data)")
+    lines.append("    return data")
+    exec(compile("\n".join(lines), f"<pipeline {name}>", "exec"), namespace)
+    compiled = namespace["run"]
+    compiled.__name__ = compiled.__qualname__ = name
+    return compiled
+
+
+preprocess = Pipeline("preprocess_data")
+
+
+def non_empty_strings(items: Batch) -> np.ndarray:
+    """
+    Vectorized form of non_empty_string.
+
+    Args:
+        items (Batch): The raw input data.
+
+    Returns:
+        np.ndarray: A boolean mask of the valid items.
+    """
+    if not isinstance(items, np.ndarray) or items.dtype.kind != "U":
+        # np.asarray would turn ['a', 1] into a string array and pass the 1, so anything but a
+        # string array is checked one item at a time.
+        return np.fromiter(map(non_empty_string, items), dtype=bool, count=len(items))
+    return np.char.str_len(np.char.strip(items)) > 0
+
+
+@preprocess.validator(message="Invalid data: Input must be a non-empty string.", batch=non_empty_strings)
+def non_empty_string(data: str) -> bool:
+    """
+    Checks that the data is a non-empty string.
+
+    Args:
+        data (str): The raw input data.
+
+    Returns:
+        bool: True if the data is valid.
+    """
+    return isinstance(data, str) and bool(data.strip())
+
+
+@preprocess.transform(batch=lambda items: np.char.add("cleaned ", np.char.strip(np.asarray(items, dtype=str))))
+def clean(data: str) -> str:
+    """
+    Cleans the given data.
+
+    Args:
+        data (str): The raw input data.
+
+    Returns:
+        str: The cleaned data.
+    """
+    return f"cleaned {data.strip()}"
+
+
+@preprocess.transform(batch=lambda items: np.char.add(np.asarray(items, dtype=str), " + augmented"))
+def augment(data: str) -> str:
+    """
+    Augments the cleaned data with additional information.
+
+    Args:
+        data (str): The cleaned data.
+
+    Returns:
+        str: The augmented data.
+    """
+    return f"{data} + augmented"
+
+
+if __name__ == "__main__":
+    preprocess_data = preprocess.compile()
+    logger.info("Final Output: %s", preprocess_data(" raw_data "))  # Output: cleaned raw_data + augmented
+
+    batch = preprocess.run_batch([" first ", "second", "  third"])
+    logger.info("Batch Output: %s", batch.tolist())
+
+    try:
+        preprocess.run_batch(["ok", "", "fine", "   "])
+    except ValueError as e:
+        logger.error("Error: %s", e)
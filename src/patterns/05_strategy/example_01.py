@@ -1,6 +1,30 @@
 from src.config.logging import logger 
+from src.config.tracing import traced
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import wait
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from dataclasses import field
+from typing import AsyncIterator
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Callable
+from typing import Union
+from typing import Dict
+from typing import List
+from typing import TYPE_CHECKING
 from typing import Any
+import itertools
+import asyncio
+import time
+import sys
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class InferenceStrategy(ABC):
@@ -48,24 +72,289 @@ class BatchInference(InferenceStrategy):
         return model.predict_batch(data)
 
 
+@dataclass
+class ChunkedBatchReport:
+    """
+    Summary of a chunked batch job. `results` holds the chunk results only when no sink was given.
+    """
+    chunks: int = 0
+    items: int = 0
+    elapsed_seconds: float = 0.0
+    max_in_flight: int = 0
+    results: List[Any] = field(default_factory=list)
+
+
+_worker_model: Any = None
+
+
+def _init_worker(model: Any) -> None:
+    global _worker_model
+    _worker_model = model
+
+
+def _predict_in_worker(chunk: Any) -> Any:
+    return _worker_model.predict_batch(chunk)
+
+
+class ChunkedBatchInference(InferenceStrategy):
+    """
+    Concrete strategy for batch inference over inputs larger than memory.
+
+    The input, an iterator or a NumPy array such as an np.memmap of a file, is cut into chunks
+    that run through a bounded thread or process pool. At most max_workers + prefetch chunks are
+    read ahead and in flight at any time, and each result is handed to the sink as soon as it is
+    done (in input order when `ordered`), so peak memory depends on the chunk size, not on the
+    size of the input.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1024,
+        max_workers: int = 4,
+        prefetch: int = 2,
+        sink: Optional[Callable[[int, Any], None]] = None,
+        ordered: bool = True,
+        use_processes: bool = False,
+    ) -> None:
+        """
+        Initializes the strategy.
+
+        Args:
+            chunk_size (int): Number of items passed to each predict_batch call.
+            max_workers (int): Number of worker threads or processes.
+            prefetch (int): Chunks read ahead beyond one per worker.
+            sink (Optional[Callable[[int, Any], None]]): Called with (chunk index, result) for every
+                chunk; without one, the results are collected in the report.
+            ordered (bool): Whether the sink receives the chunks in input order.
+            use_processes (bool): Whether to run chunks in worker processes; the model is sent to
+                every worker once and must be picklable.
+        """
+        if chunk_size < 1 or max_workers < 1 or prefetch < 0:
+            raise ValueError("chunk_size and max_workers must be positive and prefetch not negative.")
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.prefetch = prefetch
+        self.sink = sink
+        self.ordered = ordered
+        self.use_processes = use_processes
+
+    def _chunks(self, data: Union[Iterable[Any], "np.ndarray"]) -> Iterator[Any]:
+        # NumPy stays optional: an ndarray can only be passed in once NumPy has been imported.
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(data, numpy.ndarray):
+            # Slices of a memory-mapped array are views; their pages are read when a worker uses them.
+            for start in range(0, len(data), self.chunk_size):
+                yield data[start:start + self.chunk_size]
+            return
+        iterator = iter(data)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def infer(self, model: Any, data: Union[Iterable[Any], "np.ndarray"]) -> ChunkedBatchReport:
+        """
+        Performs chunked batch inference using the model.
+
+        Args:
+            model (Any): The model to be used for batch inference.
+            data (Union[Iterable[Any], np.ndarray]): An iterator of items or an array (e.g. np.memmap).
+
+        Returns:
+            ChunkedBatchReport: Counts and timing of the job, plus the results if no sink was given.
+        """
+        logger.info("Performing chunked batch inference.")
+        report = ChunkedBatchReport()
+        sink = self.sink or (lambda index, result: report.results.append(result))
+        start = time.perf_counter()
+        if self.use_processes:
+            executor = ProcessPoolExecutor(self.max_workers, initializer=_init_worker, initargs=(model,))
+            predict: Callable[[Any], Any] = _predict_in_worker
+        else:
+            executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="chunked-batch")
+            predict = model.predict_batch
+
+        in_flight: Dict[Future, int] = {}
+        done_out_of_order: Dict[int, Any] = {}
+        next_to_emit = 0
+
+        def emit(index: int, result: Any) -> None:
+            nonlocal next_to_emit
+            if not self.ordered:
+                sink(index, result)
+                return
+            done_out_of_order[index] = result
+            while next_to_emit in done_out_of_order:
+                sink(next_to_emit, done_out_of_order.pop(next_to_emit))
+                next_to_emit += 1
+
+        def collect(block_until_one: bool) -> None:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED) if block_until_one else (
+                [future for future in in_flight if future.done()], None)
+            for future in finished:
+                emit(in_flight.pop(future), future.result())
+
+        try:
+            limit = self.max_workers + self.prefetch
+            for index, chunk in enumerate(self._chunks(data)):
+                # In ordered mode, chunks finished early wait for their predecessors and count
+                # against the read-ahead limit, which keeps the reordering buffer bounded too.
+                while len(in_flight) + len(done_out_of_order) >= limit:
+                    collect(block_until_one=bool(in_flight))
+                    if not in_flight:
+                        break
+                in_flight[executor.submit(predict, chunk)] = index
+                report.chunks += 1
+                report.items += len(chunk)
+                report.max_in_flight = max(report.max_in_flight, len(in_flight))
+                collect(block_until_one=False)
+            while in_flight:
+                collect(block_until_one=True)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        logger.info("Processed %s items in %s chunks in %.3f s.", report.items, report.chunks, report.elapsed_seconds)
+        return report
+
+
+class InferenceStream:
+    """
+    Partial results of a streaming inference, consumed as an iterator or an async iterator.
+
+    Results are produced only as they are requested, so nothing is buffered. The stream records
+    when the first result arrived, and cancel() closes the model's generator mid-stream so it
+    can release its resources; leaving a `with` block cancels an unfinished stream.
+    """
+
+    _END = object()
+
+    def __init__(self, source: Iterator[Any], async_source: Optional[AsyncIterator[Any]] = None) -> None:
+        """
+        Initializes the stream.
+
+        Args:
+            source (Iterator[Any]): The model's generator of partial results.
+            async_source (Optional[AsyncIterator[Any]]): Native async generator used by async
+                iteration; without one, `source` is advanced in the event loop's default executor.
+        """
+        self._source = source
+        self._async_source = async_source
+        self.started_at = time.perf_counter()
+        self.first_result_at: Optional[float] = None
+        self.results = 0
+        self.completed = False
+        self.cancelled = False
+
+    @property
+    def time_to_first_result(self) -> Optional[float]:
+        """
+        Returns the seconds from the start of the stream to its first result, if one arrived.
+        """
+        return None if self.first_result_at is None else self.first_result_at - self.started_at
+
+    def _record(self, result: Any) -> Any:
+        if self.first_result_at is None:
+            self.first_result_at = time.perf_counter()
+        self.results += 1
+        return result
+
+    def __iter__(self) -> "InferenceStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self.cancelled:
+            raise StopIteration
+        try:
+            return self._record(next(self._source))
+        except StopIteration:
+            self.completed = True
+            raise
+
+    def __aiter__(self) -> "InferenceStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.cancelled:
+            raise StopAsyncIteration
+        if self._async_source is not None:
+            try:
+                return self._record(await self._async_source.__anext__())
+            except StopAsyncIteration:
+                self.completed = True
+                raise
+        # StopIteration cannot cross a future, so the executor returns a sentinel instead.
+        result = await asyncio.get_running_loop().run_in_executor(None, next, self._source, self._END)
+        if result is self._END:
+            self.completed = True
+            raise StopAsyncIteration
+        return self._record(result)
+
+    def cancel(self) -> None:
+        """
+        Stops the stream and closes the model's generator; an async generator is closed on the
+        running event loop. Safe to call more than once.
+        """
+        if self.cancelled or self.completed:
+            return
+        self.cancelled = True
+        try:
+            self._source.close()
+        except (AttributeError, ValueError):
+            # Plain iterators have nothing to close; a generator running in an executor thread
+            # cannot be closed from here and simply stops being advanced.
+            pass
+        if self._async_source is not None:
+            try:
+                asyncio.get_running_loop().create_task(self._async_source.aclose())
+            except RuntimeError:
+                pass
+        logger.info("Stream cancelled after %s results.", self.results)
+
+    def __enter__(self) -> "InferenceStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.cancel()
+
+    async def __aenter__(self) -> "InferenceStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        async_source = self._async_source
+        self._async_source = None
+        self.cancel()
+        if async_source is not None:
+            await async_source.aclose()
+
+
 class StreamInference(InferenceStrategy):
     """
     Concrete strategy for stream inference.
     """
     
-    def infer(self, model: Any, data: Any) -> Any:
+    def infer(self, model: Any, data: Any) -> InferenceStream:
         """
         Performs stream inference using the model.
 
         Args:
-            model (Any): The model to be used for stream inference.
+            model (Any): The model to be used for stream inference. Its predict_stream may return a
+                generator of partial results; it may also provide an async predict_stream_async.
             data (Any): The input data for stream inference.
         
         Returns:
-            Any: The stream inference result.
+            InferenceStream: The partial results, to be iterated synchronously or asynchronously.
         """
         logger.info("Performing stream inference.")
-        return model.predict_stream(data)
+        source = model.predict_stream(data)
+        if isinstance(source, str):
+            # Models that return the whole result at once stream it as a single part.
+            source = iter((source,))
+        async_source = model.predict_stream_async(data) if hasattr(model, "predict_stream_async") else None
+        return InferenceStream(source, async_source)
 
 
 class InferenceContext:
@@ -81,7 +370,7 @@ class InferenceContext:
             strategy (InferenceStrategy): The inference strategy to be used.
         """
         self._strategy = strategy
-        logger.info(f"Strategy set to {type(strategy).__name__}")
+        logger.info("Strategy set to %s", type(strategy).__name__)
 
     def set_strategy(self, strategy: InferenceStrategy) -> None:
         """
@@ -91,8 +380,9 @@ class InferenceContext:
             strategy (InferenceStrategy): The new inference strategy to be used.
         """
         self._strategy = strategy
-        logger.info(f"Strategy set to {type(strategy).__name__}")
+        logger.info("Strategy set to %s", type(strategy).__name__)
 
+    @traced("strategy")
     def execute_inference(self, model: Any, data: Any) -> Any:
         """
         Executes inference using the current strategy.
@@ -102,7 +392,8 @@ class InferenceContext:
             data (Any): The input data for inference.
         
         Returns:
-            Any: The inference result.
+            Any: The inference result. A StreamInference result is returned as the unconsumed
+            InferenceStream, so partial results reach the caller as they are produced.
         """
         logger.info("Executing inference using the current strategy.")
         return self._strategy.infer(model, data)
@@ -110,8 +401,24 @@ class InferenceContext:
 
 class Model:
     """
-    Example model class with different prediction methods.
+    Example model class with different prediction methods. Every output token takes
+    `token_delay` seconds to generate.
     """
+
+    def __init__(self, token_delay: float = 0.0) -> None:
+        """
+        Initializes the model.
+
+        Args:
+            token_delay (float): Simulated generation time per token in seconds.
+        """
+        self.token_delay = token_delay
+
+    def _tokens(self, prefix: str, data: Any) -> Iterator[str]:
+        for token in f"{prefix} for {data}".split():
+            if self.token_delay:
+                time.sleep(self.token_delay)
+            yield token
     
     def predict_batch(self, data: Any) -> str:
         """
@@ -121,21 +428,39 @@ class Model:
             data (Any): The input data for batch prediction.
         
         Returns:
-            str: The batch prediction result.
+            str: The batch prediction result, available once every token has been generated.
         """
-        return f"Batch prediction for {data}"
+        return " ".join(self._tokens("Batch prediction", data))
 
-    def predict_stream(self, data: Any) -> str:
+    def predict_stream(self, data: Any) -> Iterator[str]:
         """
         Simulates stream prediction.
 
         Args:
             data (Any): The input data for stream prediction.
         
-        Returns:
-            str: The stream prediction result.
+        Yields:
+            str: The tokens of the stream prediction result, as soon as each is generated.
+        """
+        try:
+            yield from self._tokens("Stream prediction", data)
+        finally:
+            logger.info("Stream generation finished.")
+
+    async def predict_stream_async(self, data: Any) -> AsyncIterator[str]:
+        """
+        Simulates stream prediction without blocking the event loop.
+
+        Args:
+            data (Any): The input data for stream prediction.
+
+        Yields:
+            str: The tokens of the stream prediction result, as soon as each is generated.
         """
-        return f"Stream prediction for {data}"
+        for token in f"Stream prediction for {data}".split():
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            yield token
 
 
 if __name__ == "__main__":
@@ -144,4 +469,33 @@ if __name__ == "__main__":
     logger.info(context.execute_inference(model, "input data"))  # Output: Batch prediction for input data
 
     context.set_strategy(StreamInference())
-    logger.info(context.execute_inference(model, "input data"))  # Output: Stream prediction for input data
\ No newline at end of file
+    stream = context.execute_inference(model, "input data")
+    logger.info(" ".join(stream))  # Output: Stream prediction for input data
+    logger.info("Time to first result: %.6f s", stream.time_to_first_result)
+
+    # Stop a long generation after the first few tokens
+    with context.execute_inference(Model(token_delay=0.01), "a very long input " * 50) as stream:
+        first_tokens = [token for _, token in zip(range(3), stream)]
+    logger.info("First tokens: %s", first_tokens)
+
+    # Consume the stream asynchronously
+    async def consume() -> None:
+        async with context.execute_inference(Model(token_delay=0.01), "async input") as async_stream:
+            tokens = [token async for token in async_stream]
+        logger.info("Async stream: %s (first result after %.3f s)", " ".join(tokens), async_stream.time_to_first_result)
+
+    asyncio.run(consume())
+    # Score a memory-mapped file chunk by chunk, writing each result out as soon as it is ready
+    import numpy as np
+    import tempfile
+    import os
+
+    with tempfile.TemporaryDirectory() as tmp:
+        values = np.lib.format.open_memmap(os.path.join(tmp, "input.npy"), mode="w+", dtype=np.float32, shape=(100_000,))
+        values[:] = np.arange(len(values), dtype=np.float32)
+        values.flush()
+        with open(os.path.join(tmp, "output.txt"), "w") as output:
+            chunked = ChunkedBatchInference(chunk_size=10_000, max_workers=2, sink=lambda index, result: output.write(f"{index}\t{result}\n"))
+            context.set_strategy(chunked)
+            report = context.execute_inference(model, np.load(os.path.join(tmp, "input.npy"), mmap_mode="r"))
+        logger.info("Chunked batch: %s items in %s chunks, at most %s in flight", report.items, report.chunks, report.max_in_flight)
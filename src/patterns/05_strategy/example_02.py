@@ -1,7 +1,14 @@
 from src.config.logging import logger 
 from abc import ABC, abstractmethod
+from typing import Sequence
 from typing import Optional
+from typing import Tuple
+from typing import Dict
+from typing import List
 from typing import Any
+import random
+import math
+import time
 
 
 class InferenceStrategy(ABC):
@@ -67,34 +74,208 @@ class StreamInference(InferenceStrategy):
         return model.predict_stream(data)
 
 
+def static_rule(data: Any, network_latency: int) -> str:
+    """
+    The fixed selection rule: batch inference for large payloads on fast networks.
+
+    Args:
+        data (Any): The input data for inference.
+        network_latency (int): The current network latency in milliseconds.
+
+    Returns:
+        str: 'batch' or 'stream'.
+    """
+    return "batch" if len(data) > 100 and network_latency < 100 else "stream"
+
+
+class StrategyCostModel:
+    """
+    Online cost model of the inference strategies.
+
+    Observed latencies are kept as exponentially weighted means and variances per
+    (strategy, payload size bucket, network latency band). The expected cost of a strategy is its
+    mean plus `risk_aversion` standard deviations, so strategies with heavy tails are penalized.
+    Buckets where a strategy has fewer than `min_samples` observations are explored first, and a
+    small fraction of requests explores at random to follow changing conditions.
+    """
+
+    def __init__(
+        self,
+        strategies: Sequence[str] = ("batch", "stream"),
+        alpha: float = 0.1,
+        risk_aversion: float = 1.0,
+        min_samples: int = 3,
+        exploration: float = 0.02,
+        latency_band_ms: int = 50,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the cost model.
+
+        Args:
+            strategies (Sequence[str]): Names of the strategies to choose from.
+            alpha (float): Weight of the newest observation in the moving averages.
+            risk_aversion (float): Standard deviations added to the mean latency to form the cost.
+            min_samples (int): Observations needed in a bucket before its estimate is trusted.
+            exploration (float): Fraction of requests sent to a random strategy.
+            latency_band_ms (int): Width of the network latency bands in milliseconds.
+            seed (Optional[int]): Seed of the exploration's random generator.
+        """
+        self.strategies = tuple(strategies)
+        self.alpha = alpha
+        self.risk_aversion = risk_aversion
+        self.min_samples = min_samples
+        self.exploration = exploration
+        self.latency_band_ms = latency_band_ms
+        self._random = random.Random(seed)
+        # (strategy, size bucket, latency band) -> [count, mean, variance, throughput]
+        self._stats: Dict[Tuple[str, int, int], List[float]] = {}
+
+    def bucket(self, size: int, network_latency: float) -> Tuple[int, int]:
+        """
+        Returns the (size bucket, latency band) of a request; sizes are bucketed by powers of two.
+
+        Args:
+            size (int): The payload size.
+            network_latency (float): The network latency in milliseconds.
+
+        Returns:
+            Tuple[int, int]: The bucket.
+        """
+        return int(size).bit_length(), min(int(network_latency // self.latency_band_ms), 20)
+
+    def expected_cost(self, strategy: str, size: int, network_latency: float) -> Optional[float]:
+        """
+        Returns the expected cost of a strategy for a request, or None while it is unexplored.
+
+        Args:
+            strategy (str): The strategy name.
+            size (int): The payload size.
+            network_latency (float): The network latency in milliseconds.
+
+        Returns:
+            Optional[float]: Mean latency plus risk_aversion standard deviations, in seconds.
+        """
+        stats = self._stats.get((strategy, *self.bucket(size, network_latency)))
+        if stats is None or stats[0] < self.min_samples:
+            return None
+        return stats[1] + self.risk_aversion * math.sqrt(stats[2])
+
+    def choose(self, size: int, network_latency: float, default: str) -> str:
+        """
+        Picks the strategy with the lowest expected cost.
+
+        Args:
+            size (int): The payload size.
+            network_latency (float): The network latency in milliseconds.
+            default (str): Strategy to use when the bucket has no observations at all.
+
+        Returns:
+            str: The chosen strategy.
+        """
+        if self._random.random() < self.exploration:
+            return self._random.choice(self.strategies)
+        if not any(self.samples(strategy, size, network_latency) for strategy in self.strategies):
+            return default
+        costs = {strategy: self.expected_cost(strategy, size, network_latency) for strategy in self.strategies}
+        unexplored = [strategy for strategy, cost in costs.items() if cost is None]
+        if unexplored:
+            return min(unexplored, key=lambda strategy: self.samples(strategy, size, network_latency))
+        return min(costs, key=costs.get)
+
+    def samples(self, strategy: str, size: int, network_latency: float) -> int:
+        """
+        Returns the number of observations of a strategy in a request's bucket.
+
+        Args:
+            strategy (str): The strategy name.
+            size (int): The payload size.
+            network_latency (float): The network latency in milliseconds.
+
+        Returns:
+            int: The number of observations.
+        """
+        stats = self._stats.get((strategy, *self.bucket(size, network_latency)))
+        return int(stats[0]) if stats else 0
+
+    def observe(self, strategy: str, size: int, network_latency: float, elapsed: float) -> None:
+        """
+        Records the latency of a completed request.
+
+        Args:
+            strategy (str): The strategy that served the request.
+            size (int): The payload size.
+            network_latency (float): The network latency in milliseconds.
+            elapsed (float): The observed latency in seconds.
+        """
+        key = (strategy, *self.bucket(size, network_latency))
+        stats = self._stats.get(key)
+        throughput = size / elapsed if elapsed > 0 else 0.0
+        if stats is None:
+            self._stats[key] = [1, elapsed, 0.0, throughput]
+            return
+        # Exponentially weighted mean and variance (West, 1979).
+        delta = elapsed - stats[1]
+        stats[0] += 1
+        stats[1] += self.alpha * delta
+        stats[2] = (1 - self.alpha) * (stats[2] + self.alpha * delta * delta)
+        stats[3] += self.alpha * (throughput - stats[3])
+
+    def throughput(self, strategy: str, size: int, network_latency: float) -> Optional[float]:
+        """
+        Returns the moving average of a strategy's items per second in a request's bucket.
+
+        Args:
+            strategy (str): The strategy name.
+            size (int): The payload size.
+            network_latency (float): The network latency in milliseconds.
+
+        Returns:
+            Optional[float]: The throughput, or None without observations.
+        """
+        stats = self._stats.get((strategy, *self.bucket(size, network_latency)))
+        return stats[3] if stats else None
+
+
 class InferenceContext:
     """
     Context class that dynamically selects an inference strategy based on runtime conditions.
+
+    Strategies are created once and reused. Each request's latency is fed to a StrategyCostModel,
+    which picks the strategy expected to be fastest for the request's payload size and network
+    latency; the static rule is only used for requests unlike any seen before.
     """
-    
-    def __init__(self) -> None:
+
+    def __init__(self, cost_model: Optional[StrategyCostModel] = None, failure_penalty: float = 1.0) -> None:
         """
         Initializes the context without a predefined strategy.
+
+        Args:
+            cost_model (Optional[StrategyCostModel]): The cost model; a default one is created if omitted.
+            failure_penalty (float): Seconds added to the observed latency of a call that raised.
         """
+        self.failure_penalty = failure_penalty
+        self._strategies: Dict[str, InferenceStrategy] = {"batch": BatchInference(), "stream": StreamInference()}
+        self.cost_model = cost_model or StrategyCostModel(tuple(self._strategies))
         self._strategy: Optional[InferenceStrategy] = None
+        self._strategy_name: Optional[str] = None
 
-    def select_strategy(self, data: Any, network_latency: int) -> None:
+    def select_strategy(self, data: Any, network_latency: int) -> str:
         """
-        Selects an inference strategy based on the data size and network latency.
+        Selects the inference strategy with the lowest expected cost for the data size and network latency.
 
         Args:
             data (Any): The input data for inference.
             network_latency (int): The current network latency in milliseconds.
+
+        Returns:
+            str: The name of the selected strategy.
         """
-        logger.info("Selecting strategy based on data size and network latency.")
-        
-        # Example condition to choose the strategy
-        if len(data) > 100 and network_latency < 100:
-            logger.info("Selected BatchInference strategy.")
-            self._strategy = BatchInference()
-        else:
-            logger.info("Selected StreamInference strategy.")
-            self._strategy = StreamInference()
+        name = self.cost_model.choose(len(data), network_latency, default=static_rule(data, network_latency))
+        logger.info("Selected %s strategy.", type(self._strategies[name]).__name__)
+        self._strategy = self._strategies[name]
+        self._strategy_name = name
+        return name
 
     def execute_inference(self, model: Any, data: Any, network_latency: int) -> Any:
         """
@@ -108,10 +289,21 @@ class InferenceContext:
         Returns:
             Any: The inference result.
         """
-        self.select_strategy(data, network_latency)
-        if self._strategy:
+        # Use what this call selected, not self._strategy, which a concurrent call may have changed.
+        name = self.select_strategy(data, network_latency)
+        strategy = self._strategies.get(name)
+        if strategy:
             logger.info("Executing inference using the selected strategy.")
-            return self._strategy.infer(model, data)
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = strategy.infer(model, data)
+                failed = False
+                return result
+            finally:
+                # Failures are observed too, with a penalty, so a failing strategy stops being chosen.
+                elapsed = time.perf_counter() - start + (self.failure_penalty if failed else 0.0)
+                self.cost_model.observe(name, len(data), network_latency, elapsed)
         else:
             logger.error("No strategy selected.")
             raise RuntimeError("Inference strategy could not be selected.")
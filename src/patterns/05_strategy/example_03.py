@@ -0,0 +1,419 @@
+from src.config.logging import logger
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Optional
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Any
+import asyncio
+import random
+import time
+
+
+class InferenceStrategy(ABC):
+    """
+    Abstract base class for defining inference strategies.
+    """
+
+    @abstractmethod
+    def infer(self, model: Any, data: Any) -> Any:
+        """
+        Abstract method for performing inference.
+
+        Args:
+            model (Any): The model to be used for inference.
+            data (Any): The input data for inference.
+
+        Returns:
+            Any: The inference result.
+
+        Raises:
+            NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError("Subclasses must implement the infer method.")
+
+
+class BatchInference(InferenceStrategy):
+    """
+    Concrete strategy for batch inference.
+    """
+
+    def infer(self, model: Any, data: Any) -> Any:
+        """
+        Performs batch inference using the model.
+
+        Args:
+            model (Any): The model to be used for batch inference.
+            data (Any): The input data for batch inference.
+
+        Returns:
+            Any: The batch inference result.
+        """
+        logger.info("Performing batch inference.")
+        return model.predict_batch(data)
+
+
+class LatencyTracker:
+    """
+    Recent latencies per backend, kept in a sliding window of the last `window` calls. Percentiles
+    are recomputed every `refresh` observations rather than on every request.
+    """
+
+    def __init__(self, window: int = 1000, refresh: int = 20) -> None:
+        """
+        Initializes the tracker.
+
+        Args:
+            window (int): Number of recent latencies kept per backend.
+            refresh (int): Observations between two recomputations of a backend's percentiles.
+        """
+        self.window = window
+        self.refresh = refresh
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._sorted: Dict[str, List[float]] = {}
+        self._pending: Dict[str, int] = {}
+
+    def record(self, backend: str, seconds: float) -> None:
+        """
+        Records the latency of a call.
+
+        Args:
+            backend (str): The backend name.
+            seconds (float): The latency in seconds.
+        """
+        self._latencies.setdefault(backend, deque(maxlen=self.window)).append(seconds)
+        self._pending[backend] = self._pending.get(backend, 0) + 1
+
+    def samples(self, backend: str) -> int:
+        """
+        Returns the number of latencies in a backend's window.
+
+        Args:
+            backend (str): The backend name.
+
+        Returns:
+            int: The number of latencies.
+        """
+        return len(self._latencies.get(backend, ()))
+
+    def percentile(self, backend: str, percentile: float) -> Optional[float]:
+        """
+        Returns a percentile of a backend's recent latencies.
+
+        Args:
+            backend (str): The backend name.
+            percentile (float): The percentile, between 0 and 100.
+
+        Returns:
+            Optional[float]: The latency in seconds, or None without observations.
+        """
+        latencies = self._latencies.get(backend)
+        if not latencies:
+            return None
+        if backend not in self._sorted or self._pending[backend] >= self.refresh:
+            self._sorted[backend] = sorted(latencies)
+            self._pending[backend] = 0
+        values = self._sorted[backend]
+        return values[min(len(values) - 1, int(len(values) * percentile / 100))]
+
+
+def backend_name(model: Any) -> str:
+    """
+    Returns the name under which a model's latencies are tracked.
+
+    Args:
+        model (Any): The model.
+
+    Returns:
+        str: The model's `name` attribute, or its class name.
+    """
+    return getattr(model, "name", type(model).__name__)
+
+
+class HedgedInference(InferenceStrategy):
+    """
+    Concrete strategy that hedges slow requests to cut tail latency.
+
+    The request is sent to the primary model. If no answer arrives within the hedge delay, the
+    same request is sent to the secondary model, the first result wins and the other call is
+    cancelled. The hedge delay is the primary's `percentile` latency from the LatencyTracker, so
+    only the slowest (100 - percentile)% of requests are duplicated. Hedges are also capped by a
+    token budget of `max_hedge_ratio` of all requests, so a slow primary cannot double the load.
+    If the primary fails before the secondary was started, the secondary is tried at once,
+    whether or not a hedge token is left.
+
+    Models are called with `predict_async` when they have it; otherwise `predict_batch` runs in
+    the default executor, where a losing call finishes in the background instead of stopping.
+    """
+
+    def __init__(
+        self,
+        secondary: Any,
+        percentile: float = 95.0,
+        tracker: Optional[LatencyTracker] = None,
+        initial_delay: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.001,
+        max_hedge_ratio: float = 0.1,
+        hedge_burst: float = 10.0,
+    ) -> None:
+        """
+        Initializes the strategy.
+
+        Args:
+            secondary (Any): The model that receives the duplicate requests.
+            percentile (float): Percentile of the primary's latency after which a request is hedged.
+            tracker (Optional[LatencyTracker]): The latency tracker; a new one is created if omitted.
+            initial_delay (float): Hedge delay in seconds until the primary has min_samples latencies.
+            min_samples (int): Latencies needed before the tracked percentile is used.
+            min_delay (float): Lower bound of the hedge delay in seconds.
+            max_hedge_ratio (float): Largest long-run fraction of requests that may be hedged.
+            hedge_burst (float): Hedges that may be sent in a row before the ratio applies.
+        """
+        self.secondary = secondary
+        self.percentile = percentile
+        self.tracker = tracker or LatencyTracker()
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.hedge_burst = hedge_burst
+        self._hedge_tokens = hedge_burst
+        self.requests = 0
+        self.hedged = 0
+        self.failovers = 0
+        self.secondary_wins = 0
+
+    def hedge_delay(self, model: Any) -> float:
+        """
+        Returns how long to wait for a model before hedging.
+
+        Args:
+            model (Any): The primary model.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        name = backend_name(model)
+        if self.tracker.samples(name) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, self.tracker.percentile(name, self.percentile))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the number of requests and the fractions hedged, failed over to the secondary and
+        won by the secondary.
+
+        Returns:
+            Dict[str, float]: The statistics.
+        """
+        requests = max(self.requests, 1)
+        return {
+            "requests": self.requests,
+            "hedged_ratio": self.hedged / requests,
+            "failover_ratio": self.failovers / requests,
+            "secondary_win_ratio": self.secondary_wins / requests,
+        }
+
+    async def _call(self, model: Any, data: Any) -> Any:
+        name = backend_name(model)
+        start = time.perf_counter()
+        try:
+            if hasattr(model, "predict_async"):
+                result = await model.predict_async(data)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(None, model.predict_batch, data)
+        except asyncio.CancelledError:
+            # A cancelled call took at least this long. Recording the lower bound keeps slow calls
+            # in the window; dropping them would shrink the percentile and hedge ever more often.
+            self.tracker.record(name, time.perf_counter() - start)
+            raise
+        self.tracker.record(name, time.perf_counter() - start)
+        return result
+
+    def _take_hedge_token(self) -> bool:
+        if self._hedge_tokens >= 1:
+            self._hedge_tokens -= 1
+            return True
+        return False
+
+    async def infer_async(self, model: Any, data: Any) -> Any:
+        """
+        Performs hedged inference from a running event loop.
+
+        Args:
+            model (Any): The primary model.
+            data (Any): The input data for inference.
+
+        Returns:
+            Any: The result of whichever model answered first.
+        """
+        self.requests += 1
+        self._hedge_tokens = min(self.hedge_burst, self._hedge_tokens + self.max_hedge_ratio)
+        primary = asyncio.ensure_future(self._call(model, data))
+        tasks = {primary: model}
+        errors: List[BaseException] = []
+        secondary_started = False
+
+        def start_secondary() -> None:
+            nonlocal secondary_started
+            secondary_started = True
+            tasks[asyncio.ensure_future(self._call(self.secondary, data))] = self.secondary
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay(model))
+            if not done and self._take_hedge_token():
+                logger.info("Hedging request to %s.", backend_name(self.secondary))
+                self.hedged += 1
+                start_secondary()
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    winner = tasks.pop(task)
+                    if task.exception() is not None:
+                        errors.append(task.exception())
+                        # Failing over does not need a hedge token: it replaces the call, not duplicates it.
+                        if not secondary_started:
+                            logger.info("Primary failed; failing over to %s.", backend_name(self.secondary))
+                            self.failovers += 1
+                            start_secondary()
+                        continue
+                    self.secondary_wins += winner is self.secondary
+                    return task.result()
+            raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def infer(self, model: Any, data: Any) -> Any:
+        """
+        Performs hedged inference using the model as primary.
+
+        Args:
+            model (Any): The primary model.
+            data (Any): The input data for inference.
+
+        Returns:
+            Any: The result of whichever model answered first.
+        """
+        logger.info("Performing hedged inference.")
+        return asyncio.run(self.infer_async(model, data))
+
+
+class InferenceContext:
+    """
+    Context class that uses an inference strategy.
+    """
+
+    def __init__(self, strategy: InferenceStrategy) -> None:
+        """
+        Initializes the context with a specific strategy.
+
+        Args:
+            strategy (InferenceStrategy): The inference strategy to be used.
+        """
+        self._strategy = strategy
+
+    def set_strategy(self, strategy: InferenceStrategy) -> None:
+        """
+        Sets a new inference strategy.
+
+        Args:
+            strategy (InferenceStrategy): The new inference strategy to be used.
+        """
+        self._strategy = strategy
+        logger.info("Strategy set to %s", type(strategy).__name__)
+
+    def execute_inference(self, model: Any, data: Any) -> Any:
+        """
+        Executes inference using the current strategy.
+
+        Args:
+            model (Any): The model to be used for inference.
+            data (Any): The input data for inference.
+
+        Returns:
+            Any: The inference result.
+        """
+        logger.info("Executing inference using the current strategy.")
+        return self._strategy.infer(model, data)
+
+
+class Model:
+    """
+    Example model whose calls usually take `latency` seconds but take `slow_latency` seconds
+    with probability `slow_probability`.
+    """
+
+    def __init__(self, name: str, latency: float, slow_latency: float = 0.0, slow_probability: float = 0.0) -> None:
+        """
+        Initializes the model.
+
+        Args:
+            name (str): Name of the backend.
+            latency (float): Usual latency in seconds.
+            slow_latency (float): Latency of a slow call in seconds.
+            slow_probability (float): Probability of a slow call.
+        """
+        self.name = name
+        self.latency = latency
+        self.slow_latency = slow_latency
+        self.slow_probability = slow_probability
+
+    def predict_batch(self, data: Any) -> str:
+        """
+        Simulates batch prediction.
+
+        Args:
+            data (Any): The input data for batch prediction.
+
+        Returns:
+            str: The batch prediction result.
+        """
+        return f"{self.name} prediction for {data}"
+
+    async def predict_async(self, data: Any) -> str:
+        """
+        Simulates batch prediction on a remote backend.
+
+        Args:
+            data (Any): The input data for batch prediction.
+
+        Returns:
+            str: The batch prediction result.
+        """
+        slow = random.random() < self.slow_probability
+        await asyncio.sleep(self.slow_latency if slow else self.latency)
+        return self.predict_batch(data)
+
+
+if __name__ == "__main__":
+    primary = Model("primary", latency=0.01, slow_latency=0.5, slow_probability=0.05)
+    secondary = Model("secondary", latency=0.02)
+
+    context = InferenceContext(BatchInference())
+    logger.info(context.execute_inference(primary, "input data"))  # Output: primary prediction for input data
+
+    hedged = HedgedInference(secondary, percentile=95.0, initial_delay=0.05)
+    context.set_strategy(hedged)
+    logger.info(context.execute_inference(primary, "input data"))
+
+    # Serve requests concurrently from an event loop, 20 at a time
+    async def serve(waves: int, concurrency: int) -> List[float]:
+        async def timed(i: int) -> float:
+            start = time.perf_counter()
+            await hedged.infer_async(primary, f"request {i}")
+            return time.perf_counter() - start
+        latencies: List[float] = []
+        for wave in range(waves):
+            latencies += await asyncio.gather(*(timed(wave * concurrency + i) for i in range(concurrency)))
+        return sorted(latencies)
+
+    latencies = asyncio.run(serve(waves=10, concurrency=20))
+    logger.info(
+        "p50 %.3f s, max %.3f s, hedge delay %.3f s, stats %s",
+        latencies[len(latencies) // 2], latencies[-1], hedged.hedge_delay(primary), hedged.stats(),
+    )
@@ -1,4 +1,5 @@
 from src.config.logging import logger 
+from src.config.tracing import traced
 from typing import Protocol
 
 
@@ -40,6 +41,7 @@ class LLMAdapter:
         """
         self.llm = llm
 
+    @traced("adapter")
     def predict(self, text: str) -> str:
         """
         Standardized method for getting predictions from the third-party LLM.
@@ -51,9 +53,9 @@ class LLMAdapter:
             logger.error("Input text is empty.")
             return "Error: Input text cannot be empty."
 
-        logger.info(f"Fetching prediction for input: '{text}'")
+        logger.info("Fetching prediction for input: '%s'", text)
         response = self.llm.get_prediction(text)
-        logger.info(f"Received response: '{response}'")
+        logger.info("Received response: '%s'", response)
         return response
 
 
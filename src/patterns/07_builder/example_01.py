@@ -77,7 +77,7 @@ class Preprocessor:
     Component responsible for preprocessing data.
     """
     def preprocess(self, data: str) -> str:
-        logger.info(f"Preprocessing data: {data}")
+        logger.info("Preprocessing data: %s", data)
         return f"preprocessed {data}"
 
 
@@ -86,7 +86,7 @@ class ModelTrainer:
     Component responsible for training the model on preprocessed data.
     """
     def train(self, data: str) -> str:
-        logger.info(f"Training model on data: {data}")
+        logger.info("Training model on data: %s", data)
         return f"trained model on {data}"
 
 
@@ -95,7 +95,7 @@ class Evaluator:
     Component responsible for evaluating the trained model.
     """
     def evaluate(self, model: str) -> str:
-        logger.info(f"Evaluating model: {model}")
+        logger.info("Evaluating model: %s", model)
         return f"evaluated {model}"
 
 
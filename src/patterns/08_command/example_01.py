@@ -26,7 +26,7 @@ class Train(Command):
         :param model: The model instance to be trained.
         :param data: The training data.
         """
-        logger.info(f"Initializing Train command with model: {model} and data: {data}")
+        logger.info("Initializing Train command with model: %s and data: %s", model, data)
         self.model = model
         self.data = data
 
@@ -36,9 +36,9 @@ class Train(Command):
         
         :return: A message indicating the model has been trained.
         """
-        logger.info(f"Executing Train command. Training model: {self.model} with data: {self.data}")
+        logger.info("Executing Train command. Training model: %s with data: %s", self.model, self.data)
         result = self.model.train(self.data)
-        logger.info(f"Train command execution completed. Result: {result}")
+        logger.info("Train command execution completed. Result: %s", result)
         return result
 
 
@@ -52,7 +52,7 @@ class Deploy(Command):
         
         :param model: The model instance to be deployed.
         """
-        logger.info(f"Initializing Deploy command with model: {model}")
+        logger.info("Initializing Deploy command with model: %s", model)
         self.model = model
 
     def execute(self) -> str:
@@ -61,9 +61,9 @@ class Deploy(Command):
         
         :return: A message indicating the model has been deployed.
         """
-        logger.info(f"Executing Deploy command. Deploying model: {self.model}")
+        logger.info("Executing Deploy command. Deploying model: %s", self.model)
         result = self.model.deploy()
-        logger.info(f"Deploy command execution completed. Result: {result}")
+        logger.info("Deploy command execution completed. Result: %s", result)
         return result
 
 
@@ -85,7 +85,7 @@ class Workflow:
         
         :param command: An instance of a Command.
         """
-        logger.info(f"Adding command to Workflow: {command}")
+        logger.info("Adding command to Workflow: %s", command)
         self._commands.append(command)
 
     def execute_commands(self) -> List[str]:
@@ -97,7 +97,7 @@ class Workflow:
         logger.info("Executing all commands in the Workflow.")
         results: List[str] = []
         for command in self._commands:
-            logger.info(f"Executing command: {command}")
+            logger.info("Executing command: %s", command)
             result = command.execute()
             results.append(result)
         logger.info("All commands in the Workflow have been executed.")
@@ -116,9 +116,9 @@ class Model:
         :param data: The data to train the model on.
         :return: A message indicating the training was successful.
         """
-        logger.info(f"Training model with data: {data}")
+        logger.info("Training model with data: %s", data)
         result = f'Training model on data: {data}'
-        logger.info(f"Model training completed successfully. Result: {result}")
+        logger.info("Model training completed successfully. Result: %s", result)
         return result
 
     def deploy(self) -> str:
@@ -129,7 +129,7 @@ class Model:
         """
         logger.info("Initiating model deployment.")
         result = 'Deploying model...'
-        logger.info(f"Model deployment completed successfully. Result: {result}")
+        logger.info("Model deployment completed successfully. Result: %s", result)
         return result
 
 
@@ -1,22 +1,47 @@
 from src.config.logging import logger
-from typing import Dict
+from src.config.tracing import traced
+from concurrent.futures import ThreadPoolExecutor
+from src.cache.concurrency import AsyncSingleFlight
+from src.cache.concurrency import ShardedCache
+from src.cache.concurrency import SingleFlight
+from src.cache.semantic import SemanticCache
+from src.cache.store import BoundedCache
+from typing import Optional
+from typing import Union
+import asyncio
+import time
 
 
 class LLMProxy:
     """
     Proxy class for interacting with a language model.
-    Caches results to optimize repeated predictions.
+    Caches results to optimize repeated predictions, and coalesces concurrent
+    requests for the same input into a single model call.
     """
-    def __init__(self, model: 'Model') -> None:
+    _MISSING = object()
+
+    def __init__(
+        self,
+        model: 'Model',
+        cache: Optional[Union[ShardedCache, BoundedCache]] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+    ) -> None:
         """
-        Initializes the LLMProxy with a model and an empty cache.
+        Initializes the LLMProxy with a model and a bounded cache.
         
         :param model: The model instance to interact with.
+        :param cache: The cache used to store predictions. Defaults to a thread-safe, sharded LRU cache
+                      with a one-hour TTL. A plain BoundedCache is only safe when used from a single thread.
+        :param semantic_cache: Optional similarity cache consulted on exact-match misses, so paraphrased
+                               prompts can reuse an earlier response.
         """
         logger.info("Initializing LLMProxy.")
         self.model = model
-        self.cache: Dict[str, str] = {}
+        self.cache = cache if cache is not None else ShardedCache(max_entries=10_000, max_bytes=64 * 1024 * 1024, ttl=3600)
+        self.semantic_cache = semantic_cache
+        self.in_flight = SingleFlight()
 
+    @traced("proxy")
     def predict(self, input_text: str) -> str:
         """
         Predicts the output for the given input text using the model.
@@ -25,16 +50,95 @@ class LLMProxy:
         :param input_text: The input text for which the prediction is to be made.
         :return: The model's prediction.
         """
-        logger.info(f"Received request for prediction with input: {input_text}")
+        logger.info("Received request for prediction with input: %s", input_text)
+
+        cached = self.cache.get(input_text, self._MISSING)
+        if cached is not self._MISSING:
+            logger.info("Cache hit for input: %s", input_text)
+            return cached
+        
+        logger.info("Cache miss for input: %s. Predicting using model.", input_text)
+        return self.in_flight.do(input_text, lambda: self._load(input_text))
 
-        if input_text in self.cache:
-            logger.info(f"Cache hit for input: {input_text}")
-            return self.cache[input_text]
+    def _load(self, input_text: str) -> str:
+        """
+        Calls the model and caches the response. Runs once per group of concurrent identical requests.
         
-        logger.info(f"Cache miss for input: {input_text}. Predicting using model.")
+        :param input_text: The input text for which the prediction is to be made.
+        :return: The model's prediction.
+        """
+        # A previous leader may have cached the response between our lookup and joining the flight
+        cached = self.cache.peek(input_text, self._MISSING)
+        if cached is not self._MISSING:
+            return cached
+
+        if self.semantic_cache is not None:
+            similar = self.semantic_cache.get(input_text, self._MISSING)
+            if similar is not self._MISSING:
+                logger.info("Semantic cache hit for input: %s", input_text)
+                self.cache.put(input_text, similar)
+                return similar
+
         response = self.model.predict(input_text)
-        logger.info(f"Caching prediction for input: {input_text}")
-        self.cache[input_text] = response
+        logger.info("Caching prediction for input: %s", input_text)
+        self.cache.put(input_text, response)
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(input_text, response)
+        return response
+
+
+class AsyncLLMProxy:
+    """
+    Asyncio variant of LLMProxy for coroutine-based models.
+    Concurrent awaits for the same input share a single in-flight model call.
+    """
+    _MISSING = object()
+
+    def __init__(self, model: 'AsyncModel', cache: Optional[BoundedCache] = None) -> None:
+        """
+        Initializes the AsyncLLMProxy with a model and a bounded cache.
+        
+        :param model: The coroutine-based model instance to interact with.
+        :param cache: The cache used to store predictions. Defaults to a bounded LRU cache with a one-hour TTL.
+                      No lock is needed because the cache is only touched from the event loop thread.
+        """
+        logger.info("Initializing AsyncLLMProxy.")
+        self.model = model
+        self.cache = cache if cache is not None else BoundedCache(max_entries=10_000, max_bytes=64 * 1024 * 1024, ttl=3600)
+        self.in_flight = AsyncSingleFlight()
+
+    @traced("proxy")
+    async def predict(self, input_text: str) -> str:
+        """
+        Predicts the output for the given input text without blocking the event loop.
+        
+        :param input_text: The input text for which the prediction is to be made.
+        :return: The model's prediction.
+        """
+        logger.info("Received async request for prediction with input: %s", input_text)
+
+        cached = self.cache.get(input_text, self._MISSING)
+        if cached is not self._MISSING:
+            logger.info("Cache hit for input: %s", input_text)
+            return cached
+
+        logger.info("Cache miss for input: %s. Predicting using model.", input_text)
+        return await self.in_flight.do(input_text, lambda: self._load(input_text))
+
+    async def _load(self, input_text: str) -> str:
+        """
+        Awaits the model and caches the response. Runs once per group of concurrent identical requests.
+        
+        :param input_text: The input text for which the prediction is to be made.
+        :return: The model's prediction.
+        """
+        cached = self.cache.peek(input_text, self._MISSING)
+        if cached is not self._MISSING:
+            return cached
+
+        response = await self.model.predict(input_text)
+        logger.info("Caching prediction for input: %s", input_text)
+        self.cache.put(input_text, response)
         return response
 
 
@@ -49,7 +153,23 @@ class Model:
         :param text: The input text for which the prediction is to be made.
         :return: A simulated prediction result.
         """
-        logger.info(f"Model received input for prediction: {text}")
+        logger.info("Model received input for prediction: %s", text)
+        return f"Prediction for {text}"
+
+
+class AsyncModel:
+    """
+    Example coroutine-based model, e.g. a client for a remote LLM endpoint.
+    """
+    async def predict(self, text: str) -> str:
+        """
+        Simulates awaiting a prediction from a remote service.
+        
+        :param text: The input text for which the prediction is to be made.
+        :return: A simulated prediction result.
+        """
+        logger.info("AsyncModel received input for prediction: %s", text)
+        await asyncio.sleep(0.1)
         return f"Prediction for {text}"
 
 
@@ -59,8 +179,39 @@ if __name__ == "__main__":
 
     # First call (cache miss)
     response1 = proxy.predict("Some input text")
-    logger.info(f"First response: {response1}")  # Output: Prediction for Some input text
+    logger.info("First response: %s", response1)  # Output: Prediction for Some input text
 
     # Second call (cache hit)
     response2 = proxy.predict("Some input text")
-    logger.info(f"Second response: {response2}")  # Output: Prediction for Some input text
+    logger.info("Second response: %s", response2)  # Output: Prediction for Some input text
+
+    # A small W-TinyLFU cache keeps the frequently requested prompt and evicts one-off prompts
+    small_proxy = LLMProxy(model, cache=BoundedCache(max_entries=2, policy="w-tinylfu"))
+    for text in ["popular", "popular", "one-off 1", "popular", "one-off 2", "one-off 3", "popular"]:
+        small_proxy.predict(text)
+    logger.info("Cache stats: %s", small_proxy.cache.stats)
+
+    # Concurrent identical requests share a single model call
+    class SlowModel(Model):
+        def predict(self, text: str) -> str:
+            time.sleep(0.2)
+            return super().predict(text)
+
+    concurrent_proxy = LLMProxy(SlowModel())
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(concurrent_proxy.predict, ["Trending prompt"] * 8))
+    logger.info("Model executions: %s, shared: %s", concurrent_proxy.in_flight.executions, concurrent_proxy.in_flight.shared)
+
+    # With a semantic cache, paraphrased prompts reuse the response of an earlier, similar prompt
+    semantic_proxy = LLMProxy(model, semantic_cache=SemanticCache(threshold=0.8))
+    semantic_proxy.predict("What is the capital of France?")
+    response3 = semantic_proxy.predict("what's the capital of france")
+    logger.info("Semantic response: %s", response3)  # Output: Prediction for What is the capital of France?
+
+    # Concurrent awaits for the same input share one in-flight future
+    async def serve() -> None:
+        async_proxy = AsyncLLMProxy(AsyncModel())
+        await asyncio.gather(*(async_proxy.predict("Trending prompt") for _ in range(8)))
+        logger.info("Async model executions: %s, shared: %s", async_proxy.in_flight.executions, async_proxy.in_flight.shared)
+
+    asyncio.run(serve())
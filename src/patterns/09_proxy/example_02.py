@@ -1,42 +1,271 @@
+from src.cache.concurrency import AsyncSingleFlight
 from src.config.logging import logger
+from src.cache.store import BoundedCache
+from src.cache.disk import MmapStore
 from typing import Callable
+from typing import Optional
+from typing import Hashable
 from functools import wraps
 from typing import Tuple
+from typing import Union
 from typing import Dict
 from typing import Any
+import hashlib
+import asyncio
+import weakref
+import pickle
 
 
-def cache_decorator(func: Callable) -> Callable:
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    Key function that treats prompts differing only in case or whitespace as the same request.
+    
+    :param text: The prompt text.
+    :return: The case-folded prompt with whitespace runs collapsed to single spaces.
+    """
+    return " ".join(text.casefold().split())
+
+
+def digest_long_text(max_length: int = 256, normalize: bool = False) -> Callable[[str], Hashable]:
+    """
+    Builds a key function that replaces long texts by a fixed-size digest, so the cache does not
+    keep a second copy of every long prompt just to use it as a key.
+    
+    :param max_length: Texts longer than this many characters are hashed.
+    :param normalize: Whether to apply normalize_prompt before hashing.
+    :return: A key function for cache_decorator.
+    """
+    def key_func(text: str) -> Hashable:
+        if normalize:
+            text = normalize_prompt(text)
+        if len(text) <= max_length:
+            return text
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    return key_func
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Builds the general cache key. Single positional arguments are used as the key directly;
+    tuples are wrapped so that f((a, b)) and f(a, b) never share a key.
+    
+    :param args: Positional arguments, excluding the instance for methods.
+    :param kwargs: Keyword arguments.
+    :return: A hashable cache key.
+    """
+    if not kwargs:
+        if len(args) == 1 and type(args[0]) is not tuple:
+            return args[0]
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def _is_method(func: Callable[..., Any]) -> bool:
+    """
+    Tells whether a function is being defined directly in a class body, in which case its
+    qualified name has the class name right before its own name.
+    
+    :param func: The function being decorated.
+    :return: True for methods.
+    """
+    parts = func.__qualname__.split(".")
+    return len(parts) > 1 and parts[-2] != "<locals>"
+
+
+def cache_decorator(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    store: Optional[Union[MmapStore, Callable[[], MmapStore]]] = None,
+    ttl: Optional[float] = None,
+    key_func: Optional[Callable[..., Hashable]] = None,
+    per_instance: bool = False,
+    method: Optional[bool] = None,
+) -> Any:
     """
     A decorator to cache the results of a function based on its arguments.
+    Can be used bare (@cache_decorator) or with options, e.g. a persistent second tier
+    (@cache_decorator(store=MmapStore("cache/predictions.mmap"))) whose results survive restarts
+    and are shared by every process on the host that opens the same file, or a custom key function
+    (@cache_decorator(key_func=normalize_prompt)). The store may also be a function returning it,
+    called on the first miss, so that decorating a function does not open the file.
+
+    On methods the instance is left out of the key, so the cache is shared by all instances and never
+    keeps them alive. With per_instance=True each instance gets its own cache, held in a
+    WeakKeyDictionary and dropped with the instance. Methods are detected from the qualified name;
+    pass method=False when decorating a staticmethod. Cache hits are not logged, which keeps the
+    common single-argument hit down to one dictionary lookup.
     """
-    cache: Dict[Tuple[Any, ...], Any] = {}
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache: Dict[Hashable, Any] = {}
+        instance_caches: 'weakref.WeakKeyDictionary[Any, Dict[Hashable, Any]]' = weakref.WeakKeyDictionary()
+        opened_store = store if isinstance(store, MmapStore) else None
 
-    @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        """
-        Wrapper function that checks the cache before executing the function.
-        
-        :param args: Positional arguments for the function.
-        :param kwargs: Keyword arguments for the function.
-        :return: The result from the cache or the function execution.
-        """
-        # Create a cache key based on function arguments
-        key = args + tuple(sorted(kwargs.items()))
-        logger.info(f"Cache decorator called with key: {key}")
+        def disk_store() -> MmapStore:
+            nonlocal opened_store
+            if opened_store is None:
+                opened_store = store()
+            return opened_store
 
-        if key in cache:
-            logger.info(f"Cache hit for key: {key}")
-            return cache[key]
-        
-        logger.info(f"Cache miss for key: {key}. Calling the function.")
-        # Call the function and store the result in cache
-        result = func(*args, **kwargs)
-        cache[key] = result
-        logger.info(f"Result cached for key: {key}")
-        return result
+        def build_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+            if key_func is not None:
+                return key_func(*args, **kwargs)
+            return _make_key(args, kwargs)
+
+        def load(target: Dict[Hashable, Any], key: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            """
+            Handles a memory miss: checks the disk tier, then calls the function and fills both tiers.
+            """
+            disk_key = _disk_key(func, key) if store is not None else None
+            if disk_key is not None:
+                stored = disk_store().get_view(disk_key)
+                if stored is not None:
+                    logger.info("Disk cache hit for key: %r", key)
+                    result = target[key] = pickle.loads(stored)
+                    return result
+
+            logger.info("Cache miss for key: %r. Calling the function.", key)
+            result = func(*args, **kwargs)
+            target[key] = result
+            if disk_key is not None:
+                disk_store().put(disk_key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), ttl=ttl)
+            logger.info("Result cached for key: %r", key)
+            return result
+
+        if _is_method(func) if method is None else method:
+            @wraps(func)
+            def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                """
+                Wrapper method that checks the cache before executing the method.
+                
+                :param self: The instance; not part of the cache key.
+                :param args: Positional arguments for the method.
+                :param kwargs: Keyword arguments for the method.
+                :return: The result from the cache or the method execution.
+                """
+                # Fast path: a single positional argument is used as the key as-is, without allocating
+                if not kwargs and key_func is None and len(args) == 1 and type(args[0]) is not tuple:
+                    key = args[0]
+                else:
+                    key = build_key(args, kwargs)
+
+                target = cache
+                if per_instance:
+                    target = instance_caches.get(self)
+                    if target is None:
+                        target = instance_caches[self] = {}
+
+                result = target.get(key, _MISSING)
+                if result is not _MISSING:
+                    return result
+                return load(target, key, (self,) + args, kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                """
+                Wrapper function that checks the cache before executing the function.
+                
+                :param args: Positional arguments for the function.
+                :param kwargs: Keyword arguments for the function.
+                :return: The result from the cache or the function execution.
+                """
+                if not kwargs and key_func is None and len(args) == 1 and type(args[0]) is not tuple:
+                    key = args[0]
+                else:
+                    key = build_key(args, kwargs)
+
+                result = cache.get(key, _MISSING)
+                if result is not _MISSING:
+                    return result
+                return load(cache, key, args, kwargs)
+
+        def cache_clear() -> None:
+            """
+            Empties the in-memory caches. The disk tier is left untouched.
+            """
+            cache.clear()
+            instance_caches.clear()
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def _disk_key(func: Callable[..., Any], key: Hashable) -> Optional[bytes]:
+    """
+    Builds a process-independent key for the disk tier from the function name and the pickled arguments.
     
-    return wrapper
+    :param func: The cached function.
+    :param key: The in-memory cache key.
+    :return: A fixed-size digest, or None if the arguments cannot be pickled.
+    """
+    try:
+        payload = pickle.dumps((func.__module__, func.__qualname__, key), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def async_cache(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    max_entries: int = 1024,
+    max_bytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+    policy: str = "lru",
+    method: Optional[bool] = None,
+) -> Any:
+    """
+    A decorator to cache the results of a coroutine function based on its arguments.
+    Results are kept in a BoundedCache, and concurrent awaits for the same key share one in-flight future.
+    Can be used bare (@async_cache) or with cache options (@async_cache(max_entries=100, ttl=60)).
+
+    Keys are built like those of cache_decorator: on methods the instance is left out, so the cache
+    is shared by all instances and never keeps them alive. Pass method=False for a staticmethod.
+    """
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = BoundedCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, policy=policy)
+        in_flight = AsyncSingleFlight()
+        missing = object()
+        skip_instance = _is_method(func) if method is None else method
+
+        async def load(key: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            result = await func(*args, **kwargs)
+            cache.put(key, result)
+            logger.info("Result cached for key: %r", key)
+            return result
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """
+            Wrapper coroutine that checks the cache before awaiting the function.
+            
+            :param args: Positional arguments for the function.
+            :param kwargs: Keyword arguments for the function.
+            :return: The result from the cache or the function execution.
+            """
+            key = _make_key(args[1:] if skip_instance else args, kwargs)
+            logger.info("Async cache decorator called with key: %r", key)
+
+            result = cache.get(key, missing)
+            if result is not missing:
+                logger.info("Cache hit for key: %r", key)
+                return result
+
+            logger.info("Cache miss for key: %r. Awaiting the function.", key)
+            return await in_flight.do(key, lambda: load(key, args, kwargs))
+
+        wrapper.cache = cache
+        wrapper.in_flight = in_flight
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
 
 
 class Model:
@@ -57,7 +286,67 @@ class Model:
         :param text: The input text for which the prediction is to be made.
         :return: A simulated prediction result.
         """
-        logger.info(f"Model received input for prediction: {text}")
+        logger.info("Model received input for prediction: %s", text)
+        return f"Prediction for {text}"
+
+
+def prediction_store() -> MmapStore:
+    """
+    Opens the store of PersistentModel's predictions. It is passed to cache_decorator as a function,
+    so the file is only created when the first prediction misses the memory cache, not on import.
+    
+    :return: The store at cache/predictions.mmap.
+    """
+    return MmapStore("cache/predictions.mmap")
+
+
+class PersistentModel:
+    """
+    Example Model class whose cached predictions persist across restarts.
+    """
+    @cache_decorator(store=prediction_store, ttl=24 * 3600)
+    def predict(self, text: str) -> str:
+        """
+        Simulates making a prediction based on the input text.
+        
+        :param text: The input text for which the prediction is to be made.
+        :return: A simulated prediction result.
+        """
+        logger.info("PersistentModel received input for prediction: %s", text)
+        return f"Prediction for {text}"
+
+
+class PromptModel:
+    """
+    Example Model class whose cache treats prompts that differ only in case or whitespace as equal,
+    and keys long prompts by a digest instead of the full text.
+    """
+    @cache_decorator(key_func=digest_long_text(max_length=256, normalize=True))
+    def predict(self, text: str) -> str:
+        """
+        Simulates making a prediction based on the input text.
+        
+        :param text: The input text for which the prediction is to be made.
+        :return: A simulated prediction result.
+        """
+        logger.info("PromptModel received input for prediction: %s", text)
+        return f"Prediction for {text}"
+
+
+class AsyncModel:
+    """
+    Example coroutine-based Model class whose predictions are cached with async_cache.
+    """
+    @async_cache(max_entries=1000, ttl=3600)
+    async def predict(self, text: str) -> str:
+        """
+        Simulates awaiting a prediction from a remote service.
+        
+        :param text: The input text for which the prediction is to be made.
+        :return: A simulated prediction result.
+        """
+        logger.info("AsyncModel received input for prediction: %s", text)
+        await asyncio.sleep(0.1)
         return f"Prediction for {text}"
 
 
@@ -66,8 +355,27 @@ if __name__ == "__main__":
 
     # Cache miss
     response1 = model.predict("Some input text")
-    logger.info(f"First response: {response1}")  # Output: Prediction for Some input text
+    logger.info("First response: %s", response1)  # Output: Prediction for Some input text
 
     # Cache hit
     response2 = model.predict("Some input text")
-    logger.info(f"Second response: {response2}")  # Output: Prediction for Some input text
+    logger.info("Second response: %s", response2)  # Output: Prediction for Some input text
+
+    # The cache is shared across instances and keyed by the normalized prompt
+    PromptModel().predict("Some input text")
+    response4 = PromptModel().predict("  some INPUT   text ")
+    logger.info("Normalized response: %s", response4)  # Served from the cache
+
+    # Run the example twice: the second run is served from the disk tier without calling the model
+    persistent_model = PersistentModel()
+    response3 = persistent_model.predict("Some input text")
+    logger.info("Persistent response: %s", response3)
+
+    # Concurrent awaits share one in-flight call; later awaits are cache hits
+    async def serve() -> None:
+        async_model = AsyncModel()
+        responses = await asyncio.gather(*(async_model.predict("Some input text") for _ in range(5)))
+        logger.info("Async responses: %s", responses)
+        logger.info("Async cache stats: %s", AsyncModel.predict.cache.stats)
+
+    asyncio.run(serve())
@@ -1,4 +1,5 @@
 from src.config.logging import logger
+from src.config.tracing import traced
 from abc import abstractmethod
 from typing import Optional
 from abc import ABC
@@ -39,8 +40,9 @@ class Workflow(Mediator):
         self.evaluation_agent.set_mediator(self)
         logger.info("Workflow initialized and agents registered.")
 
+    @traced("mediator")
     def notify(self, sender: 'BaseAgent', event: str) -> None:
-        logger.info(f"Notification received from {sender.__class__.__name__} with event: {event}")
+        logger.info("Notification received from %s with event: %s", sender.__class__.__name__, event)
         
         if event == "data_ready":
             logger.info("Data ready event triggered. Passing data to InferenceAgent.")
@@ -62,7 +64,7 @@ class BaseAgent:
 
     def set_mediator(self, mediator: Mediator) -> None:
         self._mediator = mediator
-        logger.info(f"{self.__class__.__name__} mediator set.")
+        logger.info("%s mediator set.", self.__class__.__name__)
 
 
 class DataAgent(BaseAgent):
@@ -73,7 +75,7 @@ class DataAgent(BaseAgent):
     def process(self) -> None:
         logger.info("DataAgent processing started.")
         self._data = self.load_data()
-        logger.info(f"Data loaded successfully: {self._data}")
+        logger.info("Data loaded successfully: %s", self._data)
         self._mediator.notify(self, "data_ready")
 
     def load_data(self) -> str:
@@ -90,9 +92,9 @@ class InferenceAgent(BaseAgent):
         self._results = None
 
     def process_data(self, data: str) -> None:
-        logger.info(f"InferenceAgent processing data: {data}")
+        logger.info("InferenceAgent processing data: %s", data)
         self._results = self.run_inference(data)
-        logger.info(f"Inference completed with results: {self._results}")
+        logger.info("Inference completed with results: %s", self._results)
         self._mediator.notify(self, "inference_done")
 
     def run_inference(self, data: str) -> str:
@@ -108,8 +110,8 @@ class EvaluationAgent(BaseAgent):
     The EvaluationAgent evaluates the results produced by InferenceAgent.
     """
     def evaluate(self, results: str) -> None:
-        logger.info(f"EvaluationAgent evaluating results: {results}")
-        logger.info(f"Evaluation complete: {results}")
+        logger.info("EvaluationAgent evaluating results: %s", results)
+        logger.info("Evaluation complete: %s", results)
 
 
 # Usage
@@ -1,4 +1,5 @@
 from src.config.logging import logger
+from src.config.tracing import traced
 from abc import abstractmethod
 from typing import Optional
 from abc import ABC
@@ -51,8 +52,9 @@ class Workflow(Mediator):
         self.evaluation_agent.set_mediator(self)
         logger.info("Workflow initialized and agents registered.")
 
+    @traced("mediator")
     def notify(self, sender: 'BaseAgent', event: str, data: Optional[str] = None) -> None:
-        logger.info(f"Notification received from {sender.__class__.__name__} with event: {event}")
+        logger.info("Notification received from %s with event: %s", sender.__class__.__name__, event)
         
         if event == "data_ready":
             logger.info("Data ready event triggered. Passing data to InferenceAgent.")
@@ -63,7 +65,7 @@ class Workflow(Mediator):
             self.evaluation_agent.evaluate(data or sender.get_results())
     
     def send_message(self, sender: 'BaseAgent', receiver: 'BaseAgent', message: str) -> None:
-        logger.info(f"{sender.__class__.__name__} is sending a message to {receiver.__class__.__name__}: {message}")
+        logger.info("%s is sending a message to %s: %s", sender.__class__.__name__, receiver.__class__.__name__, message)
         receiver.receive_message(message)
 
 
@@ -78,7 +80,7 @@ class BaseAgent(ABC):
 
     def set_mediator(self, mediator: Mediator) -> None:
         self._mediator = mediator
-        logger.info(f"{self.__class__.__name__} mediator set.")
+        logger.info("%s mediator set.", self.__class__.__name__)
 
     @abstractmethod
     def receive_message(self, message: str) -> None:
@@ -106,12 +108,12 @@ class DataAgent(BaseAgent):
         return self.load_data()
 
     def receive_message(self, message: str) -> None:
-        logger.info(f"DataAgent received message: {message}")
+        logger.info("DataAgent received message: %s", message)
 
 
 class InferenceAgent(BaseAgent):
     def process_data(self, data: str) -> None:
-        logger.info(f"InferenceAgent processing data: {data}")
+        logger.info("InferenceAgent processing data: %s", data)
         results = self.run_inference(data)
         logger.info("Inference completed.")
         self._mediator.notify(self, "inference_done", results)
@@ -124,7 +126,7 @@ class InferenceAgent(BaseAgent):
         return self.run_inference("processed_data")
 
     def receive_message(self, message: str) -> None:
-        logger.info(f"InferenceAgent received message: {message}")
+        logger.info("InferenceAgent received message: %s", message)
         # Optionally, trigger a specific action based on the message
         if message == "request_data":
             self._mediator.send_message(self, self._mediator.data_agent, "data_requested")
@@ -135,13 +137,13 @@ class EvaluationAgent(BaseAgent):
     The EvaluationAgent evaluates the results produced by InferenceAgent.
     """
     def evaluate(self, results: str) -> None:
-        logger.info(f"EvaluationAgent evaluating results: {results}")
+        logger.info("EvaluationAgent evaluating results: %s", results)
         print(f"Evaluating: {results}")
         # Example of sending a message to another agent
         self._mediator.send_message(self, self._mediator.inference_agent, "request_data")
 
     def receive_message(self, message: str) -> None:
-        logger.info(f"EvaluationAgent received message: {message}")
+        logger.info("EvaluationAgent received message: %s", message)
 
 
 # Usage
@@ -12,14 +12,14 @@ class EvaluationHandler(ABC):
 
     def __init__(self, successor: Optional['EvaluationHandler'] = None) -> None:
         self.successor = successor
-        logger.info(f"{self.__class__.__name__} initialized with successor: {self.successor.__class__.__name__ if self.successor else 'None'}")
+        logger.info("%s initialized with successor: %s", self.__class__.__name__, self.successor.__class__.__name__ if self.successor else 'None')
 
     @abstractmethod
     def evaluate(self, model: Any, data: Any) -> Optional[float]:
         if self.successor:
-            logger.info(f"Passing control to successor: {self.successor.__class__.__name__}")
+            logger.info("Passing control to successor: %s", self.successor.__class__.__name__)
             return self.successor.evaluate(model, data)
-        logger.info(f"No successor found. Ending evaluation in {self.__class__.__name__}")
+        logger.info("No successor found. Ending evaluation in %s", self.__class__.__name__)
         return None
 
 
@@ -31,11 +31,11 @@ class AccuracyHandler(EvaluationHandler):
     def evaluate(self, model: Any, data: Any) -> Optional[float]:
         logger.info("Evaluating accuracy...")
         accuracy = self.calculate_accuracy(model, data)
-        logger.info(f"Accuracy calculated: {accuracy:.2f}")
+        logger.info("Accuracy calculated: %.2f", accuracy)
         if accuracy < 0.7:
-            logger.warning(f"Accuracy {accuracy:.2f} is below threshold (0.7). Stopping evaluation.")
+            logger.warning("Accuracy %.2f is below threshold (0.7). Stopping evaluation.", accuracy)
             return None
-        logger.info(f"Accuracy {accuracy:.2f} is above threshold. Continuing evaluation.")
+        logger.info("Accuracy %.2f is above threshold. Continuing evaluation.", accuracy)
         return super().evaluate(model, data)
 
     def calculate_accuracy(self, model: Any, data: Any) -> float:
@@ -52,7 +52,7 @@ class F1ScoreHandler(EvaluationHandler):
     def evaluate(self, model: Any, data: Any) -> Optional[float]:
         logger.info("Evaluating F1 score...")
         f1_score = self.calculate_f1_score(model, data)
-        logger.info(f"F1 Score calculated: {f1_score:.2f}")
+        logger.info("F1 Score calculated: %.2f", f1_score)
         return super().evaluate(model, data)
 
     def calculate_f1_score(self, model: Any, data: Any) -> float:
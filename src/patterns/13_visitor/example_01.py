@@ -18,7 +18,7 @@ class ClassificationModel(Model):
     It accepts visitors that perform operations like model explanation.
     """
     def accept(self, visitor: 'Visitor') -> None:
-        logger.info(f'{self.__class__.__name__}: Accepting visitor {visitor.__class__.__name__}')
+        logger.info('%s: Accepting visitor %s', self.__class__.__name__, visitor.__class__.__name__)
         visitor.visit_classification_model(self)
 
 
@@ -38,7 +38,7 @@ class SHAPVisitor(Visitor):
     of a classification model.
     """
     def visit_classification_model(self, model: ClassificationModel) -> None:
-        logger.info(f'{self.__class__.__name__}: Visiting {model.__class__.__name__}')
+        logger.info('%s: Visiting %s', self.__class__.__name__, model.__class__.__name__)
         logger.info('Applying SHAP to explain model predictions')
         # Add SHAP-specific implementation here
         self.apply_shap(model)
@@ -54,7 +54,7 @@ class LIMEVisitor(Visitor):
     the predictions of a classification model.
     """
     def visit_classification_model(self, model: ClassificationModel) -> None:
-        logger.info(f'{self.__class__.__name__}: Visiting {model.__class__.__name__}')
+        logger.info('%s: Visiting %s', self.__class__.__name__, model.__class__.__name__)
         logger.info('Applying LIME to explain model predictions')
         # Add LIME-specific implementation here
         self.apply_lime(model)
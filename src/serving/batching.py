@@ -0,0 +1,193 @@
+from src.config.logging import logger
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
+from typing import Tuple
+from typing import List
+from typing import Any
+import threading
+import asyncio
+import queue
+import time
+
+
+_STOP = object()
+
+
+@dataclass
+class BatchingStats:
+    """
+    Counters describing how requests were grouped into batches.
+    """
+    requests: int = 0
+    batches: int = 0
+    full_batches: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """
+        Returns the average number of requests per flushed batch.
+        """
+        return self.requests / self.batches if self.batches else 0.0
+
+
+class MicroBatcher:
+    """
+    Groups single predict calls from many threads or coroutines into predict_batch calls.
+
+    Requests are queued and a background thread flushes them as one batch once max_batch_size
+    requests are waiting or the oldest request has waited max_wait_ms, whichever comes first.
+    Every caller receives the result at its own position in the batch.
+    """
+
+    def __init__(self, model: Any, max_batch_size: int = 32, max_wait_ms: float = 5.0, max_queue_size: int = 10_000) -> None:
+        """
+        Initializes the batcher and starts its worker thread.
+
+        Args:
+            model (Any): A model exposing predict_batch(texts), such as any BaseModel from ModelFactory.
+            max_batch_size (int): Maximum number of requests per batch.
+            max_wait_ms (float): Maximum time the oldest queued request waits for more requests.
+            max_queue_size (int): Maximum number of queued requests; submit blocks when it is reached.
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.stats = BatchingStats()
+        self._queue: 'queue.Queue[Any]' = queue.Queue(maxsize=max_queue_size)
+        self._closed = False
+        # Held while checking _closed and enqueueing, so no request can land behind the stop marker.
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    def __enter__(self) -> 'MicroBatcher':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def submit(self, text: str) -> 'Future[Any]':
+        """
+        Queues a request for the next batch.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            Future[Any]: Resolves to the prediction for this text.
+        """
+        future: 'Future[Any]' = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed.")
+            self._queue.put((text, future, time.monotonic()))
+        return future
+
+    def predict(self, text: str) -> Any:
+        """
+        Blocking single-item predict served from a batch.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            Any: The prediction result.
+        """
+        return self.submit(text).result()
+
+    async def predict_async(self, text: str) -> Any:
+        """
+        Awaitable single-item predict served from a batch. It never blocks the event loop: when
+        the queue is full, the request waits for space on the loop's default executor.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            Any: The prediction result.
+        """
+        future = self._try_submit(text)
+        if future is None:
+            # The queue is full (or a blocked submit holds the lock): wait for space on a worker
+            # thread, so the event loop keeps running.
+            future = await asyncio.get_running_loop().run_in_executor(None, self.submit, text)
+        return await asyncio.wrap_future(future)
+
+    def _try_submit(self, text: str) -> 'Optional[Future[Any]]':
+        # Non-blocking form of submit: returns None instead of waiting for the lock or for space.
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed.")
+            future: 'Future[Any]' = Future()
+            try:
+                self._queue.put_nowait((text, future, time.monotonic()))
+            except queue.Full:
+                return None
+            return future
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        """
+        Flushes the requests already queued and stops the worker thread.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join()
+
+    def _collect(self, first: Tuple[str, 'Future[Any]', float]) -> Tuple[List[Tuple[str, 'Future[Any]', float]], bool]:
+        batch = [first]
+        deadline = first[2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stopping = self._collect(item)
+            # Skip requests whose callers cancelled them while they were queued.
+            batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+            if batch:
+                self._flush(batch)
+
+        # Defensive: submit and close share a lock, so nothing should be queued behind the stop marker.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(RuntimeError("MicroBatcher is closed."))
+
+    def _flush(self, batch: List[Tuple[str, 'Future[Any]', float]]) -> None:
+        self.stats.requests += len(batch)
+        self.stats.batches += 1
+        self.stats.full_batches += len(batch) == self.max_batch_size
+        try:
+            results = self.model.predict_batch([text for text, _, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"predict_batch returned {len(results)} results for {len(batch)} inputs.")
+        except Exception as e:
+            logger.error("Batch of %s requests failed: %s", len(batch), e)
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
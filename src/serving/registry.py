@@ -0,0 +1,116 @@
+from src.config.logging import logger
+from typing import Optional
+from typing import Union
+from typing import Dict
+from typing import List
+from typing import Type
+from typing import Any
+import importlib
+import threading
+
+
+EntryPoint = Union[Type[Any], str]
+
+
+class ModelRegistry:
+    """
+    Registry mapping task types to model classes.
+
+    A task type is registered either with a class or with a lazy 'module:Class' entry point.
+    Entry points are only imported the first time their task type is resolved, so the heavy
+    dependencies of a model never slow down the import of the code that registers it.
+    Resolved classes are cached, making later lookups a single dictionary access.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, EntryPoint]] = None) -> None:
+        """
+        Initializes the registry.
+
+        Args:
+            entries (Optional[Dict[str, EntryPoint]]): Initial task types and their classes or entry points.
+        """
+        self._classes: Dict[str, Type[Any]] = {}
+        self._entry_points: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        for task_type, target in (entries or {}).items():
+            self.register(task_type, target)
+
+    def __contains__(self, task_type: str) -> bool:
+        return task_type in self._classes or task_type in self._entry_points
+
+    def task_types(self) -> List[str]:
+        """
+        Returns every registered task type.
+
+        Returns:
+            List[str]: The task types, loaded or not.
+        """
+        return sorted(set(self._classes) | set(self._entry_points))
+
+    def is_loaded(self, task_type: str) -> bool:
+        """
+        Tells whether the class of a task type has been imported.
+
+        Args:
+            task_type (str): The task type.
+
+        Returns:
+            bool: True once the class is available without importing anything.
+        """
+        return task_type in self._classes
+
+    def register(self, task_type: str, target: EntryPoint) -> None:
+        """
+        Registers (or replaces) the model of a task type.
+
+        Args:
+            task_type (str): The task type, e.g. 'classification'.
+            target (EntryPoint): The model class, or a 'package.module:ClassName' entry point.
+
+        Raises:
+            ValueError: If a string target is not of the form 'module:Class'.
+        """
+        with self._lock:
+            if isinstance(target, str):
+                module_name, _, class_name = target.partition(":")
+                if not module_name or not class_name:
+                    raise ValueError(f"Entry point must look like 'module:Class', got {target!r}")
+                self._classes.pop(task_type, None)
+                self._entry_points[task_type] = target
+            else:
+                self._entry_points.pop(task_type, None)
+                self._classes[task_type] = target
+
+    def resolve(self, task_type: str) -> Type[Any]:
+        """
+        Returns the model class of a task type, importing its entry point on first use.
+
+        Args:
+            task_type (str): The task type.
+
+        Returns:
+            Type[Any]: The model class.
+
+        Raises:
+            KeyError: If the task type is not registered.
+            ImportError: If the entry point's module cannot be imported.
+            AttributeError: If the entry point's module has no such class.
+        """
+        model_class = self._classes.get(task_type)
+        if model_class is not None:
+            return model_class
+
+        with self._lock:
+            model_class = self._classes.get(task_type)
+            if model_class is not None:
+                return model_class
+            entry_point = self._entry_points.get(task_type)
+            if entry_point is None:
+                raise KeyError(task_type)
+
+            module_name, _, class_name = entry_point.partition(":")
+            logger.info("Importing %s for task type: %s", entry_point, task_type)
+            model_class = getattr(importlib.import_module(module_name), class_name)
+            self._classes[task_type] = model_class
+            del self._entry_points[task_type]
+            return model_class
@@ -0,0 +1,232 @@
+from src.config.logging import logger
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.connection import Connection
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
+from typing import Callable
+from typing import Optional
+from typing import Dict
+from typing import List
+from typing import Any
+import multiprocessing
+import struct
+import queue
+import os
+
+_COUNT = struct.Struct("<I")
+
+
+def _encode_texts(texts: Sequence[Any], buf: memoryview) -> int:
+    """
+    Writes strings into a shared buffer as: count, count + 1 end offsets, UTF-8 payload.
+
+    Args:
+        texts (Sequence[Any]): The strings to write.
+        buf (memoryview): The shared memory buffer.
+
+    Returns:
+        int: The number of bytes written.
+
+    Raises:
+        TypeError: If an item is not a string.
+        ValueError: If the encoded texts do not fit into the buffer.
+    """
+    if not all(type(text) is str for text in texts):
+        raise TypeError("Only strings can be passed through shared memory.")
+    payload = [text.encode("utf-8") for text in texts]
+    offsets = [0] * (len(payload) + 1)
+    for i, data in enumerate(payload):
+        offsets[i + 1] = offsets[i] + len(data)
+    header = _COUNT.size + 4 * len(offsets)
+    total = header + offsets[-1]
+    if total > len(buf):
+        raise ValueError(f"{total} bytes do not fit into the {len(buf)} byte shared buffer.")
+    _COUNT.pack_into(buf, 0, len(payload))
+    struct.pack_into(f"<{len(offsets)}I", buf, _COUNT.size, *offsets)
+    buf[header:total] = b"".join(payload)
+    return total
+
+
+def _decode_texts(buf: memoryview) -> List[str]:
+    """
+    Reads strings written by _encode_texts.
+
+    Args:
+        buf (memoryview): The shared memory buffer.
+
+    Returns:
+        List[str]: The decoded strings.
+    """
+    (count,) = _COUNT.unpack_from(buf, 0)
+    offsets = struct.unpack_from(f"<{count + 1}I", buf, _COUNT.size)
+    base = _COUNT.size + 4 * (count + 1)
+    return [str(buf[base + offsets[i]:base + offsets[i + 1]], "utf-8") for i in range(count)]
+
+
+def _worker_main(
+    conn: Connection,
+    input_name: str,
+    output_name: str,
+    model_factory: Callable[..., Any],
+    factory_kwargs: Dict[str, Any],
+) -> None:
+    """
+    Entry point of a worker process: builds the model once, then serves batches until told to stop.
+    """
+    # Workers share the parent's resource tracker, which unregisters the segments when the parent unlinks them.
+    input_shm, output_shm = SharedMemory(name=input_name), SharedMemory(name=output_name)
+    try:
+        try:
+            model = model_factory(**factory_kwargs)
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+            return
+        conn.send(("ready", os.getpid()))
+        while True:
+            kind, payload = conn.recv()
+            if kind == "stop":
+                break
+            texts = _decode_texts(input_shm.buf) if kind == "shm" else payload
+            try:
+                results = model.predict_batch(texts)
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+                continue
+            try:
+                conn.send(("shm", _encode_texts(results, output_shm.buf)))
+            except (TypeError, ValueError):
+                conn.send(("pickle", list(results)))
+    finally:
+        input_shm.close()
+        output_shm.close()
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "input_shm", "output_shm")
+
+    def __init__(self, process: multiprocessing.Process, conn: Connection, input_shm: SharedMemory, output_shm: SharedMemory) -> None:
+        self.process = process
+        self.conn = conn
+        self.input_shm = input_shm
+        self.output_shm = output_shm
+
+
+class ProcessWorkerPool:
+    """
+    Pool of worker processes that each host their own copy of a model, bypassing the GIL.
+
+    Each worker builds the model once at startup. Batches of strings travel through a pair of
+    shared memory segments per worker (input and output), so only a tiny control message goes
+    through the pipe; batches that do not fit, or results that are not strings, fall back to pickling.
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[..., Any],
+        factory_kwargs: Optional[Dict[str, Any]] = None,
+        num_workers: Optional[int] = None,
+        buffer_bytes: int = 8 * 1024 ** 2,
+        min_chunk_size: int = 16,
+        start_method: Optional[str] = None,
+    ) -> None:
+        """
+        Starts the workers and waits until every one of them has built its model.
+
+        Args:
+            model_factory (Callable[..., Any]): Builds the model inside a worker, e.g. a model class.
+                It must be picklable when the 'spawn' start method is used.
+            factory_kwargs (Optional[Dict[str, Any]]): Keyword arguments for model_factory.
+            num_workers (Optional[int]): Number of worker processes; defaults to the CPU count.
+            buffer_bytes (int): Size of each shared memory segment.
+            min_chunk_size (int): Smallest number of texts sent to one worker when a batch is split.
+            start_method (Optional[str]): multiprocessing start method; defaults to the platform default.
+        """
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.min_chunk_size = min_chunk_size
+        context = multiprocessing.get_context(start_method)
+        self._workers: List[_Worker] = []
+        self._idle: 'queue.Queue[_Worker]' = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="process-pool-dispatch")
+
+        for _ in range(self.num_workers):
+            input_shm = SharedMemory(create=True, size=buffer_bytes)
+            output_shm = SharedMemory(create=True, size=buffer_bytes)
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_worker_main,
+                args=(child_conn, input_shm.name, output_shm.name, model_factory, factory_kwargs or {}),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append(_Worker(process, parent_conn, input_shm, output_shm))
+
+        for worker in self._workers:
+            kind, payload = worker.conn.recv()
+            if kind != "ready":
+                self.close()
+                raise RuntimeError(f"Model worker failed to start: {payload}")
+            logger.info("Model worker process %s is ready.", payload)
+            self._idle.put(worker)
+
+    def __enter__(self) -> 'ProcessWorkerPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _call(self, texts: Sequence[str]) -> List[Any]:
+        worker = self._idle.get()
+        try:
+            try:
+                worker.conn.send(("shm", _encode_texts(texts, worker.input_shm.buf)))
+            except (TypeError, ValueError):
+                worker.conn.send(("pickle", list(texts)))
+            kind, payload = worker.conn.recv()
+            if kind == "shm":
+                return _decode_texts(worker.output_shm.buf)
+            if kind == "pickle":
+                return payload
+            raise RuntimeError(f"Model worker failed: {payload}")
+        finally:
+            self._idle.put(worker)
+
+    def predict_batch(self, texts: Sequence[str]) -> List[Any]:
+        """
+        Predicts a batch, splitting it across the workers when it is large enough.
+
+        Args:
+            texts (Sequence[str]): The input texts.
+
+        Returns:
+            List[Any]: One result per input text, in input order.
+        """
+        chunks = min(self.num_workers, max(1, len(texts) // self.min_chunk_size))
+        if chunks == 1:
+            return self._call(texts)
+        size = -(-len(texts) // chunks)
+        futures = [self._executor.submit(self._call, texts[i:i + size]) for i in range(0, len(texts), size)]
+        results: List[Any] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def close(self) -> None:
+        """
+        Stops the workers and releases the shared memory.
+        """
+        self._executor.shutdown(wait=True)
+        for worker in self._workers:
+            try:
+                worker.conn.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+            for shm in (worker.input_shm, worker.output_shm):
+                shm.close()
+                shm.unlink()
+        self._workers = []